@@ -5,7 +5,7 @@ Load environment variables from the .env file and expose them as module-level co
 
 Features:
 - resolves absolute path to .env regardless of current working directory
-- logs source path for transparency
+- logs source path at debug level (no output on a plain import)
 - provides defaults ("failed_to_fetch") if variables are missing
 """
 
@@ -34,7 +34,7 @@ rel_path = (
     else env_path.name
 )
 
-logger.info(f"Loading environment variables from {rel_path}")
+logger.debug(f"Loading environment variables from {rel_path}")
 
 
 # Load environment
@@ -48,6 +48,13 @@ DB_PASSWORD = os.getenv("DB_PASSWORD", "failed_to_fetch")
 DB_HOST = os.getenv("DB_HOST", "failed_to_fetch")
 DB_HOST_PORT = int(os.getenv("DB_HOST_PORT", 0))
 
+# Database to connect to for CREATE/DROP DATABASE (src.db.snapshot)
+DB_MAINTENANCE_NAME = os.getenv("DB_MAINTENANCE_NAME", "postgres")
+
+# Connection pool sizing (src.db.connection)
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", 1))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", 16))
+
 
 # Container/VM configuration
 COLIMA_PROFILE = os.getenv("COLIMA_PROFILE", "failed_to_fetch")
@@ -0,0 +1,129 @@
+"""
+availability.py
+
+Accommodation availability queries on the range-typed bookings.stay column.
+
+Provides:
+- is_available(): is one accommodation free for a stay
+- check_availability(): batched is_available() in one round trip
+- available_accommodations(): all (or the given) accommodations free for a stay
+- conflicting_bookings(): the bookings that block a stay
+
+Stays are half-open [start, end), so a stay may begin on the day another
+ends. Cancelled bookings never block. Every check is answered by the GiST
+index of the bookings_no_overlap exclusion constraint
+(src/sql/04_booking_stay_range.sql), so its cost grows logarithmically with
+the number of bookings.
+"""
+# Stdlib imports
+from contextlib import nullcontext
+import datetime
+from pathlib import Path
+import sys
+from typing import List, Sequence, Tuple
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Internal imports
+from src.db.connection import pooled_connection
+import src.db.sql_repo as sqlrepo
+
+
+
+# Helpers
+def _checked_stay(start: datetime.datetime, end: datetime.datetime) -> Tuple:
+    """
+    Validate a stay; raises ValueError if it is empty or reversed.
+    """
+    if end <= start:
+        raise ValueError(f"Stay must end after it starts: [{start}, {end})")
+    return start, end
+
+
+def _checkout(conn):
+    """
+    Use conn if given, else a pooled connection.
+    """
+    return nullcontext(conn) if conn is not None else pooled_connection()
+
+
+
+# Queries
+def conflicting_bookings(
+    accommodation_id: int, start: datetime.datetime, end: datetime.datetime, conn=None
+) -> List[Tuple]:
+    """
+    Non-cancelled bookings of accommodation_id overlapping [start, end).
+
+    Returns:
+        list[tuple]: (booking_id, stay_start, stay_end, status) ordered by stay start.
+    """
+    start, end = _checked_stay(start, end)
+    with _checkout(conn) as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_CONFLICTING_BOOKINGS, (accommodation_id, start, end))
+        return cur.fetchall()
+
+
+def is_available(
+    accommodation_id: int, start: datetime.datetime, end: datetime.datetime, conn=None
+) -> bool:
+    """
+    True if accommodation_id has no non-cancelled booking overlapping [start, end).
+    """
+    return check_availability([(accommodation_id, start, end)], conn=conn)[0]
+
+
+def check_availability(
+    requests: Sequence[Tuple[int, datetime.datetime, datetime.datetime]], conn=None
+) -> List[bool]:
+    """
+    Answer many availability checks with one query.
+
+    Args:
+        requests: (accommodation_id, start, end) per check.
+        conn: connection to query on; a pooled connection is checked out if None.
+
+    Returns:
+        list[bool]: availability per request, in input order.
+    """
+    if not requests:
+        return []
+
+    accommodation_ids, starts, ends = [], [], []
+    for accommodation_id, start, end in requests:
+        start, end = _checked_stay(start, end)
+        accommodation_ids.append(accommodation_id)
+        starts.append(start)
+        ends.append(end)
+
+    with _checkout(conn) as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.CHECK_AVAILABILITY_BATCH, (accommodation_ids, starts, ends))
+        return [row[0] for row in cur.fetchall()]
+
+
+def available_accommodations(
+    start: datetime.datetime,
+    end: datetime.datetime,
+    accommodation_ids: Sequence[int] = None,
+    conn=None,
+) -> List[int]:
+    """
+    Active accommodations with no non-cancelled booking overlapping [start, end).
+
+    Args:
+        accommodation_ids: restrict the search to these ids; all if None.
+
+    Returns:
+        list[int]: available accommodation ids, ascending.
+    """
+    start, end = _checked_stay(start, end)
+    params = {
+        "start": start,
+        "end": end,
+        "ids": list(accommodation_ids) if accommodation_ids is not None else None,
+    }
+    with _checkout(conn) as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_AVAILABLE_ACCOMMODATIONS, params)
+        return [row[0] for row in cur.fetchall()]
@@ -0,0 +1,352 @@
+"""
+bulk_load.py
+
+Opt-in bulk-load mode: load without secondary indexes and foreign keys,
+then rebuild them.
+
+Provides:
+- capture_secondary_objects(): catalog definitions of non-PK indexes and FKs
+- drop_secondary_objects(): drop them before the load
+- rebuild_secondary_objects(): rebuild indexes in parallel, re-attach UNIQUE
+  constraints, re-add EXCLUDE constraints, add FKs back NOT VALID and
+  VALIDATE them; returns timings
+- secondary_objects_deferred(): context manager wrapping a load in the above
+- restore_pending_objects(): rebuild the objects of an interrupted or
+  failed bulk load
+- format_rebuild_report(): timing table for the log
+
+Index builds run on a thread pool (one pooled connection each) with
+max_parallel_maintenance_workers raised per build. The indexes of one
+table are built by a single job, one after another: CREATE INDEX holds a
+SHARE lock until commit and attaching a constraint needs ACCESS EXCLUSIVE,
+so two concurrent jobs on the same table can deadlock. Definitions come
+from pg_get_indexdef()/pg_get_constraintdef(), so rebuilt objects match
+the originals, including names.
+
+The captured definitions are written to PENDING_DIR before anything is
+dropped and removed only after a complete rebuild, so a crash or a failed
+rebuild never loses them; the next bulk load (or restore_pending_objects())
+rebuilds from that file.
+"""
+# Stdlib imports
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Third-party imports
+import psycopg2
+from psycopg2 import sql
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Internal imports
+from src import config
+from src.db.connection import pooled_connection
+import src.db.data_lists as seeds
+import src.db.sql_repo as sqlrepo
+from src.utils.logger import logger
+
+
+
+# Definitions of dropped objects, kept until they are rebuilt
+PENDING_DIR = PROJECT_ROOT / ".cache" / "bulk_load"
+
+
+
+# Catalog snapshot
+def capture_secondary_objects(tables: Sequence[str]) -> Dict[str, List[Tuple]]:
+    """
+    Read the definitions of all non-PK indexes and foreign keys on tables.
+
+    Returns:
+        dict: "indexes" → [(table, index, index_def, constraint_or_None,
+                             constraint_type_or_None, constraint_def_or_None)],
+              "foreign_keys" → [(table, constraint, constraint_def, partitioned)]
+    """
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_SECONDARY_INDEXES, (list(tables),))
+        indexes = cur.fetchall()
+        cur.execute(sqlrepo.FETCH_FOREIGN_KEYS, (list(tables),))
+        foreign_keys = cur.fetchall()
+    return {"indexes": indexes, "foreign_keys": foreign_keys}
+
+
+def _pending_path() -> Path:
+    return PENDING_DIR / f"{config.DB_NAME}-pending.json"
+
+
+def save_pending_objects(objects: Dict[str, List[Tuple]]):
+    """
+    Persist captured definitions until rebuild_secondary_objects() has succeeded.
+    """
+    path = _pending_path()
+    # Write-then-rename so a crash never leaves a partial file
+    PENDING_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(objects, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_pending_objects() -> Optional[Dict[str, List[Tuple]]]:
+    """
+    Definitions left by an interrupted or failed bulk load, or None.
+    """
+    path = _pending_path()
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        objects = json.load(f)
+    return {kind: [tuple(row) for row in rows] for kind, rows in objects.items()}
+
+
+def clear_pending_objects():
+    """
+    Forget pending definitions once they have been rebuilt.
+    """
+    _pending_path().unlink(missing_ok=True)
+
+
+def drop_secondary_objects(objects: Dict[str, List[Tuple]]):
+    """
+    Drop the captured FKs, UNIQUE/EXCLUDE constraints and plain indexes in one transaction.
+    """
+    with pooled_connection() as conn, conn.cursor() as cur:
+        for table, name, _, _ in objects["foreign_keys"]:
+            cur.execute(sql.SQL(sqlrepo.DROP_CONSTRAINT).format(
+                tbl=sql.Identifier(table), name=sql.Identifier(name)
+            ))
+        for table, index, _, constraint, _, _ in objects["indexes"]:
+            if constraint is not None:
+                cur.execute(sql.SQL(sqlrepo.DROP_CONSTRAINT).format(
+                    tbl=sql.Identifier(table), name=sql.Identifier(constraint)
+                ))
+            else:
+                cur.execute(sql.SQL(sqlrepo.DROP_INDEX).format(sql.Identifier(index)))
+
+    logger.info(
+        f"Bulk-load mode: dropped {len(objects['indexes'])} secondary indexes "
+        f"and {len(objects['foreign_keys'])} foreign keys"
+    )
+
+
+
+# Rebuild
+def _build_index(
+    table: str, index: str, index_def: str, constraint, constraint_type, constraint_def
+) -> Tuple[str, str, float]:
+    """
+    Build one index (and re-attach its UNIQUE constraint) in its own
+    transaction. EXCLUDE constraints are re-added as a whole, which builds
+    their index.
+    """
+    started = time.perf_counter()
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            sqlrepo.INDEX_BUILD_SESSION,
+            (
+                str(seeds.bulk_load_parallel_maintenance_workers),
+                seeds.bulk_load_maintenance_work_mem,
+            ),
+        )
+        if constraint_type == "x":
+            cur.execute(sql.SQL(sqlrepo.ADD_CONSTRAINT).format(
+                tbl=sql.Identifier(table),
+                name=sql.Identifier(constraint),
+                definition=sql.SQL(constraint_def),
+            ))
+        else:
+            cur.execute(index_def)
+        if constraint_type == "u":
+            cur.execute(sql.SQL(sqlrepo.ADD_UNIQUE_USING_INDEX).format(
+                tbl=sql.Identifier(table),
+                name=sql.Identifier(constraint),
+                idx=sql.Identifier(index),
+            ))
+    action = {"u": "unique index", "x": "exclusion"}.get(constraint_type, "index")
+    return f"{table}.{index}", action, time.perf_counter() - started
+
+
+def _build_table_indexes(indexes: Sequence[Tuple]) -> Tuple[List[Tuple], List[Exception]]:
+    """
+    Build the indexes of one table one after another, so no two builds
+    contend for the table's locks. Every index is attempted even if an
+    earlier one fails.
+    """
+    results, errors = [], []
+    for index in indexes:
+        try:
+            results.append(_build_index(*index))
+        except psycopg2.Error as e:
+            logger.error(f"Bulk-load rebuild of {index[:2]} failed: {e}")
+            errors.append(e)
+    return results, errors
+
+
+def index_jobs_by_table(indexes: Sequence[Tuple]) -> List[List[Tuple]]:
+    """
+    Group captured index definitions into one job per table, in capture order.
+    """
+    jobs: Dict[str, List[Tuple]] = {}
+    for index in indexes:
+        jobs.setdefault(index[0], []).append(index)
+    return list(jobs.values())
+
+
+def _validate_foreign_key(table: str, name: str, definition: str, partitioned: bool) -> Tuple[str, str, float]:
+    """
+    VALIDATE one NOT VALID foreign key in its own transaction. FKs of
+    partitioned tables cannot be NOT VALID and are added (validated) here.
+    """
+    started = time.perf_counter()
+    with pooled_connection() as conn, conn.cursor() as cur:
+        if partitioned:
+            cur.execute(sql.SQL(sqlrepo.ADD_CONSTRAINT).format(
+                tbl=sql.Identifier(table),
+                name=sql.Identifier(name),
+                definition=sql.SQL(definition),
+            ))
+        else:
+            cur.execute(sql.SQL(sqlrepo.VALIDATE_CONSTRAINT).format(
+                tbl=sql.Identifier(table), name=sql.Identifier(name)
+            ))
+    action = "add fk" if partitioned else "validate fk"
+    return f"{table}.{name}", action, time.perf_counter() - started
+
+
+def _run_all(pool: ThreadPoolExecutor, fn, jobs) -> Tuple[List[Tuple], List[Exception]]:
+    """
+    Run fn over jobs on pool; collect results and failures instead of
+    stopping at the first one.
+    """
+    futures = [pool.submit(fn, *job) for job in jobs]
+    results, errors = [], []
+    for job, future in zip(jobs, futures):
+        try:
+            results.append(future.result())
+        except psycopg2.Error as e:
+            logger.error(f"Bulk-load rebuild of {job[:2]} failed: {e}")
+            errors.append(e)
+    return results, errors
+
+
+def rebuild_secondary_objects(objects: Dict[str, List[Tuple]], workers: int = 4) -> List[Tuple]:
+    """
+    Restore the captured indexes and foreign keys after a load.
+
+    1. Build indexes on `workers` connections in parallel, one job per
+       table (each build may use max_parallel_maintenance_workers),
+       re-attach their UNIQUE constraints and re-add EXCLUDE constraints
+       (checked on re-add).
+    2. Add all FKs back as NOT VALID (no table scan).
+    3. VALIDATE the FKs in parallel; FKs of partitioned tables, which
+       cannot be NOT VALID, are added validated in this step.
+
+    Every object is attempted even if another fails; failures are raised
+    together at the end.
+
+    Returns:
+        list[tuple[str, str, float]]: (object, action, seconds) per step.
+    """
+    report = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_build_table_indexes, job)
+            for job in index_jobs_by_table(objects["indexes"])
+        ]
+        for future in futures:
+            results, failed = future.result()
+            report += results
+            errors += failed
+
+        started = time.perf_counter()
+        with pooled_connection() as conn, conn.cursor() as cur:
+            for table, name, definition, partitioned in objects["foreign_keys"]:
+                if partitioned:
+                    continue
+                cur.execute(sql.SQL(sqlrepo.ADD_CONSTRAINT_NOT_VALID).format(
+                    tbl=sql.Identifier(table),
+                    name=sql.Identifier(name),
+                    definition=sql.SQL(definition),
+                ))
+        report.append(("foreign keys", "add not valid", time.perf_counter() - started))
+
+        results, failed = _run_all(pool, _validate_foreign_key, objects["foreign_keys"])
+        report += results
+        errors += failed
+
+    if errors:
+        raise RuntimeError(
+            f"Bulk-load rebuild failed for {len(errors)} object(s); definitions are kept "
+            f"in {_pending_path()} for restore_pending_objects() or the next bulk load"
+        ) from errors[0]
+    return report
+
+
+def format_rebuild_report(report: List[Tuple]) -> str:
+    """
+    Render (object, action, seconds) rows as an aligned text table with a total.
+    """
+    width = max([len(name) for name, _, _ in report] + [len("total")])
+    lines = [f"{name:<{width}}  {action:<14} {seconds:8.2f}s" for name, action, seconds in report]
+    lines.append(f"{'total':<{width}}  {'':<14} {sum(s for _, _, s in report):8.2f}s")
+    return "Bulk-load rebuild report:\n" + "\n".join(lines)
+
+
+
+# Load wrapper
+@contextmanager
+def secondary_objects_deferred(tables: Sequence[str], workers: int = 4):
+    """
+    Drop secondary indexes and FKs of tables for the duration of a with
+    block, then rebuild them (also if the block raises).
+
+    If an earlier bulk load left pending definitions, those are used
+    instead of the current catalog, which lacks the objects it dropped.
+    If the rebuild fails, the definitions stay pending for the next run.
+
+    Yields:
+        list: filled with the rebuild report once the block has finished.
+    """
+    objects = load_pending_objects()
+    if objects is None:
+        objects = capture_secondary_objects(tables)
+        save_pending_objects(objects)
+    else:
+        logger.warning(f"Bulk-load mode: reusing pending definitions from {_pending_path()}")
+    drop_secondary_objects(objects)
+    report = []
+    try:
+        yield report
+    finally:
+        report += rebuild_secondary_objects(objects, workers=workers)
+        clear_pending_objects()
+        logger.info(format_rebuild_report(report))
+
+
+def restore_pending_objects(workers: int = 4) -> List[Tuple]:
+    """
+    Rebuild the objects of an interrupted or failed bulk load without loading.
+
+    Objects that were already rebuilt are dropped and rebuilt again, so the
+    definitions can be applied as a whole.
+
+    Returns:
+        list[tuple[str, str, float]]: the rebuild report; empty if nothing is pending.
+    """
+    objects = load_pending_objects()
+    if objects is None:
+        return []
+    drop_secondary_objects(objects)
+    report = rebuild_secondary_objects(objects, workers=workers)
+    clear_pending_objects()
+    logger.info(format_rebuild_report(report))
+    return report
@@ -4,20 +4,32 @@ connection.py
 Database connection utilities for PostgreSQL.
 
 Provides:
-- db_connection(): returns a psycopg2 connection using src.config credentials
+- db_connection(): opens a new (unpooled) psycopg2 connection using src.config
+  credentials, optionally to another database on the same server
+- ConnectionPool: thread-safe pool with min/max size and health checks
+- get_pool(): the process-wide pool, created on first use
+- pooled_connection(): context manager that checks a connection out of the
+  process-wide pool and always returns it
+- close_pool(): close all pooled connections
 - check_connection(): verifies connectivity and logs result
 
 Assumptions:
-- src.config defines DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_HOST_PORT
+- src.config defines DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_HOST_PORT,
+  DB_POOL_MIN, DB_POOL_MAX
 - src.utils.logger is a configured logger
 """
 # Stdlib imports
+from contextlib import contextmanager
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Third-party imports
 import psycopg2
 from psycopg2 import OperationalError
+from psycopg2 import extensions
+from psycopg2.pool import ThreadedConnectionPool
 
 # Path/bootstrap
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -30,12 +42,12 @@ from src.utils.logger import logger
 
 
 # Connection factory
-def db_connection():
+def _connect_kwargs(dbname: str = None) -> dict:
     """
-    Return a psycopg2 connection using credentials from src.config.
+    psycopg2.connect() keyword arguments from src.config.
     """
-    return psycopg2.connect(
-        dbname=config.DB_NAME,
+    return dict(
+        dbname=dbname or config.DB_NAME,
         user=config.DB_USER,
         password=config.DB_PASSWORD,
         host=config.DB_HOST,
@@ -43,6 +55,154 @@ def db_connection():
     )
 
 
+def db_connection(dbname: str = None):
+    """
+    Return a new psycopg2 connection using credentials from src.config.
+
+    Args:
+        dbname (str): database to connect to; config.DB_NAME if None.
+
+    The caller owns (and must close) the connection; prefer
+    pooled_connection() for regular work.
+    """
+    return psycopg2.connect(**_connect_kwargs(dbname))
+
+
+
+# Connection pool
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections.
+
+    Checkouts block while maxconn connections are in use instead of failing.
+    A connection idle for longer than health_check_after seconds is pinged
+    before it is handed out and replaced if it is broken. Returned
+    connections are rolled back if a transaction is still open.
+    """
+
+    def __init__(self, minconn: int = 1, maxconn: int = 16, health_check_after: float = 30.0):
+        self._pool = ThreadedConnectionPool(minconn, maxconn, **_connect_kwargs())
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._last_used = {}
+        self._lock = threading.Lock()
+        self.health_check_after = health_check_after
+
+    @staticmethod
+    def _is_healthy(conn) -> bool:
+        """
+        True if conn answers SELECT 1.
+        """
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+                cur.fetchone()
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self):
+        """
+        Check out a healthy connection, waiting for a free slot if needed.
+        """
+        self._slots.acquire()
+        try:
+            while True:
+                conn = self._pool.getconn()
+                with self._lock:
+                    idle_since = self._last_used.pop(id(conn), None)
+                stale = (
+                    idle_since is not None
+                    and time.monotonic() - idle_since > self.health_check_after
+                )
+                if not conn.closed and (not stale or self._is_healthy(conn)):
+                    return conn
+                logger.warning("Discarding broken pooled connection")
+                self._pool.putconn(conn, close=True)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn):
+        """
+        Return conn to the pool; broken connections are closed instead.
+        """
+        try:
+            broken = bool(conn.closed)
+            if not broken and conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+            if not broken:
+                with self._lock:
+                    self._last_used[id(conn)] = time.monotonic()
+            self._pool.putconn(conn, close=broken)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """
+        Check out a connection for the duration of a with block.
+
+        Commits on normal exit, rolls back if the block raises; the
+        connection goes back to the pool either way.
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+            if not conn.closed:
+                conn.commit()
+        except BaseException:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self.putconn(conn)
+
+    def closeall(self):
+        """
+        Close every connection held by the pool.
+        """
+        self._pool.closeall()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Return the process-wide pool, creating it on first use.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(config.DB_POOL_MIN, config.DB_POOL_MAX)
+        return _pool
+
+
+@contextmanager
+def pooled_connection():
+    """
+    Check out a connection from the process-wide pool (see ConnectionPool.connection).
+    """
+    with get_pool().connection() as conn:
+        yield conn
+
+
+def close_pool():
+    """
+    Close the process-wide pool; the next checkout creates a new one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
 
 # Connection test
 def check_connection() -> bool:
@@ -53,20 +213,15 @@ def check_connection() -> bool:
         True  – if database responds correctly
         False – if connection or query fails
     """
-    conn = None
     try:
-        conn = db_connection()
-        with conn.cursor() as cur:
-            cur.execute("SELECT 1;")
-            result = cur.fetchone()
-            assert result == (1,), "Unexpected DB response"
+        with pooled_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+                result = cur.fetchone()
+                assert result == (1,), "Unexpected DB response"
         logger.info("Database connection OK.")
         return True
 
     except (AssertionError, OperationalError, psycopg2.Error) as e:
         logger.error(f"Database connection failed: {e}")
         return False
-
-    finally:
-        if conn is not None:
-            conn.close()
\ No newline at end of file
@@ -5,6 +5,7 @@ Central seed/config module for dummy data generation.
 
 Provides:
 - global meta settings (row count, admin count, time window, password length)
+- dataset scale factor with per-table cardinality ratios and fan-out ranges
 - address/geography seed data (cities, streets, countries, address terms)
 - person/account seed data (first/last name syllables, email domains)
 - accommodation name generator words
@@ -15,10 +16,30 @@ Provides:
 
 # META / GLOBAL SETTINGS
 import datetime
+import os
 
-# number of entries to create per table
+# number of entries to create per table at scale factor 1
 num_gen_dummydata = 40
 
+# dataset scale factor (TPC-style SF1/SF10/SF100); override via SEED_SCALE_FACTOR
+scale_factor = float(os.getenv("SEED_SCALE_FACTOR", 1))
+
+# master seed; the same seed reproduces the same dataset; override via SEED_MASTER_SEED
+master_seed = int(os.getenv("SEED_MASTER_SEED", 0))
+
+# post-insert verification per table: "count", "minmax", "sample" or "off"
+verify_mode = os.getenv("SEED_VERIFY_MODE", "count")
+
+# rows shown by verify_mode "sample"
+verify_sample_rows = 5
+
+# session memory settings for single-transaction seed runs
+bulk_load_work_mem = "256MB"
+bulk_load_maintenance_work_mem = "1GB"
+
+# parallel workers per index build in bulk-load mode (max_parallel_maintenance_workers)
+bulk_load_parallel_maintenance_workers = 4
+
 # number of admin accounts to reserve
 admin_count = 3
 
@@ -29,6 +50,40 @@ stop_timestamp = datetime.datetime(2025, 12, 31)
 # length of generated password strings
 pwd_hash_length = 32
 
+
+# CARDINALITY MODEL
+# root-table row counts relative to num_gen_dummydata * scale_factor
+table_ratios = {
+    "accounts": 1.0,
+    "addresses": 1.0,
+    "accommodations": 1.0,
+    "images": 4.0,
+    "reviews": 2.0,
+    "conversations": 1.0,
+    "notifications": 1.0,
+}
+
+# child rows per parent row as inclusive (min, max) ranges, drawn uniformly
+fan_out = {
+    "payment_methods_per_account": (1, 3),
+    "bookings_per_accommodation": (0, 1),
+    "messages_per_conversation": (1, 10),
+    "images_per_review": (1, 3),
+    "images_per_accommodation": (2, 5),
+    "amenities_per_accommodation": (2, 3),
+}
+
+# longest stay per booking (nights) and rows per payments/bookings batch
+max_booking_nights = 14
+booking_batch_size = 50_000
+
+# share of reviews that get images / hosts that get a second payout account
+review_image_share = 0.5
+extra_payout_account_share = 1 / 3
+
+# share of hosts that take part in conversations
+conversation_host_share = 0.7
+
 """
 Target schema reminder (for mapping seeds → tables):
 
@@ -40,7 +95,7 @@ images(id, mime, storage_key, created_at)
 accommodation_images(accommodation_id, image_id, sort_order, is_cover, caption, room_tag)
 accommodation_calendar(accommodation_id, day, is_blocked, price_cents, min_nights)
 payments(id, customer_id, amount_cents, status, payment_method_id)
-bookings(id, guest_account_id, accommodation_id, start_date, end_date, payment_id, status, created_at)
+bookings(id, guest_account_id, accommodation_id, start_date, end_date, payment_id, status, created_at, stay)
 reviews(id, accommodation_id, author_account_id, rating, description, created_at)
 review_images(review_id, image_id)
 conversations(id, created_at)
@@ -311,6 +366,10 @@ image_mimes = [
 # how many days ahead to generate calendar entries
 calendar_look_ahead = 365
 
+# inclusive ranges for per-day price additions (cents) and minimum nights
+calendar_price_addition_range = (-500, 500)
+calendar_min_nights_range = (2, 7)
+
 
 # CREDIT CARD BRANDS
 card_brands = [
@@ -602,4 +661,12 @@ currencies = [
     "INR",
     "KRW",
     "SGD"
-]
\ No newline at end of file
+]
+
+# payout lifecycle states
+payout_statuses = [
+    "pending",
+    "confirmed",
+    "cancelled",
+    "completed",
+]
@@ -1,33 +1,43 @@
 """
-dummy_data_generator.py
+gen_seed_data.py
 
 Generate generic, schema-aligned dummy data for seeding the database.
 
-Provides generators for:
-- accounts
-- credentials
-- addresses
-- accommodations
-- images
-- (stubs) calendar, payments, bookings, reviews, conversations, messages, payouts
+Provides one gen_dummydata_<name>() generator per seed table (run in
+dependency order by src.db.seed_scheduler):
+- accounts, credentials, addresses, accommodations, accommodation_amenities
+- images, accommodation_images, reviews, review_images
+- payment_methods, credit_cards, paypal
+- bookings_and_payments: bookings and their payments, set-based in batches
+- payout_accounts, payouts (one INSERT ... SELECT over the bookings)
+- accommodation_calendar (one generate_series INSERT per monthly partition)
+- conversations, messages, notifications
 
 Assumptions:
 - seed parameters and word lists live in src.db.data_lists as `seeds`
 - timestamps are generated in a uniform window [start_timestamp, stop_timestamp]
-- number of rows is controlled by seeds.num_gen_dummydata
+- number of rows is controlled by seeds.num_gen_dummydata * seeds.scale_factor,
+  with per-table ratios and fan-out ranges from src.db.data_lists
+- rows are written via COPY; pass use_copy=False to fall back to the
+  INSERT templates in src.db.sql_repo
+- messages, notifications and the calendar go straight into their monthly
+  partitions (src.db.partitions)
+- random values are drawn column-wise through src.db.sampling.BatchSampler
+  (NumPy), not per row, from per-table streams of seeds.master_seed; the same
+  seed yields the same dataset for any number of scheduler workers
 """
 # Stdlib imports
-from random import choice, choices, randint, shuffle, sample
+from contextlib import contextmanager
 import datetime
 from pathlib import Path
 import sys
 from psycopg2 import sql
-from typing import List
+from typing import Iterable, List, Sequence
 import string
 import json
 
 # Third-party / extra imports
-import rstr
+import numpy as np
 
 # Path/bootstrap
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -35,19 +45,125 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # Internal imports
 import src.db.data_lists as seeds
-from src.db.connection import db_connection  
+from src.db.connection import pooled_connection
+from src.db.partitions import ensure_partitions, month_ranges, partition_name, write_partitioned
 import src.db.sql_repo as sqlrepo
-from src.db.utils.db_helpers import get_tbl_contents_as_str, get_tbl_contents_as_str_sorted_by
+from src.db.sampling import BatchSampler, stream_seed, to_datetimes
+from src.db.utils.bulk_copy import bulk_insert, insert_returning_ids
+from src.db.utils.db_helpers import summarize_table
+from src.db.world_model import WorldModel
 from src.utils.logger import logger
 
 
 
+# Truncate each table inside its generator; the scheduler disables this
+# after clearing all seed tables up front in one statement.
+truncate_before_insert = True
+
+# Shared connection of a single-transaction seed run (set by the scheduler);
+# None means every generator checks out its own pooled connection.
+run_connection = None
+
+# Entities generated in this process; downstream generators sample from here
+world = WorldModel()
+
+# Password alphabet for credentials
+PASSWORD_ALPHABET = string.ascii_letters + string.digits + "!@#$%^&*()"
+
+
+
 # HELPER FUNCTIONS
-def _fetch_table_ids(tbl_name: str)-> List:
-    # Open connection
-    conn = db_connection()
-    cur = conn.cursor()
-    
+@contextmanager
+def _connection(savepoint: str = None):
+    """
+    Connection for one unit of generator work.
+
+    Outside a single-transaction run this is a pooled connection that
+    commits on exit. Inside one it is run_connection, wrapped in
+    SAVEPOINT savepoint (if given) that is released on success and rolled
+    back to on error; committing is left to the scheduler.
+    """
+    if run_connection is None:
+        with pooled_connection() as conn:
+            yield conn
+        return
+
+    if savepoint is None:
+        yield run_connection
+        return
+
+    name = sql.Identifier(f"seed_{savepoint}")
+    with run_connection.cursor() as cur:
+        cur.execute(sql.SQL(sqlrepo.SAVEPOINT).format(name))
+    try:
+        yield run_connection
+    except BaseException:
+        with run_connection.cursor() as cur:
+            cur.execute(sql.SQL(sqlrepo.ROLLBACK_TO_SAVEPOINT).format(name))
+        raise
+    with run_connection.cursor() as cur:
+        cur.execute(sql.SQL(sqlrepo.RELEASE_SAVEPOINT).format(name))
+
+def _clear_table(cur, tbl_name: str):
+    """
+    Truncate tbl_name (restart identity, cascade) unless disabled module-wide.
+    """
+    if not truncate_before_insert:
+        return
+    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier(tbl_name))
+    cur.execute(query)
+
+    # Forget the truncated rows; parents stay valid for later generators
+    if tbl_name in world:
+        world.reset(tbl_name)
+
+def _reserve_ids(cur, tbl_name: str, n: int) -> range:
+    """
+    Reserve n consecutive IDs from tbl_name's serial sequence.
+
+    Assumes the seed run is the only writer of tbl_name.
+    """
+    if n <= 0:
+        return range(0)
+    cur.execute(sqlrepo.RESERVE_ID_RANGE, (tbl_name, tbl_name, n, n))
+    first_id = cur.fetchone()[0]
+    return range(first_id, first_id + n)
+
+def _insert_parents(cur, tbl_name: str, rows: Iterable[Sequence], use_copy: bool) -> Sequence[int]:
+    """
+    Insert rows (without id) into tbl_name and return their IDs in row order.
+
+    COPY needs the IDs up front, so they are reserved from the sequence and
+    written explicitly. The INSERT path lets the sequence assign them and
+    reads them back with batched multi-row INSERT ... RETURNING.
+    """
+    rows = list(rows)
+    if not use_copy:
+        return insert_returning_ids(cur, tbl_name, rows)
+
+    ids = _reserve_ids(cur, tbl_name, len(rows))
+    rows = ((row_id, *row) for row_id, row in zip(ids, rows))
+    bulk_insert(cur, tbl_name, rows, use_copy=True, with_ids=True)
+    return ids
+
+def _world_ids(cur, tbl_name: str, column: str = None, value=None) -> List:
+    """
+    IDs of tbl_name from the in-memory world model, optionally where
+    column == value. Falls back to the database on the caller's cursor if
+    this process has not generated tbl_name (e.g. a generator is run on
+    its own).
+    """
+    if world.has_rows(tbl_name):
+        entity = world[tbl_name]
+        if column is None:
+            return list(entity.column("id"))
+        return entity.ids_where(column, value)
+
+    if column is None:
+        return _fetch_table_ids(cur, tbl_name)
+    return _fetch_table_ids_where(cur, tbl_name, column, value)
+
+def _fetch_table_ids(cur, tbl_name: str)-> List:
     # Get Id column name
     cur.execute(sqlrepo.FETCH_ID_COLUMN_NAME, (tbl_name,))
     id_column_name = cur.fetchall()
@@ -62,733 +178,671 @@ def _fetch_table_ids(tbl_name: str)-> List:
     ids = cur.fetchall()
     ids = [item[0] for item in ids]  # Unpack list of tuples
 
-    # Close connection
-    conn.commit()
-    conn.close()
-
     return ids
 
-def _fetch_table_ids_where(tbl_name: str, where: str)-> List:
-    # Open connection
-    conn = db_connection()
-    cur = conn.cursor()
-    
+def _fetch_table_ids_where(cur, tbl_name: str, column: str, value)-> List:
     # Get Id column name
     cur.execute(sqlrepo.FETCH_ID_COLUMN_NAME, (tbl_name,))
     id_column_name = cur.fetchall()
     id_column_name = id_column_name[0][0] # Unpack list of tuples
 
-    # Get ID's with ID colum name
+    # Get ID's with ID colum name where column = value (bound parameter)
     query = sql.SQL(sqlrepo.FETCH_IDS_WHERE).format(
     col=sql.Identifier(id_column_name),
     tbl=sql.Identifier(tbl_name),
-    where=sql.SQL(where) 
+    where_col=sql.Identifier(column)
     )
-    cur.execute(query)
+    cur.execute(query, (value,))
     ids = cur.fetchall()
     ids = [item[0] for item in ids]  # Unpack list of tuples
 
-    # Close connection
-    conn.commit()
-    conn.close()
-
     return ids
 
-def _random_string(n=8):
-    return "".join(choice(string.ascii_letters + string.digits) for _ in range(n))
-
-def _gen_rand_timestamp():
-    delta_seconds = int((seeds.stop_timestamp - seeds.start_timestamp).total_seconds())
-    rand_sec = randint(0, delta_seconds)
-    ts = seeds.start_timestamp + datetime.timedelta(seconds=rand_sec)
-    return ts.isoformat()
-
-def _gen_dummy_json():
-    json_thing = {
-    "title": " ".join([
-            choice(seeds.christmas_gibberish_words) for _ in range(randint(1,4))
-            ]),
-    "body": "You have a new notification.",
-    "type": "info"
-    }
-    return json.dumps(json_thing)
+def _row_count(tbl_name: str) -> int:
+    """
+    Number of rows to generate for a root table at the current scale factor.
+    """
+    ratio = seeds.table_ratios[tbl_name]
+    return max(1, round(seeds.num_gen_dummydata * seeds.scale_factor * ratio))
+
+def _log_summary(tbl_name: str):
+    """
+    Log the bounded verification summary of tbl_name (seeds.verify_mode).
+    """
+    summary = summarize_table(
+        tbl_name, seeds.verify_mode, seeds.verify_sample_rows, conn=run_connection
+    )
+    if summary:
+        logger.info(summary)
+
+def _sampler(tbl_name: str, chunk: int = 0) -> BatchSampler:
+    """
+    Random source for one table's generator (and chunk) under
+    seeds.master_seed. Each table draws from its own stream, so the data
+    does not depend on scheduling order or worker count.
+    """
+    return BatchSampler(stream_seed(seeds.master_seed, tbl_name, chunk))
+
+def _sql_seed(rand: BatchSampler) -> int:
+    """
+    Non-negative bigint seed for server-side hash draws.
+    """
+    return int(rand.integers(1, 0, 2**62)[0])
+
+def _fan_out(rand: BatchSampler, key: str, n: int) -> np.ndarray:
+    """
+    Draw the number of child rows for n parent rows from seeds.fan_out.
+    """
+    low, high = seeds.fan_out[key]
+    return rand.integers(n, low, high)
+
+def _gen_rand_timestamps(rand: BatchSampler, n: int, start=None, stop=None) -> np.ndarray:
+    """
+    n datetime64[s] timestamps in [start, stop], by default the global
+    [seeds.start_timestamp, seeds.stop_timestamp] window.
+    """
+    start = seeds.start_timestamp if start is None else start
+    stop = seeds.stop_timestamp if stop is None else stop
+    return rand.timestamps(n, start, stop)
+
+def _gen_unique_emails(rand: BatchSampler, local_parts: List[str]) -> List[str]:
+    """
+    One email per local part on a random domain; collisions get the row
+    number appended so the result is unique.
+    """
+    domains = rand.choice(len(local_parts), seeds.email_domains)
+    emails = []
+    seen_emails = set()
+    for counter, (local_part, domain) in enumerate(zip(local_parts, domains)):
+        email_address = f"{local_part}@{domain}"
+        if email_address in seen_emails:
+            email_address = f"{local_part}{counter}@{domain}"
+        seen_emails.add(email_address)
+        emails.append(email_address)
+    return emails
+
+def _gen_dummy_json(rand: BatchSampler, n: int) -> List[str]:
+    titles = rand.phrases(n, seeds.christmas_gibberish_words, 1, 4)
+    return [
+        json.dumps({
+            "title": title,
+            "body": "You have a new notification.",
+            "type": "info",
+        })
+        for title in titles
+    ]
 
 # INSERT THE DATA
 # 1
-def gen_dummydata_accounts():
+def gen_dummydata_accounts(use_copy: bool = True):
     """
     Fill dummy data for accounts table.
     """
-    # first names
-    first_names = []
-    for _ in range(seeds.num_gen_dummydata):
-        name = ""
-        syllable_ammount = randint(seeds.fn_min_sylls, seeds.fn_max_sylls)
-        for _ in range(syllable_ammount):
-            name += choice(seeds.first_name_sylls)
-        first_names.append(name)
-
-    # last names
-    last_names = []
-    for _ in range(seeds.num_gen_dummydata):
-        name = ""
-        syllable_ammount = randint(seeds.ln_min_sylls, seeds.ln_max_sylls)
-        for _ in range(syllable_ammount):
-            name += choice(seeds.last_name_sylls)
-        last_names.append(name)
+    rand = _sampler('accounts')
+    row_count = _row_count('accounts')
+
+    # first and last names from syllables
+    first_names = rand.phrases(
+        row_count, seeds.first_name_sylls, seeds.fn_min_sylls, seeds.fn_max_sylls, sep=""
+    )
+    last_names = rand.phrases(
+        row_count, seeds.last_name_sylls, seeds.ln_min_sylls, seeds.ln_max_sylls, sep=""
+    )
 
     # email addresses
-    emails = []
-    counter = 0
-    while counter < seeds.num_gen_dummydata:
-        email_address = (
-            first_names[counter]
-            + "."
-            + last_names[counter]
-            + "@"
-            + choice(seeds.email_domains)
-        )
-        if email_address not in emails:
-            emails.append(email_address)
-            counter += 1
-        else:
-            continue
+    emails = _gen_unique_emails(
+        rand, [f"{first}.{last}" for first, last in zip(first_names, last_names)]
+    )
 
     # timestamps
-    timestamps = []
-    for _ in range(seeds.num_gen_dummydata):
-        timestamps.append(_gen_rand_timestamp())
+    timestamps = to_datetimes(_gen_rand_timestamps(rand, row_count))
 
     # roles
-    roles = []
-    for _ in range(seeds.num_gen_dummydata - seeds.admin_count):
-        roles.append(choice(["guest", "host"]))
-    for _ in range(seeds.admin_count):
-        roles.append("admin")
+    roles = rand.choice(row_count - seeds.admin_count, ["guest", "host"]).tolist()
+    roles += ["admin"] * seeds.admin_count
 
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('accounts'))
-    cur.execute(query)
-    data = zip(emails, first_names, last_names, roles, timestamps)
-    cur.executemany(sqlrepo.INSERT_ACCOUNTS, data)
-    conn.commit()
-    conn.close()
+    with _connection('accounts') as conn:
+        cur = conn.cursor()
+        _clear_table(cur, 'accounts')
+        data = zip(emails, first_names, last_names, roles, timestamps)
+        ids = _insert_parents(cur, 'accounts', data, use_copy)
+    world['accounts'].extend(id=ids, role=roles)
 
     # Test and log
-    logger.info("Sample data inserted into accounts table:")
-    logger.info(get_tbl_contents_as_str('accounts'))
+    _log_summary('accounts')
 
     # Return for later use
     return emails, first_names, last_names, roles, timestamps
 
 # 2
-def gen_dummydata_credentials():
+def gen_dummydata_credentials(use_copy: bool = True):
     """
     Fill dummy data for credentials table.
 
     Returns:
         password_hash, password_updated_at
     """
-    password_hash = []
-    for _ in range(seeds.num_gen_dummydata):
-        password = "".join(
-            choices(
-                "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()",
-                k=seeds.pwd_hash_length,
-            )
-        )
-        password_hash.append(password)
-
-    # timestamps
-    password_updated_at = []
-    for _ in range(seeds.num_gen_dummydata):
-        password_updated_at.append(_gen_rand_timestamp())
-
+    rand = _sampler('credentials')
 
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('credentials') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('credentials'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'credentials')
     
-    # Get Id column name
-    account_ids = _fetch_table_ids('accounts')
+        # Get account ids
+        account_ids = _world_ids(cur, 'accounts')
+
+        # passwords and timestamps, one per account
+        password_hash = rand.strings(len(account_ids), PASSWORD_ALPHABET, seeds.pwd_hash_length)
+        password_updated_at = to_datetimes(_gen_rand_timestamps(rand, len(account_ids)))
 
-    # Create Data List
-    data = zip(account_ids, password_hash, password_updated_at)
-    cur.executemany(sqlrepo.INSERT_CREDENTIALS, data)
-    conn.commit()
-    conn.close()
+        # Create Data List
+        data = zip(account_ids, password_hash, password_updated_at)
+        bulk_insert(cur, 'credentials', data, use_copy=use_copy)
 
     # Test and log
-    logger.info("Sample data inserted into credentials table:")
-    logger.info(get_tbl_contents_as_str('credentials'))
+    _log_summary('credentials')
 
     return password_hash, password_updated_at
 
 # 3
-def gen_dummydata_addresses():
+def gen_dummydata_addresses(use_copy: bool = True):
     """
     Fill dummy data for addresses table.
 
     Returns:
         line1, line2, city, postal_code, country
     """
-    line1 = []
+    rand = _sampler('addresses')
+    row_count = _row_count('addresses')
+
+    cities = rand.choice(row_count, list(seeds.city_postal)).tolist()
+    postal_code = [seeds.city_postal[city] for city in cities]
+    countries = [seeds.city_country[city] for city in cities]
+
+    # line1: street of the city + house number
+    street_picks = rand.uniform(row_count)
+    house_numbers = rand.integers(row_count, 1, 200)
+    line1 = [
+        f"{seeds.city_streets[city][int(pick * len(seeds.city_streets[city]))]} {number}"
+        for city, pick, number in zip(cities, street_picks, house_numbers)
+    ]
+
+    # line2: building and unit in the city's own terms
+    building_numbers = rand.integers(row_count, 1, 10)
+    unit_numbers = rand.integers(row_count, 1, 50)
     line2 = []
-    cities = []
-    postal_code = []
-    countries = []
-
-    for _ in range(seeds.num_gen_dummydata):
-        city, postal = choice(list(seeds.city_postal.items()))
-        country_name = seeds.city_country[city]
-        street = choice(seeds.city_streets[city])
-        house_number = str(randint(1, 200))
-
-        # line1
-        line1.append(f"{street} {house_number}")
-
-        # optional line2
-        if city in seeds.city_address_terms.keys():
+    for city, building_number, unit_number in zip(cities, building_numbers, unit_numbers):
+        if city in seeds.city_address_terms:
             term1, term2 = seeds.city_address_terms[city]
-            building_number = str(randint(1, 10))
-            unit_number = str(randint(1, 50))
             line2.append(f"{term1} {building_number}, {term2} {unit_number}")
-
-        cities.append(city)
-        postal_code.append(postal)
-        countries.append(country_name)
+        else:
+            line2.append(None)
 
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('addresses'))
-    cur.execute(query)
-    data = zip(line1, line2, cities, postal_code, countries)
-    cur.executemany(sqlrepo.INSERT_ADDRESSES, data)
-    conn.commit()
-    conn.close()
+    with _connection('addresses') as conn:
+        cur = conn.cursor()
+        _clear_table(cur, 'addresses')
+        data = zip(line1, line2, cities, postal_code, countries)
+        ids = _insert_parents(cur, 'addresses', data, use_copy)
+    world['addresses'].extend(id=ids)
 
     # Test and log
-    logger.info("Sample data inserted into addresses table:")
-    logger.info(get_tbl_contents_as_str('addresses'))
+    _log_summary('addresses')
 
     return line1, line2, cities, postal_code, countries
 
 # 4
-def gen_dummydata_accommodations():
+def gen_dummydata_accommodations(use_copy: bool = True):
     """
     Fill dummy data for accommodations table.
 
     Returns:
         titles, price_cents, is_active, created_at
     """
-    titles = []
-    price_cents = []
-    is_active = []
-    created_at = []
+    rand = _sampler('accommodations')
 
     # host_account_id
-    conn = db_connection()
-    cur = conn.cursor()
-
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('accommodations'))
-    cur.execute(query)
-    
-    # Get Id column name from accounts table
-    cur.execute(sqlrepo.FETCH_ID_COLUMN_NAME, ('accounts',))
-    id_column_name = cur.fetchall()
-    id_column_name = id_column_name[0][0] # Unpack list of tuples
-
-    # Get ID's with ID colum name
-    query = sqlrepo.FETCH_HOST_IDS
-    cur.execute(query)
-    host_account_ids = cur.fetchall()
-    host_account_ids = [item[0] for item in host_account_ids]  # Unpack list of tuples
-
-    # Select a randwom host account id list matching num_gen_dummydata
-    host_account_ids = [choice(host_account_ids) for _ in range(seeds.num_gen_dummydata)]
-
-    # titles
-    for _ in range(seeds.num_gen_dummydata):
-        title = [
-            choice(seeds.accomodation_title_words_dict["adjectives_general"]),
-            choice(seeds.accomodation_title_words_dict["accommodation_nouns"]),
-            choice(seeds.accomodation_title_words_dict["location_connectors"]),
-            choice(seeds.accomodation_title_words_dict["adjectives_location"]),
-            choice(seeds.accomodation_title_words_dict["place_names"]),
+    with _connection('accommodations') as conn:
+        cur = conn.cursor()
+
+        # Clear existing data
+        _clear_table(cur, 'accommodations')
+
+        # One accommodation per available address
+        address_ids = _world_ids(cur, 'addresses')
+        row_count = min(_row_count('accommodations'), len(address_ids))
+        address_ids = address_ids[:row_count]
+
+        # Select a random host account id list matching row_count
+        host_account_ids = rand.choice(row_count, _world_ids(cur, 'accounts', 'role', 'host')).tolist()
+
+        # titles
+        words = seeds.accomodation_title_words_dict
+        title_parts = [
+            rand.choice(row_count, words[key])
+            for key in (
+                "adjectives_general",
+                "accommodation_nouns",
+                "location_connectors",
+                "adjectives_location",
+                "place_names",
+            )
         ]
-        titles.append(" ".join(title))
-    
-    # Get Id column name from addresses table
-    address_ids = _fetch_table_ids('addresses')
-
-    # prices
-    for _ in range(seeds.num_gen_dummydata):
-        price = randint(50, 500) * 100
-        price_cents.append(price)
-
-    # activity flags
-    for _ in range(seeds.num_gen_dummydata):
-        is_active.append(choice([True, False]))
-
-    # created_at
-    for _ in range(seeds.num_gen_dummydata):
-        created_at.append(_gen_rand_timestamp())
-
-    # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('accommodations'))
-    cur.execute(query)
-    data = zip(host_account_ids, titles, address_ids, price_cents, is_active, created_at)
-    cur.executemany(sqlrepo.INSERT_ACCOMMODATIONS, data)
-    conn.commit()
-    conn.close()
+        titles = [" ".join(parts) for parts in zip(*title_parts)]
+
+        # prices, activity flags, created_at
+        price_cents = (rand.integers(row_count, 50, 500) * 100).tolist()
+        is_active = rand.booleans(row_count).tolist()
+        created_at = to_datetimes(_gen_rand_timestamps(rand, row_count))
+
+        # Insert data into SQL table
+        data = zip(host_account_ids, titles, address_ids, price_cents, is_active, created_at)
+        ids = _insert_parents(cur, 'accommodations', data, use_copy)
+    world['accommodations'].extend(
+        id=ids,
+        host_account_id=host_account_ids,
+        price_cents=price_cents,
+    )
 
     # Test and log
-    logger.info("Sample data inserted into accommodations table:")
-    logger.info(get_tbl_contents_as_str('accommodations'))
+    _log_summary('accommodations')
 
     return titles, price_cents, is_active, created_at
 
 # 5
-def gen_dummydata_images():
+def gen_dummydata_images(use_copy: bool = True):
     """
     Fill dummy data for images table.
 
     Returns:
         mimes, storage_keys, created_at
     """
-    mimes = []
-    storage_keys = []
-    created_at = []
-
-    for _ in range(seeds.num_gen_dummydata*4):  # More images than other tables
-        # mime
-        mime = choice(seeds.image_mimes)
-        mimes.append(mime)
+    rand = _sampler('images')
+    row_count = _row_count('images')
 
-        # timestamp
-        created_at.append(_gen_rand_timestamp())
+    mimes = rand.choice(row_count, seeds.image_mimes).tolist()
+    created_at = to_datetimes(_gen_rand_timestamps(rand, row_count))
 
-        # storage key
-        storage_key = "images/"
-        storage_key += rstr.xeger(
-            r"[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}"
-        )
-        storage_key += f".{mime.split('/')[1]}"
-        storage_keys.append(storage_key)
+    # storage key: images/<uuid>.<subtype>
+    storage_keys = [
+        f"images/{key}.{mime.split('/')[1]}"
+        for key, mime in zip(rand.uuids(row_count), mimes)
+    ]
 
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('images'))
-    cur.execute(query)
-    data = zip(mimes, storage_keys, created_at)
-    cur.executemany(sqlrepo.INSERT_IMAGES, data)
-    conn.commit()
-    conn.close()
+    with _connection('images') as conn:
+        cur = conn.cursor()
+        _clear_table(cur, 'images')
+        data = zip(mimes, storage_keys, created_at)
+        ids = _insert_parents(cur, 'images', data, use_copy)
+    world['images'].extend(id=ids)
 
     # Test and log
-    logger.info("Sample data inserted into images table:")
-    logger.info(get_tbl_contents_as_str('images'))
+    _log_summary('images')
 
     return mimes, storage_keys, created_at
 
 # 6
-def gen_dummydata_payment_methods():
+def gen_dummydata_payment_methods(use_copy: bool = True):
     """
     Fill dummy data for payment_methods table.
     """
+    rand = _sampler('payment_methods')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('payment_methods') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('payment_methods'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'payment_methods')
     
-    # Get account ids
-    account_ids = _fetch_table_ids('accounts')
-
-    # Create data list to insert later 
-    data = [[],[],[]]
-
-    # Create random ammount of payment methods per account
-    for id in account_ids:
-        payment_method_count = choice([1,2,3])
-        method_types = ['card', 'paypal']
-        methods_per_acc = [choice(method_types) for _ in range(payment_method_count)]
-        for method in methods_per_acc:
-            # Append all data
-            data[0].append(id)
-            data[1].append(method)
-            data[2].append(_gen_rand_timestamp())
-
-    # Finally insert the data
-    if (len(data[0])== len(data[1]) and len(data[1]) == len(data[2])):
-        data = zip(data[0], data[1], data[2])
-        cur.executemany(sqlrepo.INSERT_PAYMENT_METHODS, data)
-    else: print("gen_dummydata_payment_methods(): data has not euqal length")
-    conn.commit()
-    conn.close()
+        # Get account ids
+        account_ids = _world_ids(cur, 'accounts')
+
+        # Create random ammount of payment methods per account
+        counts = _fan_out(rand, 'payment_methods_per_account', len(account_ids))
+        customer_ids = np.repeat(np.asarray(account_ids, dtype=np.int64), counts).tolist()
+        method_types = rand.choice(len(customer_ids), ['card', 'paypal']).tolist()
+        created_at = to_datetimes(_gen_rand_timestamps(rand, len(customer_ids)))
+
+        # Finally insert the data
+        data = zip(customer_ids, method_types, created_at)
+        ids = _insert_parents(cur, 'payment_methods', data, use_copy)
+    world['payment_methods'].extend(id=ids, customer_id=customer_ids, type=method_types)
 
     # Test and log
-    logger.info("Sample data inserted into payment_methods table:")
-    logger.info(get_tbl_contents_as_str('payment_methods'))
+    _log_summary('payment_methods')
 
 # 7
-def gen_dummydata_credit_cards():
+def gen_dummydata_credit_cards(use_copy: bool = True):
     """
     Fill dummy data for credit_cards table.
     """
+    rand = _sampler('credit_cards')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('credit_cards') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('credit_cards'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'credit_cards')
     
-    # Get Id column name
-    card_ids = _fetch_table_ids_where(tbl_name='payment_methods', where="type = 'card'")
-    brand = [choice(seeds.card_brands) for _ in card_ids]
-    last4 = [randint(100,999) for _ in card_ids]
-    exp_month = [randint(1,12) for _ in card_ids]
-    exp_year = [randint(2023,2053) for _ in card_ids]
+        # Get Id column name
+        card_ids = _world_ids(cur, 'payment_methods', 'type', 'card')
+        n = len(card_ids)
+        brand = rand.choice(n, seeds.card_brands).tolist()
+        last4 = [f"{digits:04d}" for digits in rand.integers(n, 0, 9999)]
+        exp_month = rand.integers(n, 1, 12).tolist()
+        exp_year = rand.integers(n, 2023, 2053).tolist()
     
-    # Zip data 
-    data = zip(card_ids, brand, last4, exp_month, exp_year)
+        # Zip data 
+        data = zip(card_ids, brand, last4, exp_month, exp_year)
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_CREDIT_CARDS, data)
-    conn.commit()
-    conn.close()
+        # Finally insert the data
+        bulk_insert(cur, 'credit_cards', data, use_copy=use_copy)
 
     # Test and log
-    logger.info("Sample data inserted into credit_cards table:")
-    logger.info(get_tbl_contents_as_str('credit_cards'))
+    _log_summary('credit_cards')
 
 # 8
-def gen_dummydata_paypal():
+def gen_dummydata_paypal(use_copy: bool = True):
     """
     Fill dummy data for paypal table.
     """
+    rand = _sampler('paypal')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('paypal') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('paypal'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'paypal')
     
-    # Get Id column name
-    paypal_ids = _fetch_table_ids_where(tbl_name='payment_methods', where="type = 'paypal'")
-    paypal_user_id = [f"PP-{_random_string(n=8)}" for _ in paypal_ids]
+        # Get Id column name
+        paypal_ids = _world_ids(cur, 'payment_methods', 'type', 'paypal')
+        n = len(paypal_ids)
+        paypal_user_id = [
+            f"PP-{suffix}"
+            for suffix in rand.strings(n, string.ascii_letters + string.digits, 8)
+        ]
     
-    # email addresses
-    emails = set()
-    counter = 0
-    while counter < len(paypal_ids):
-        email_address = (
-            "".join(choice(seeds.first_name_sylls) for _ in range(randint(1,3)))
-            + "."
-            + "".join(choice(seeds.last_name_sylls) for _ in range(randint(1,3)))
-            + "@"
-            + choice(seeds.email_domains)
+        # email addresses
+        first_parts = rand.phrases(n, seeds.first_name_sylls, 1, 3, sep="")
+        last_parts = rand.phrases(n, seeds.last_name_sylls, 1, 3, sep="")
+        emails = _gen_unique_emails(
+            rand, [f"{first}.{last}" for first, last in zip(first_parts, last_parts)]
         )
-        if email_address not in emails:
-            emails.add(email_address)
-            counter += 1
-        else:
-            continue
     
-    # Zip data 
-    data = zip(paypal_ids, paypal_user_id, emails)
+        # Zip data 
+        data = zip(paypal_ids, paypal_user_id, emails)
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_PAYPAL, data)
-    conn.commit()
-    conn.close()
+        # Finally insert the data
+        bulk_insert(cur, 'paypal', data, use_copy=use_copy)
 
     # Test and log
-    logger.info("Sample data inserted into paypal table:")
-    logger.info(get_tbl_contents_as_str('paypal'))
+    _log_summary('paypal')
 
 # 9
-def gen_dummydata_reviews():
+def gen_dummydata_reviews(use_copy: bool = True):
     """
     Fill dummy data for reviews table.
     """
+    rand = _sampler('reviews')
+    row_count = _row_count('reviews')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('reviews') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('reviews'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'reviews')
     
-    # Get account ids
-    accomodation_ids = _fetch_table_ids('accommodations')
-    account_ids = _fetch_table_ids_where(tbl_name='accounts', where="role = 'guest'")
-
-    accomodation = []  
-    author = []
-    rating = [] 
-    description = [] 
-    timestamp = [] 
-
-    for _ in range(seeds.num_gen_dummydata*2):
-        
-        def gen_description(bad=True):
-            sentiment = 'negative' if bad else 'positive'
-            o = seeds.christmas_accommodation_reviews
-            description = (
-                f"{choice(o['openings'][sentiment])}! "
-                f"{choice(o['accommodation_features'][sentiment])}. "
-                f"{choice(o['intensifiers']).capitalize()}, "
-                f"{choice(o['experiences'][sentiment])}. "
-                f"{choice(o['connectors'])} "
-                f"{choice(o['host_details'][sentiment])}. "
-                f"{choice(o['random_details'])}. "
-                f"{choice(o['comfort_ratings'][sentiment]).capitalize()}. "
-                f"{choice(o['final_thoughts'][sentiment])}!"
-            ) 
-            return description
-        
-        accomodation.append(choice(accomodation_ids))
-        rating.append(randint(1,5))
-        author.append(choice(account_ids))
-        if rating[-1] < 3:
-            description.append(gen_description(bad=True))
-        else:
-            description.append(gen_description(bad=False))
-        timestamp.append(_gen_rand_timestamp())
+        # Get account ids
+        accomodation = rand.choice(row_count, _world_ids(cur, 'accommodations')).tolist()
+        author = rand.choice(row_count, _world_ids(cur, 'accounts', 'role', 'guest')).tolist()
+        rating = rand.integers(row_count, 1, 5).tolist()
+        timestamp = to_datetimes(_gen_rand_timestamps(rand, row_count))
+
+        # Descriptions: every sentence part drawn column-wise per sentiment
+        o = seeds.christmas_accommodation_reviews
+        bad = np.asarray(rating) < 3
+        description = [None] * row_count
+        for sentiment, mask in (('negative', bad), ('positive', ~bad)):
+            rows = np.flatnonzero(mask)
+            n = len(rows)
+            parts = zip(
+                rand.choice(n, o['openings'][sentiment]),
+                rand.choice(n, o['accommodation_features'][sentiment]),
+                rand.choice(n, o['intensifiers']),
+                rand.choice(n, o['experiences'][sentiment]),
+                rand.choice(n, o['connectors']),
+                rand.choice(n, o['host_details'][sentiment]),
+                rand.choice(n, o['random_details']),
+                rand.choice(n, o['comfort_ratings'][sentiment]),
+                rand.choice(n, o['final_thoughts'][sentiment]),
+            )
+            for row, (opening, feature, intensifier, experience, connector,
+                      host_detail, random_detail, comfort, final) in zip(rows, parts):
+                description[row] = (
+                    f"{opening}! "
+                    f"{feature}. "
+                    f"{intensifier.capitalize()}, "
+                    f"{experience}. "
+                    f"{connector} "
+                    f"{host_detail}. "
+                    f"{random_detail}. "
+                    f"{comfort.capitalize()}. "
+                    f"{final}!"
+                )
         
-    # Zip data 
-    data = zip(accomodation, author, rating, description, timestamp)
+        # Zip data 
+        data = zip(accomodation, author, rating, description, timestamp)
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_REVIEWS, data)
-    conn.commit()
-    conn.close()
+        # Finally insert the data
+        ids = _insert_parents(cur, 'reviews', data, use_copy)
+    world['reviews'].extend(id=ids)
 
     # Test and log
-    logger.info("Sample data inserted into reviews table:")
-    logger.info(get_tbl_contents_as_str('reviews'))
+    _log_summary('reviews')
 
 # 10
-def gen_dummydata_conversations():
+def gen_dummydata_conversations(use_copy: bool = True):
     """
     Fill dummy data for conversations table.
     """
+    rand = _sampler('conversations')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('conversations') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('conversations'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'conversations')
     
-    # Gen Data 
-    data = [_gen_rand_timestamp() for _ in range(seeds.num_gen_dummydata)]
-    data = zip(data)
-    print(data)
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_CONVERSATIONS, data)
-    conn.commit()
-    conn.close()
+        # Gen Data 
+        created_at = to_datetimes(_gen_rand_timestamps(rand, _row_count('conversations')))
+        data = zip(created_at)
+
+        # Finally insert the data
+        ids = _insert_parents(cur, 'conversations', data, use_copy)
+    world['conversations'].extend(id=ids)
 
     # Test and log
-    logger.info("Sample data inserted into conversations table:")
-    logger.info(get_tbl_contents_as_str('conversations'))
+    _log_summary('conversations')
 
 # 11
-def gen_dummydata_messages():
+def gen_dummydata_messages(use_copy: bool = True):
     """
     Fill dummy data for messages table.
+
+    Each conversation is a host/guest pair taking turns (host first); the
+    first message is sent at a random time, each reply 1-300 minutes later,
+    and only the last message may be unread.
     """
+    rand = _sampler('messages')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('messages') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('messages'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'messages')
     
-    # Get account ids
-    conversation_ids = _fetch_table_ids('conversations')
-    sender_id = []
-    receiver_id = []
-    conversation_id = []
-    body = []
-    is_read = []
-    sent_at = []
-
-    guest_ids = _fetch_table_ids_where(tbl_name='accounts', where="role = 'guest'")
-    host_ids = _fetch_table_ids_where(tbl_name='accounts', where="role = 'host'")
-
-    shuffle(host_ids)
-    host_ids = host_ids[:int(len(host_ids)*0.7)]
-
-    message_partners = []
-    for conv_id in conversation_ids:
-        message_partners.append((choice(host_ids), choice(guest_ids), conv_id))
-
-    for partner in message_partners:
-        conv_length = randint(1,10)
-        start_time = datetime.datetime.fromisoformat(_gen_rand_timestamp())
-        for i in range(conv_length):
-            if i%2 == 0:
-                sender_id.append(partner[0])
-                receiver_id.append(partner[1])
-            else:
-                sender_id.append(partner[1])
-                receiver_id.append(partner[0])
-            conversation_id.append(partner[2])
-            body.append(
-                " ".join([
-                choice(seeds.christmas_gibberish_words) for _ in range(randint(1,10))
-                ]))
-            is_read.append(True)
-            sent_at.append(start_time)
-            start_time += datetime.timedelta(minutes=randint(1,300))
-        is_read[-1] = choice([True, False])
-
-    # Zip data 
-    data = zip(sender_id, receiver_id, conversation_id, body, sent_at, is_read)
-
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_MESSAGES, data)
-    conn.commit()
-    conn.close()
+        # Get account ids
+        conversation_ids = np.asarray(_world_ids(cur, 'conversations'), dtype=np.int64)
+        guest_ids = _world_ids(cur, 'accounts', 'role', 'guest')
+        host_ids = rand.permutation(_world_ids(cur, 'accounts', 'role', 'host'))
+        host_ids = host_ids[:max(1, int(len(host_ids) * seeds.conversation_host_share))]
+
+        # Message partners per conversation
+        n_conv = len(conversation_ids)
+        conv_hosts = np.asarray(rand.choice(n_conv, host_ids), dtype=np.int64)
+        conv_guests = np.asarray(rand.choice(n_conv, guest_ids), dtype=np.int64)
+        conv_lengths = _fan_out(rand, 'messages_per_conversation', n_conv)
+        conv_starts = _gen_rand_timestamps(rand, n_conv)
+
+        # Expand to one row per message
+        n_msg = int(conv_lengths.sum())
+        conv_index = np.repeat(np.arange(n_conv), conv_lengths)
+        first_row = np.cumsum(conv_lengths) - conv_lengths
+        position = np.arange(n_msg) - np.repeat(first_row, conv_lengths)
+
+        host_turn = position % 2 == 0
+        sender_id = np.where(host_turn, conv_hosts[conv_index], conv_guests[conv_index])
+        receiver_id = np.where(host_turn, conv_guests[conv_index], conv_hosts[conv_index])
+
+        # Reply gaps accumulate within each conversation; first message has none
+        gaps = rand.integers(n_msg, 1, 300).astype(np.int64)
+        gaps[position == 0] = 0
+        elapsed = np.cumsum(gaps)
+        elapsed -= np.repeat(elapsed[first_row], conv_lengths)
+        sent_at = conv_starts[conv_index] + elapsed.astype("timedelta64[m]")
+
+        # Only the last message per conversation may be unread
+        is_read = np.ones(n_msg, dtype=bool)
+        last_row = first_row + conv_lengths - 1
+        is_read[last_row] = rand.booleans(n_conv)
+
+        body = rand.phrases(n_msg, seeds.christmas_gibberish_words, 1, 10)
+
+        # Zip data 
+        data = zip(
+            sender_id.tolist(),
+            receiver_id.tolist(),
+            conversation_ids[conv_index].tolist(),
+            body,
+            to_datetimes(sent_at),
+            is_read.tolist(),
+        )
+
+        # Finally insert the data, straight into the monthly partitions
+        write_partitioned(cur, 'messages', data, use_copy=use_copy)
 
     # Test and log
-    logger.info("Sample data inserted into messages table:")
-    logger.info(get_tbl_contents_as_str('messages'))
+    _log_summary('messages')
 
 # 12
-def gen_dummydata_review_images():
+def gen_dummydata_review_images(use_copy: bool = True):
     """
     Fill dummy data for review_images table.
     """
+    rand = _sampler('review_images')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('review_images') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('review_images'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'review_images')
     
-    # Get account ids
-    review_ids = _fetch_table_ids('reviews')
-    image_ids = _fetch_table_ids('images')
-
-    image_id = []
-    review_id = []
-    shuffle(image_ids)
-    available = set(image_ids)
-    for rid in review_ids[: len(review_ids)//2]:
-        n = randint(1, 3)
-        # stop if not enough images left
-        if len(available) < n:
-            break
-        chosen = sample(list(available), n)  # unique
-        for img in chosen:
-            review_id.append(rid)
-            image_id.append(img)
-            available.remove(img)
-
-    # Zip data 
-    data = zip(review_id, image_id)
-
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_REVIEW_IMAGES, data)
-    conn.commit()
-    conn.close()
+        # Get account ids
+        review_ids = _world_ids(cur, 'reviews')
+        image_ids = rand.permutation(_world_ids(cur, 'images'))
+
+        # Consecutive slices of the shuffled images are unique per review
+        review_ids = review_ids[: int(len(review_ids) * seeds.review_image_share)]
+        counts = _fan_out(rand, 'images_per_review', len(review_ids))
+
+        # stop at the first review that no longer gets its full image count
+        fits = np.cumsum(counts) <= len(image_ids)
+        n_reviews = int(np.argmin(fits)) if not fits.all() else len(review_ids)
+        counts = counts[:n_reviews]
+
+        review_id = np.repeat(np.asarray(review_ids[:n_reviews], dtype=np.int64), counts).tolist()
+        image_id = image_ids[:len(review_id)]
+
+        # Zip data 
+        data = zip(review_id, image_id)
+
+        # Finally insert the data
+        bulk_insert(cur, 'review_images', data, use_copy=use_copy)
+    world['review_images'].extend(id=review_id, image_id=image_id)
 
     # Test and log
-    logger.info("Sample data inserted into review_images table:")
-    logger.info(get_tbl_contents_as_str('review_images'))
+    _log_summary('review_images')
 
 # 13
-def gen_dummydata_accommodation_images():
+def gen_dummydata_accommodation_images(use_copy: bool = True):
     """
     Fill dummy data for accommodation_images table.
     """
-    accommodation_id = []    
-    image_id = []
-    sort_order = []
-    is_cover = []
-    caption = []
-    room_tag = []
+    rand = _sampler('accommodation_images')
 
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('accommodation_images') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('accommodation_images'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'accommodation_images')
     
-    # Get image ids
-    image_ids = _fetch_table_ids('images')
+        # Get image ids
+        image_ids = _world_ids(cur, 'images')
 
-    # Get review image ids
-    query = sqlrepo.FETCH_IMG_ID_FROM_REVIEW_IMGS
-    cur.execute(query)
-    rew_img_ids = cur.fetchall()
+        # Get review image ids
+        if world.has_rows('review_images'):
+            rew_img_ids = world['review_images'].column('image_id')
+        else:
+            cur.execute(sqlrepo.FETCH_IMG_ID_FROM_REVIEW_IMGS)
+            rew_img_ids = [item[0] for item in cur.fetchall()]  # Unpack list of tuples
     
-    # Get the available ids
-    available_img_ids = list(set(image_ids) - set(rew_img_ids))
-
-    # Get accommodation ids
-    accommodation_ids = _fetch_table_ids('accommodations')
-    shuffle(accommodation_ids)
-
-    counter = 0
-    for id in accommodation_ids:
-        imgs_per_accomodation = randint(2,5)
-        if counter + imgs_per_accomodation > len(available_img_ids):
-            imgs_per_accomodation = len(available_img_ids) - counter
-        for x in range(imgs_per_accomodation):
-            accommodation_id.append(id)
-            image_id.append(available_img_ids[counter + x])
-            sort_order.append(x)
-            if x == 0:
-                is_cover.append(True)
-            else:
-                is_cover.append(False)
-            caption_text = choice(seeds.christmas_accommodation_reviews["openings"]["positive"])
-            caption.append(caption_text)
-            room_tag.append(choice(seeds.room_tags))
-        counter += imgs_per_accomodation
+        # Get the available ids
+        rew_img_ids = set(rew_img_ids)
+        available_img_ids = [img for img in image_ids if img not in rew_img_ids]
+
+        # Get accommodation ids
+        accommodation_ids = rand.permutation(_world_ids(cur, 'accommodations'))
+
+        # Images per accommodation, capped by what is left
+        counts = _fan_out(rand, 'images_per_accommodation', len(accommodation_ids))
+        ends = np.minimum(np.cumsum(counts), len(available_img_ids))
+        counts = np.diff(ends, prepend=0)
+
+        n = int(counts.sum())
+        accommodation_id = np.repeat(np.asarray(accommodation_ids, dtype=np.int64), counts)
+        sort_order = np.arange(n) - np.repeat(ends - counts, counts)
+        is_cover = sort_order == 0
+        caption = rand.choice(n, seeds.christmas_accommodation_reviews["openings"]["positive"])
+        room_tag = rand.choice(n, seeds.room_tags)
         
-    # Zip data 
-    data = zip(
-        accommodation_id,
-        image_id,
-        sort_order,
-        is_cover,
-        caption,
-        room_tag
-    )
+        # Zip data 
+        data = zip(
+            accommodation_id.tolist(),
+            available_img_ids[:n],
+            sort_order.tolist(),
+            is_cover.tolist(),
+            caption.tolist(),
+            room_tag.tolist()
+        )
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_ACCOMMODATION_IMAGES, data)
-    conn.commit()
-    conn.close()
+        # Finally insert the data
+        bulk_insert(cur, 'accommodation_images', data, use_copy=use_copy)
 
     # Test and log
-    logger.info("Sample data inserted into accommodation_images table:")
-    logger.info(get_tbl_contents_as_str_sorted_by('accommodation_images',sort_by="accommodation_id"))
+    _log_summary('accommodation_images')
 
     """
     accommodation_id INT NOT NULL REFERENCES accommodations(id) ON DELETE CASCADE,
@@ -800,392 +854,318 @@ def gen_dummydata_accommodation_images():
     """
 
 # 14
-def gen_dummydata_notifications():
+def gen_dummydata_notifications(use_copy: bool = True):
     """
     Fill dummy data for notifications table.
     """
+    rand = _sampler('notifications')
+    row_count = _row_count('notifications')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('notifications') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('notifications'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'notifications')
     
-    # Get account ids
-    account_ids = _fetch_table_ids('accounts')
-
-    account_id = []
-    payload = []
-    sent_at = []
-
-    for _ in range(seeds.num_gen_dummydata):
-        account_id.append(choice(account_ids))
-        payload.append(_gen_dummy_json())
-        sent_at.append(_gen_rand_timestamp())
+        # Get account ids
+        account_id = rand.choice(row_count, _world_ids(cur, 'accounts')).tolist()
+        payload = _gen_dummy_json(rand, row_count)
+        sent_at = to_datetimes(_gen_rand_timestamps(rand, row_count))
 
-    # Zip data 
-    data = zip(account_id, payload, sent_at)
+        # Zip data 
+        data = zip(account_id, payload, sent_at)
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_NOTIFICATIONS, data)
-    conn.commit()
-    conn.close()
+        # Finally insert the data, straight into the monthly partitions
+        write_partitioned(cur, 'notifications', data, use_copy=use_copy)
 
     # Test and log
-    logger.info("Sample data inserted into notifications table:")
-    logger.info(get_tbl_contents_as_str('notifications'))
+    _log_summary('notifications')
 
 # 15
-def gen_dummydata_payout_accounts():
+def gen_dummydata_payout_accounts(use_copy: bool = True):
     """
     Fill dummy data for payout_accounts table.
     """
+    rand = _sampler('payout_accounts')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('payout_accounts') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('payout_accounts'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'payout_accounts')
     
-    # Get account ids
-    query = sqlrepo.FETCH_HOST_IDS
-    cur.execute(query)
-    host_ids = cur.fetchall()
+        # Get account ids
+        host_ids = _world_ids(cur, 'accounts', 'role', 'host')
 
-    host_account_id = []
-    type = []
-    is_default = []
+        # One default account per host, plus a second one for a share of hosts
+        extra_ids = rand.permutation(host_ids)
+        extra_ids = extra_ids[:int(len(host_ids) * seeds.extra_payout_account_share)]
 
-    for id in host_ids:
-        host_account_id.append(id)
-        type.append(choice(['card', 'paypal']))
-        is_default.append(True)
-    shuffle(host_ids)
-    for id in host_ids[:int(len(host_ids)/3)]:
-        host_account_id.append(id)
-        type.append(choice(['card', 'paypal']))
-        is_default.append(False)
+        host_account_id = list(host_ids) + list(extra_ids)
+        type = rand.choice(len(host_account_id), ['card', 'paypal']).tolist()
+        is_default = [True] * len(host_ids) + [False] * len(extra_ids)
 
+        # Zip data 
+        data = zip(host_account_id, type, is_default)
 
-    # Zip data 
-    data = zip(host_account_id, type, is_default)
-
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_PAYOUT_ACCOUNTS, data)
-    conn.commit()
-    conn.close()
+        # Finally insert the data
+        ids = _insert_parents(cur, 'payout_accounts', data, use_copy)
+    world['payout_accounts'].extend(
+        id=ids, host_account_id=host_account_id, is_default=is_default
+    )
 
     # Test and log
-    logger.info("Sample data inserted into payout_accounts table:")
-    logger.info(get_tbl_contents_as_str('payout_accounts'))
+    _log_summary('payout_accounts')
 
 # 16 +17
-def gen_dummydata_bookings_and_payments():
+def gen_dummydata_bookings_and_payments(use_copy: bool = True):
     """
-    Fill dummy data for bookings table.
+    Fill dummy data for payments and bookings tables.
+
+    Stays of one accommodation never overlap (bookings_no_overlap), so the
+    exclusion constraint accepts every row without per-row availability
+    checks. Prices and first payment methods are resolved once (from memory or one
+    query each), payment and booking IDs come back from _insert_parents(), and both tables
+    are written in batches of seeds.booking_batch_size rows. Guests without a
+    payment method are never booked.
     """
-    guest_account_ids = []
-    accommodation_ids = []
-    start_dates = []
-    end_dates = []
-    payment_ids = []
-    statuses = []
-    created_ats = []
+    rand = _sampler('bookings')
 
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
-
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('bookings'))
-    cur.execute(query)
-    
-    # Get guest account ids
-    query = sqlrepo.FETCH_GUEST_IDS
-    cur.execute(query)
-    guest_account_ids = cur.fetchall()
-
-    # Get guest account ids
-    accommodation_ids = _fetch_table_ids('accommodations')
-
-    for accommodation_id in accommodation_ids:
-        create_booking = choice([True, False])
-        if create_booking:
-            # Generate random timestamp max 14 days before last date
-            start_date = None
-            while True:
-                start_date = _gen_rand_timestamp()
-                start_date = datetime.datetime.fromisoformat(start_date)
-                if start_date < (seeds.stop_timestamp - datetime.timedelta(days=14)):
-                    break
-            
-            # Select start and end date
-            duration = randint(1,14)
-            end_date = start_date + datetime.timedelta(days=duration)
-
-            # Get accommodation price per night
-            querry = sqlrepo.FETCH_ACCOMMODATION_PRICE
-            cur.execute(querry, (accommodation_id,))
-            accommodation_price = cur.fetchone()
-
-            # Calculate total payment ammount
-            amount_cents = accommodation_price[0] * duration
-
-            # Select guest id for booking
-            guest_id = choice(guest_account_ids)
-
-            # Create payment and insert it 
-            customer_id = guest_id[0]
-            status = choice(['payed', 'open', 'cancelled'])
-
-            # Get payment method where user id
-            while True:
-                querry = sqlrepo.FETCH_FIRST_PAYMENTMETHOD_ID_FOR_USER
-                cur.execute(querry, (guest_id,))
-                payment_method = cur.fetchone()
-                if payment_method:
-                    break
-            
-            # Insert payment
-            data = (customer_id, amount_cents, status, payment_method[0])
-            cur.execute(sqlrepo.INSERT_PAYMENTS, data)
-            payment_id = cur.fetchone()[0]
-
-            # Create booking status
-            booking_status = choice(['pending', 'confirmed', 'cancelled', 'completed'])
-
-            while True:
-                time_stamp = _gen_rand_timestamp()
-                if datetime.datetime.fromisoformat(time_stamp) < start_date:
-                    break
-            
-            guest_account_ids.append(guest_id)
-            accommodation_ids.append(accommodation_id)
-            start_dates.append(start_date)
-            end_dates.append(end_date)
-            payment_ids.append(payment_id)
-            statuses.append(booking_status)
-            created_ats.append(time_stamp)
-            
-    # Zip data 
-    data = zip(
-                guest_account_ids, 
-                accommodation_ids, 
-                start_dates, 
-                end_dates, 
-                payment_ids, 
-                statuses, 
-                created_ats
+    with _connection('bookings_and_payments') as conn:
+        cur = conn.cursor()
+
+        # Clear existing data
+        _clear_table(cur, 'payments')
+        _clear_table(cur, 'bookings')
+
+        # Nightly price per accommodation
+        if world.has_rows('accommodations'):
+            accommodations = world['accommodations']
+            price_by_accommodation = dict(
+                zip(accommodations.column('id'), accommodations.column('price_cents'))
+            )
+        else:
+            cur.execute(sqlrepo.FETCH_ACCOMMODATION_PRICES)
+            price_by_accommodation = dict(cur.fetchall())
+
+        # First payment method per customer
+        first_method_by_customer = {}
+        if world.has_rows('payment_methods'):
+            methods = world['payment_methods']
+            for method_id, customer_id in zip(methods.column('id'), methods.column('customer_id')):
+                first_method_by_customer.setdefault(customer_id, method_id)
+        else:
+            cur.execute(sqlrepo.FETCH_FIRST_PAYMENTMETHOD_PER_CUSTOMER)
+            first_method_by_customer = dict(cur.fetchall())
+
+        # Only guests that can pay are bookable
+        guest_ids = [
+            guest_id
+            for guest_id in _world_ids(cur, 'accounts', 'role', 'guest')
+            if guest_id in first_method_by_customer
+        ]
+        if not guest_ids:
+            logger.warning("No guest has a payment method; skipping bookings and payments.")
+            return
+
+        # Bookings per accommodation (at most one per day of the window),
+        # flattened to one accommodation id per booking
+        window_days = (seeds.stop_timestamp - seeds.start_timestamp).days
+        accommodation_pool = np.fromiter(price_by_accommodation, dtype=np.int64)
+        price_pool = np.fromiter(price_by_accommodation.values(), dtype=np.int64)
+        counts = np.minimum(
+            _fan_out(rand, 'bookings_per_accommodation', len(accommodation_pool)), window_days
+        )
+        booking_accommodations = np.repeat(accommodation_pool, counts)
+        booking_prices = np.repeat(price_pool, counts)
+
+        # Non-overlapping stays (bookings_no_overlap): each accommodation's
+        # window is split into one slot of whole days per booking, and every
+        # stay lies inside its own slot
+        slot_days = np.repeat(window_days // np.maximum(counts, 1), counts)
+        slot_ranks = np.arange(len(booking_accommodations)) - np.repeat(np.cumsum(counts) - counts, counts)
+        window_start = np.datetime64(seeds.start_timestamp, 's')
+
+        batch_size = seeds.booking_batch_size
+        for chunk, offset in enumerate(range(0, len(booking_accommodations), batch_size), start=1):
+            batch = booking_accommodations[offset:offset + batch_size]
+            n = len(batch)
+            rand = _sampler('bookings', chunk)
+
+            # Stay inside its slot and booking time before the stay
+            slots = slot_days[offset:offset + batch_size]
+            durations = rand.integers(n, 1, np.minimum(slots, seeds.max_booking_nights))
+            slack_seconds = (rand.uniform(n) * (slots - durations) * 86_400).astype(np.int64)
+            start_dates = (
+                window_start
+                + (slot_ranks[offset:offset + batch_size] * slots).astype("timedelta64[D]")
+                + slack_seconds.astype("timedelta64[s]")
+            )
+            end_dates = start_dates + durations.astype("timedelta64[D]")
+            created_ats = _gen_rand_timestamps(rand, n, stop=start_dates)
+
+            # Payment for the full stay
+            guests = rand.choice(n, guest_ids).tolist()
+            amounts = (booking_prices[offset:offset + batch_size] * durations).tolist()
+            methods = [first_method_by_customer[guest_id] for guest_id in guests]
+            payment_statuses = rand.choice(n, ['payed', 'open', 'cancelled']).tolist()
+            booking_statuses = rand.choice(
+                n, ['pending', 'confirmed', 'cancelled', 'completed']
+            ).tolist()
+
+            start_dates = to_datetimes(start_dates)
+            end_dates = to_datetimes(end_dates)
+            batch = batch.tolist()
+
+            # Payments first so bookings.payment_id references existing rows
+            payments = zip(guests, amounts, payment_statuses, methods)
+            payment_ids = _insert_parents(cur, 'payments', payments, use_copy)
+
+            bookings = zip(
+                guests,
+                batch,
+                start_dates,
+                end_dates,
+                payment_ids,
+                booking_statuses,
+                to_datetimes(created_ats),
+            )
+            booking_ids = _insert_parents(cur, 'bookings', bookings, use_copy)
+
+            world['payments'].extend(id=payment_ids, customer_id=guests, amount_cents=amounts)
+            world['bookings'].extend(
+                id=booking_ids,
+                accommodation_id=batch,
+                start_date=start_dates,
+                end_date=end_dates,
+                payment_id=payment_ids,
             )
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_BOOKINGS, data)
-    conn.commit()
-    conn.close()
 
     # Test and log
-    logger.info("Sample data inserted into bookings table:")
-    logger.info(get_tbl_contents_as_str('bookings'))
-    logger.info("Sample data inserted into payments table:")
-    logger.info(get_tbl_contents_as_str('payments'))
+    _log_summary('bookings')
+    _log_summary('payments')
 
 # 18
-def gen_dummydata_payouts():
+def gen_dummydata_payouts(use_copy: bool = True):
     """
     Fill dummy data for payouts table.
-    """
-    host_account_ids = []
-    payout_account_ids = []
-    booking_ids = []
-    amount_cents = []
-    currency = []
-    status = []
 
-    accommodation_ids = []
-    payment_ids = []
+    One INSERT ... SELECT over bookings ⋈ payments ⋈ accommodations ⋈ the
+    host's default payout account; currency and status are drawn per row
+    server-side from a seeded hash of the booking id. use_copy is accepted
+    for a uniform generator signature.
+    """
+    rand = _sampler('payouts')
 
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('payouts') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('payouts'))
-    cur.execute(query)
-    
-    # Get booking id and accomodation id and amount cents from bookings
-    q = sqlrepo.GET_PAYOUT_RELEVANTS_FROM_BOOKINGS
-    cur.execute(q)
-    rows = cur.fetchall()
-    for booking_id_, accommodation_id_, payment_id_ in rows:
-        booking_ids.append(booking_id_)
-        accommodation_ids.append(accommodation_id_)
-        payment_ids.append(payment_id_)
-
-    # Get ammount cents from payments with payment id 
-    for id in payment_ids:
-        q = sqlrepo.GET_AMMOUNT_CENTS_WITH_PAYMENT_ID
-        cur.execute(q, (id,))
-        amount_cents_ = cur.fetchone()
-        amount_cents.append(amount_cents_[0])
-
-    # Get host id for accomodation id 
-    for id in accommodation_ids:
-        q = sqlrepo.GET_HOST_ID_FROM_ACCOMMODATIONS
-        cur.execute(q, (id,))
-        host_id = cur.fetchone()
-        host_account_ids.append(host_id[0])
-
-    # Get payout account id for host id 
-    for id in host_account_ids:
-        q = sqlrepo.GET_PAYOUT_ACCOUNT_ID_WITH_HOST_ID
-        cur.execute(q, (id,))
-        payout_acc_id = cur.fetchone()
-        payout_account_ids.append(payout_acc_id[0])
-    
-    # Select currencies
-    for _ in host_account_ids:
-        currency.append(choice(seeds.currencies))
-    
-    # Select status
-    for _ in currency:
-        payout_status = ['pending', 'confirmed', 'cancelled', 'completed']
-        status.append(choice(payout_status))
-
-    # Zip data 
-    data = zip(
-                host_account_ids,
-                payout_account_ids,
-                booking_ids,
-                amount_cents,
-                currency,
-                status
-            )
+        # Clear existing data
+        _clear_table(cur, 'payouts')
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_PAYOUTS, data)
-    conn.commit()
-    conn.close()
+        # Single set-based statement, independent of booking volume
+        params = {
+            "currencies": list(seeds.currencies),
+            "statuses": list(seeds.payout_statuses),
+            "seed": _sql_seed(rand),
+        }
+        cur.execute(sqlrepo.INSERT_PAYOUTS_FROM_BOOKINGS, params)
+        logger.info(f"Inserted {cur.rowcount} payouts in one statement")
 
     # Test and log
-    logger.info("Sample data inserted into payouts table:")
-    logger.info(get_tbl_contents_as_str('payouts'))
+    _log_summary('payouts')
 
 # 19
-def gen_dummydata_accommodation_calendar():
+def gen_dummydata_accommodation_calendar(use_copy: bool = True):
     """
     Fill dummy data for accommodation_calendar table.
+
+    Builds the full accommodations × calendar_look_ahead grid (ending at
+    seeds.stop_timestamp) with one INSERT ... SELECT over generate_series
+    per month, written straight into that month's partition.
+    A day is blocked if any booking's night falls on it, i.e. start_date's
+    day <= day < end_date's day. Prices and minimum nights are seeded hashes
+    of (accommodation, day). use_copy is accepted for a uniform generator
+    signature.
     """
-    accommodation_id = []
-    days = []
-    is_blocked = []
-    price_addition_cents = []
-    min_nights = []
+    rand = _sampler('accommodation_calendar')
 
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
-
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('accommodation_calendar'))
-    cur.execute(query)
-
-    # Get guest account ids
-    accommodation_ids = _fetch_table_ids('accommodations')
-
-    # Fill the calendar for every accommodation
-    day_counter = seeds.stop_timestamp - datetime.timedelta(days=0) # fill the calendar only for the last 1 days
-    while day_counter <= seeds.stop_timestamp:
-        for id in accommodation_ids:
-            # Get booking dates for accommodations
-            q = sqlrepo.FETCH_BOOKING_DATES
-            cur.execute(q, (id,))
-            start_end = cur.fetchone()
-            if start_end:
-                start_date = start_end[0]
-                end_date = start_end[1]
-            else:
-                start_date = seeds.start_timestamp - datetime.timedelta(days=1)
-                end_date = seeds.stop_timestamp - datetime.timedelta(days=1)
-            # Add accomodation id to calendar
-            accommodation_id.append(id)
-
-            # Add day timestamp to calendar
-            days.append(day_counter)
-
-            # Check if booked
-            if (day_counter >= start_date and day_counter <= end_date):
-                is_blocked.append(True)
-            else:
-                is_blocked.append(False)
-
-            # Generate random price addition
-            price_addition_cents.append(randint(-500,500))
-
-            # Generate min. nights required for booking
-            min_nights.append(randint(2,7))
-
-        # Increase the counter
-        day_counter += datetime.timedelta(days=1)
-
-    # Zip data 
-    data = zip(
-                accommodation_id,
-                days,
-                is_blocked,
-                price_addition_cents,
-                min_nights
+    with _connection('accommodation_calendar') as conn:
+        cur = conn.cursor()
+
+        # Clear existing data
+        _clear_table(cur, 'accommodation_calendar')
+
+        # Calendar horizon: the last calendar_look_ahead days up to stop_timestamp
+        last_day = seeds.stop_timestamp.date()
+        first_day = last_day - datetime.timedelta(days=seeds.calendar_look_ahead - 1)
+
+        price_min, price_max = seeds.calendar_price_addition_range
+        nights_min, nights_max = seeds.calendar_min_nights_range
+        params = {
+            "price_min": price_min,
+            "price_span": price_max - price_min + 1,
+            "nights_min": nights_min,
+            "nights_span": nights_max - nights_min + 1,
+            "seed": _sql_seed(rand),
+        }
+
+        ensure_partitions(cur, 'accommodation_calendar', first_day, last_day)
+        row_count = 0
+        months = month_ranges(first_day, last_day)
+        for month_first, month_last in months:
+            query = sql.SQL(sqlrepo.INSERT_ACCOMMODATION_CALENDAR_GRID).format(
+                tbl=sql.Identifier(partition_name('accommodation_calendar', month_first))
             )
-
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_ACCOMMODATION_CALENDAR, data)
-    conn.commit()
-    conn.close()
+            cur.execute(query, {**params, "first_day": month_first, "last_day": month_last})
+            row_count += cur.rowcount
+        logger.info(
+            f"Inserted {row_count} calendar days ({first_day} to {last_day}) "
+            f"into {len(months)} monthly partitions"
+        )
 
     # Test and log
-    logger.info("Sample data inserted into accommodation_calendar table:")
-    logger.info(get_tbl_contents_as_str('accommodation_calendar'))
+    _log_summary('accommodation_calendar')
 
 # 20
-def gen_dummydata_accommodation_amenities():
+def gen_dummydata_accommodation_amenities(use_copy: bool = True):
     """
     Fill dummy data for accommodation_amenities table.
     """
-    accommodation_id = []
-    amenity_id = []
+    rand = _sampler('accommodation_amenities')
+
     # Insert data into SQL table
-    conn = db_connection()
-    cur = conn.cursor()
+    with _connection('accommodation_amenities') as conn:
+        cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('accommodation_amenities'))
-    cur.execute(query)
+        # Clear existing data
+        _clear_table(cur, 'accommodation_amenities')
 
-    # Get a list of all amenities ids
-    amenities_ids = _fetch_table_ids('amenities')
+        # Get a list of all amenities ids
+        amenities_ids = _world_ids(cur, 'amenities')
 
-    # Get guest account ids
-    accommodation_ids = _fetch_table_ids('accommodations')
+        # Get accommodation ids
+        accommodation_ids = _world_ids(cur, 'accommodations')
 
-    for id in accommodation_ids:
-        count = randint(2,3)
-        amenities_rand_list = sample(amenities_ids, count)
-        for am in amenities_rand_list:
-            accommodation_id.append(id)
-            amenity_id.append(am)
+        # Distinct amenities per accommodation
+        counts = _fan_out(rand, 'amenities_per_accommodation', len(accommodation_ids))
+        amenities_per_accommodation = rand.sample_rows(counts, amenities_ids)
 
-    # Zip data 
-    data = zip(
-                accommodation_id,
-                amenity_id
-            )
+        # Zip data 
+        data = [
+            (accommodation, amenity)
+            for accommodation, amenities in zip(accommodation_ids, amenities_per_accommodation)
+            for amenity in amenities
+        ]
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_ACCOMMODATION_AMENITIES, data)
-    conn.commit()
-    conn.close()
+        # Finally insert the data
+        bulk_insert(cur, 'accommodation_amenities', data, use_copy=use_copy)
 
     # Test and log
-    logger.info("Sample data inserted into accommodation_amenities table:")
-    logger.info(get_tbl_contents_as_str('accommodation_amenities'))
+    _log_summary('accommodation_amenities')
@@ -0,0 +1,157 @@
+"""
+partitions.py
+
+Monthly range partitions of the time-keyed tables.
+
+Provides:
+- PARTITION_KEYS: partitioned table → partition key column
+- partition_name(): <table>_pYYYYMM for a date/timestamp
+- month_ranges(): [first, last] day ranges per calendar month
+- ensure_partitions(): create missing partitions for a date range
+- ensure_future_partitions(): current month plus N months for all tables
+- write_partitioned(): COPY rows straight into their partitions
+- list_partitions(): partitions with bounds and sizes
+
+Partitions are created by the ensure_monthly_partitions() SQL function
+(src/sql/05_partition_time_series.sql). Writing to a partition directly
+skips per-row tuple routing on the parent and keeps each COPY on one heap.
+"""
+# Stdlib imports
+from collections import defaultdict
+from contextlib import nullcontext
+import datetime
+from pathlib import Path
+import sys
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Internal imports
+from src.db.connection import pooled_connection
+import src.db.sql_repo as sqlrepo
+from src.db.utils.bulk_copy import bulk_insert, copy_rows
+from src.utils.logger import logger
+
+
+
+# Partitioned tables and their RANGE partition key
+PARTITION_KEYS: Dict[str, str] = {
+    "accommodation_calendar": "day",
+    "messages": "sent_at",
+    "notifications": "sent_at",
+}
+
+
+
+# Naming and ranges
+def partition_name(table: str, value: datetime.date) -> str:
+    """
+    Name of the monthly partition of table that holds value (date or datetime).
+    """
+    return f"{table}_p{value.year:04d}{value.month:02d}"
+
+
+def _month_start(value: datetime.date) -> datetime.date:
+    return datetime.date(value.year, value.month, 1)
+
+
+def _next_month(month: datetime.date) -> datetime.date:
+    return datetime.date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def month_ranges(first: datetime.date, last: datetime.date) -> List[Tuple[datetime.date, datetime.date]]:
+    """
+    Split [first, last] (inclusive days) into per-month (first_day, last_day) ranges.
+    """
+    ranges = []
+    month = _month_start(first)
+    while month <= last:
+        following = _next_month(month)
+        ranges.append((max(month, first), min(following - datetime.timedelta(days=1), last)))
+        month = following
+    return ranges
+
+
+
+# Partition maintenance
+def ensure_partitions(cur, table: str, first: datetime.date, last: datetime.date) -> int:
+    """
+    Create the missing monthly partitions of table covering [first, last].
+
+    Returns:
+        int: number of partitions created.
+    """
+    cur.execute(sqlrepo.ENSURE_MONTHLY_PARTITIONS, (table, first, last))
+    created = cur.fetchone()[0]
+    if created:
+        logger.info(f"Created {created} partitions of {table} for {first} to {last}")
+    return created
+
+
+def ensure_future_partitions(months_ahead: int = 3, conn=None) -> Dict[str, int]:
+    """
+    Make sure every partitioned table has partitions from the current month
+    through months_ahead months ahead (run periodically, e.g. from cron).
+
+    Returns:
+        dict[str, int]: table → partitions created.
+    """
+    first = datetime.date.today()
+    last = first
+    for _ in range(months_ahead):
+        last = _next_month(last)
+
+    checkout = nullcontext(conn) if conn is not None else pooled_connection()
+    with checkout as conn, conn.cursor() as cur:
+        return {table: ensure_partitions(cur, table, first, last) for table in PARTITION_KEYS}
+
+
+def list_partitions(tables: Sequence[str] = None) -> List[Tuple[str, str, str, int]]:
+    """
+    Partitions of tables (default: all partitioned tables).
+
+    Returns:
+        list[tuple[str, str, str, int]]: (parent, partition, bound expression, bytes).
+    """
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_PARTITIONS, (list(tables or PARTITION_KEYS),))
+        return cur.fetchall()
+
+
+
+# Writing
+def write_partitioned(cur, table: str, rows: Iterable[Sequence], use_copy: bool = True) -> int:
+    """
+    Write rows of a partitioned table, creating missing partitions first.
+
+    With use_copy, rows are grouped by month of the partition key and
+    COPYed into each partition directly; otherwise the table's INSERT
+    template routes them through the parent.
+
+    Returns:
+        int: number of rows written.
+    """
+    columns = sqlrepo.COPY_COLUMNS[table]
+    key_index = columns.index(PARTITION_KEYS[table])
+
+    by_month = defaultdict(list)
+    for row in rows:
+        key = row[key_index]
+        by_month[(key.year, key.month)].append(row)
+    if not by_month:
+        return 0
+
+    months = sorted(by_month)
+    ensure_partitions(
+        cur, table, datetime.date(*months[0], 1), datetime.date(*months[-1], 1)
+    )
+
+    if not use_copy:
+        return bulk_insert(cur, table, (row for month in months for row in by_month[month]), use_copy=False)
+
+    return sum(
+        copy_rows(cur, partition_name(table, datetime.date(*month, 1)), columns, by_month[month])
+        for month in months
+    )
@@ -0,0 +1,123 @@
+"""
+reporting.py
+
+Refresh of the materialized reporting views.
+
+Provides:
+- REPORTING_VIEWS: the views created by src/sql/06_reporting_views.sql
+- refresh_views(): refresh views in parallel, CONCURRENTLY where possible,
+  and record each refresh in reporting_refresh_log
+- latest_refreshes(): last recorded refresh per view
+- format_refresh_report(): timing table for the log
+
+A view is refreshed CONCURRENTLY once it is populated: readers keep the
+old rows during the refresh and only changed rows are written. An
+unpopulated view (or blocking=True) gets a plain REFRESH, which locks out
+readers. Each view is refreshed and logged in its own transaction on its
+own pooled connection.
+"""
+# Stdlib imports
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+from pathlib import Path
+import sys
+import time
+from typing import List, Sequence, Tuple
+
+# Third-party imports
+from psycopg2 import sql
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Internal imports
+from src.db.connection import pooled_connection
+import src.db.sql_repo as sqlrepo
+from src.utils.logger import logger
+
+
+
+# Views in src/sql/06_reporting_views.sql
+REPORTING_VIEWS = (
+    "mv_host_revenue_monthly",
+    "mv_accommodation_occupancy_monthly",
+    "mv_accommodation_ratings",
+)
+
+
+
+# Refresh
+def _refresh_view(view: str, blocking: bool) -> Tuple[str, str, int, float]:
+    """
+    Refresh one view and log the refresh, in one transaction.
+    """
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_MATVIEW_POPULATED, (view,))
+        row = cur.fetchone()
+        if row is None:
+            raise ValueError(f"Unknown materialized view {view!r}")
+        concurrent = row[0] and not blocking
+
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        started = time.perf_counter()
+        query = sqlrepo.REFRESH_MATVIEW_CONCURRENTLY if concurrent else sqlrepo.REFRESH_MATVIEW
+        cur.execute(sql.SQL(query).format(view=sql.Identifier(view)))
+        seconds = time.perf_counter() - started
+
+        cur.execute(sql.SQL(sqlrepo.VERIFY_COUNT).format(tbl=sql.Identifier(view)))
+        row_count = cur.fetchone()[0]
+        cur.execute(
+            sqlrepo.INSERT_REFRESH_LOG,
+            (view, concurrent, row_count, started_at, round(seconds * 1000)),
+        )
+
+    return view, "concurrent" if concurrent else "blocking", row_count, seconds
+
+
+def refresh_views(
+    views: Sequence[str] = REPORTING_VIEWS, workers: int = 3, blocking: bool = False
+) -> List[Tuple[str, str, int, float]]:
+    """
+    Refresh views in parallel (one pooled connection per worker).
+
+    Args:
+        views: materialized views to refresh.
+        workers (int): concurrent refreshes.
+        blocking (bool): use plain REFRESH even for populated views
+            (faster for large changes, but blocks readers).
+
+    Returns:
+        list[tuple[str, str, int, float]]: (view, mode, rows, seconds) per view.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_refresh_view, view, blocking) for view in views]
+        report = [future.result() for future in futures]
+
+    logger.info(format_refresh_report(report))
+    return report
+
+
+def latest_refreshes() -> List[Tuple]:
+    """
+    Last recorded refresh per view.
+
+    Returns:
+        list[tuple]: (view, concurrent, rows, started_at, duration_ms).
+    """
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_LATEST_REFRESHES)
+        return cur.fetchall()
+
+
+def format_refresh_report(report: Sequence[Tuple[str, str, int, float]]) -> str:
+    """
+    Render (view, mode, rows, seconds) rows as an aligned text table with a total.
+    """
+    width = max([len(view) for view, _, _, _ in report] + [len("total")])
+    lines = [
+        f"{view:<{width}}  {mode:<10} {rows:>10} rows {seconds:8.2f}s"
+        for view, mode, rows, seconds in report
+    ]
+    lines.append(f"{'total':<{width}}  {'':<10} {'':>15} {sum(s for *_, s in report):8.2f}s")
+    return "Reporting view refresh:\n" + "\n".join(lines)
@@ -1,9 +1,34 @@
+"""
+run_sql_files.py
+
+Versioned schema migrations for the SQL files in src/sql.
+
+Provides:
+- discover_migrations(): numbered NNN_name.sql files, ordered by version
+- check_applied(): refuse to continue if an applied file changed or vanished
+- baseline_legacy_schema(): record the files of the old fixed-list runner as
+  applied on databases it set up
+- run_sql_files(): apply all pending migrations, each in its own transaction
+- MigrationError: raised for any migration problem
+
+Applied versions are recorded with a SHA-256 checksum in the
+schema_migrations table, so a run only executes files that have not been
+applied yet. A failing migration is rolled back and raises instead of
+being logged and skipped.
+
+Databases set up by the old runner (a fixed list of 01_schema.sql and
+02_seed.sql) have the baseline schema but no schema_migrations rows. The
+first run detects them and records those files as applied, with their
+checksums, without executing them.
+"""
 # Stdlib imports
+from collections import namedtuple
+import hashlib
 from pathlib import Path
+import re
 import sys
-
-# Third-party imports
-import psycopg2
+import time
+from typing import Dict, List, Tuple
 
 # Path/bootstrap
 # Go two levels up (src/db → project root) so src.* imports work.
@@ -11,8 +36,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT))
 
 # Internal imports
-from src.db.connection import db_connection, check_connection
-from src.db.utils.db_introspect import fetch_db_schema_DfOutput
+import src.db.sql_repo as sqlrepo
 from src.utils.logger import logger
 
 
@@ -20,45 +44,195 @@ from src.utils.logger import logger
 # SQL configuration
 SQL_DIR = PROJECT_ROOT / "src" / "sql"
 
-FILES = [
-    "01_schema.sql",
-    "02_seed.sql"
-]
+# Migration file names: <version>_<name>.sql, e.g. 01_schema.sql
+MIGRATION_FILE_RE = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+# pg_advisory_lock key shared by all migration runners
+MIGRATION_LOCK_KEY = 7_262_001
+
+# Versions the old fixed-list runner applied, and a table they create
+LEGACY_VERSIONS = (1, 2)
+LEGACY_MARKER_TABLE = "accounts"
 
-# initial connectivity check, keep logic as-is
-check_connection()
-logger.info(f"Loading the following files to DB {FILES}")
+Migration = namedtuple("Migration", ["version", "name", "path", "checksum"])
+
+
+
+class MigrationError(RuntimeError):
+    """
+    A migration could not be discovered, verified or applied.
+    """
 
 
 
 # helpers
+def _checksum(path: Path) -> str:
+    """
+    SHA-256 hex digest of a file's bytes.
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def discover_migrations(sql_dir: Path = SQL_DIR) -> List[Migration]:
+    """
+    Find all migration files in sql_dir, ordered by version.
+
+    Raises:
+        MigrationError: if two files share a version number.
+    """
+    migrations = {}
+    for path in sorted(sql_dir.glob("*.sql")):
+        match = MIGRATION_FILE_RE.match(path.name)
+        if match is None:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(
+                f"Duplicate migration version {version}: "
+                f"{migrations[version].path.name} and {path.name}"
+            )
+        migrations[version] = Migration(version, match.group(2), path, _checksum(path))
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def check_applied(
+    migrations: List[Migration], applied: Dict[int, Tuple[str, str]]
+) -> List[Migration]:
+    """
+    Verify applied migrations against the files and return the pending ones.
+
+    Args:
+        migrations: discovered migrations (see discover_migrations).
+        applied: version → (name, checksum) from schema_migrations.
+
+    Raises:
+        MigrationError: if an applied file changed or is missing on disk.
+    """
+    on_disk = {migration.version: migration for migration in migrations}
+
+    missing = sorted(set(applied) - set(on_disk))
+    if missing:
+        raise MigrationError(f"Applied migrations missing on disk: {missing}")
+
+    for version, (name, checksum) in applied.items():
+        if on_disk[version].checksum != checksum:
+            raise MigrationError(
+                f"Applied migration {version}_{name} has changed on disk "
+                f"(checksum {checksum[:12]} → {on_disk[version].checksum[:12]}); "
+                "add a new migration instead of editing an applied one"
+            )
+
+    return [migration for migration in migrations if migration.version not in applied]
+
+
+def baseline_legacy_schema(cur, migrations: List[Migration]) -> List[Migration]:
+    """
+    Record the legacy versions as applied if the schema exists but nothing
+    is recorded yet; does nothing on fresh or already tracked databases.
+    Does not commit.
+
+    Returns:
+        list[Migration]: the migrations recorded (not executed).
+    """
+    cur.execute(sqlrepo.FETCH_APPLIED_MIGRATIONS)
+    if cur.fetchall():
+        return []
+    cur.execute(sqlrepo.TABLE_EXISTS, (LEGACY_MARKER_TABLE,))
+    if not cur.fetchone()[0]:
+        return []
+
+    baselined = [migration for migration in migrations if migration.version in LEGACY_VERSIONS]
+    for migration in baselined:
+        cur.execute(
+            sqlrepo.INSERT_APPLIED_MIGRATION,
+            (migration.version, migration.name, migration.checksum, 0),
+        )
+    logger.info(
+        f"Existing schema without schema_migrations: recorded "
+        f"{[migration.path.name for migration in baselined]} as applied"
+    )
+    return baselined
+
+
 def _run_sql_file(conn, path: Path):
     """
     Execute the full contents of a .sql file in one cursor/transaction.
-    Commits after successful execution.
+    Does not commit; the caller commits together with the tracking row.
     """
     with conn.cursor() as cur, open(path, "r", encoding="utf-8") as f:
         cur.execute(f.read())
-    conn.commit()
 
 
 
 # main routine
-def run_sql_files():
-    conn = db_connection()
-    for fname in FILES:
-        try:
-            _run_sql_file(conn, SQL_DIR / fname)
-            logger.info(f"Ran {fname} without errors")
-        except psycopg2.Error as e:
-            logger.exception(e)
-    conn.close()
+def run_sql_files(sql_dir: Path = SQL_DIR) -> List[Migration]:
+    """
+    Apply all pending migrations from sql_dir in version order.
+
+    Each migration runs in its own transaction together with its
+    schema_migrations row; an advisory lock keeps concurrent runners apart.
 
-    # run schema introspection at the end
-    fetch_db_schema_DfOutput()
+    Returns:
+        list[Migration]: the migrations applied by this run.
+
+    Raises:
+        MigrationError: on changed/missing applied files or a failing migration.
+    """
+    from src.db.connection import check_connection, pooled_connection
+
+    # Connectivity check only when actually running
+    check_connection()
+    migrations = discover_migrations(sql_dir)
+
+    applied_now = []
+    with pooled_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sqlrepo.LOCK_MIGRATIONS, (MIGRATION_LOCK_KEY,))
+            cur.execute(sqlrepo.CREATE_MIGRATIONS_TABLE)
+            baseline_legacy_schema(cur, migrations)
+            cur.execute(sqlrepo.FETCH_APPLIED_MIGRATIONS)
+            applied = {version: (name, checksum) for version, name, checksum in cur.fetchall()}
+        conn.commit()
+
+        try:
+            pending = check_applied(migrations, applied)
+            logger.info(
+                f"{len(applied)} migrations applied, {len(pending)} pending: "
+                f"{[migration.path.name for migration in pending]}"
+            )
+
+            for migration in pending:
+                started = time.perf_counter()
+                try:
+                    _run_sql_file(conn, migration.path)
+                    duration_ms = round((time.perf_counter() - started) * 1000)
+                    with conn.cursor() as cur:
+                        cur.execute(
+                            sqlrepo.INSERT_APPLIED_MIGRATION,
+                            (migration.version, migration.name, migration.checksum, duration_ms),
+                        )
+                    conn.commit()
+                except Exception as e:
+                    # also non-database errors, e.g. encoding a file for the server
+                    conn.rollback()
+                    raise MigrationError(f"Migration {migration.path.name} failed: {e}") from e
+
+                applied_now.append(migration)
+                logger.info(f"Applied {migration.path.name} in {duration_ms} ms")
+        finally:
+            with conn.cursor() as cur:
+                cur.execute(sqlrepo.UNLOCK_MIGRATIONS, (MIGRATION_LOCK_KEY,))
+            conn.commit()
+
+    # run schema introspection at the end (pandas is only needed here)
+    if applied_now:
+        from src.db.utils.db_introspect import fetch_db_schema_DfOutput
+        fetch_db_schema_DfOutput()
+
+    return applied_now
 
 
 
 # CLI entrypoint
 if __name__ == "__main__":
-    run_sql_files()
\ No newline at end of file
+    run_sql_files()
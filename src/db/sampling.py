@@ -0,0 +1,144 @@
+"""
+sampling.py
+
+Batched random primitives for the seed generators.
+
+Provides:
+- BatchSampler: wraps a numpy.random.Generator and draws whole columns at once
+  (timestamps, integer ranges, categorical picks, booleans, strings, UUIDs,
+  repeated-word phrases, per-row samples without replacement)
+- stream_seed(): independent, reproducible seed for one named stream and chunk
+
+All draws return NumPy arrays; call .tolist() before handing rows to psycopg2
+so values arrive as plain Python ints, bools, strings and datetimes.
+"""
+# Stdlib imports
+import datetime
+from typing import List, Sequence
+import zlib
+
+# Third-party imports
+import numpy as np
+
+
+
+# Hex alphabet for storage keys / UUID-like strings
+_HEX_DIGITS = np.array(list("0123456789abcdef"))
+
+
+
+class BatchSampler:
+    """
+    Column-at-a-time sampler on top of a numpy.random.Generator.
+    """
+    __slots__ = ("rng",)
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    # Scalars per row
+    def integers(self, n: int, low: int, high: int) -> np.ndarray:
+        """
+        n integers uniformly drawn from the inclusive range [low, high].
+        """
+        return self.rng.integers(low, high, size=n, endpoint=True)
+
+    def booleans(self, n: int, p: float = 0.5) -> np.ndarray:
+        """
+        n booleans, each True with probability p.
+        """
+        return self.rng.random(n) < p
+
+    def uniform(self, n: int) -> np.ndarray:
+        """
+        n floats uniformly drawn from [0, 1).
+        """
+        return self.rng.random(n)
+
+    def timestamps(self, n: int, start, stop) -> np.ndarray:
+        """
+        n datetime64[s] values uniformly drawn from [start, stop].
+
+        start/stop may be datetimes or datetime64 arrays of length n
+        (per-row bounds); stop < start yields start.
+        """
+        start = np.asarray(start, dtype="datetime64[s]")
+        stop = np.asarray(stop, dtype="datetime64[s]")
+        span = np.maximum((stop - start).astype(np.int64), 0)
+        offsets = np.floor(self.rng.random(n) * (span + 1)).astype(np.int64)
+        return start + offsets.astype("timedelta64[s]")
+
+    # Categorical
+    def choice(self, n: int, vocabulary: Sequence) -> np.ndarray:
+        """
+        n picks (with replacement) from vocabulary.
+        """
+        values = np.asarray(vocabulary, dtype=object)
+        return values[self.rng.integers(0, len(values), size=n)]
+
+    def permutation(self, values: Sequence) -> list:
+        """
+        Shuffled copy of values.
+        """
+        return [values[i] for i in self.rng.permutation(len(values))]
+
+    def sample_rows(self, counts: Sequence[int], pool: Sequence) -> List[list]:
+        """
+        For each count c, c distinct items from pool (without replacement
+        within a row). Counts larger than the pool are capped.
+        """
+        counts = np.minimum(np.asarray(counts, dtype=np.int64), len(pool))
+        if len(counts) == 0:
+            return []
+        keys = self.rng.random((len(counts), len(pool)))
+        order = np.argsort(keys, axis=1)
+        return [[pool[j] for j in order[i, :c]] for i, c in enumerate(counts)]
+
+    # Strings
+    def strings(self, n: int, alphabet: str, length: int) -> List[str]:
+        """
+        n random strings of fixed length over alphabet.
+        """
+        chars = np.array(list(alphabet))
+        grid = chars[self.rng.integers(0, len(chars), size=(n, length))]
+        return ["".join(row) for row in grid]
+
+    def uuids(self, n: int) -> List[str]:
+        """
+        n UUID-formatted (8-4-4-4-12) lowercase hex strings.
+        """
+        grid = _HEX_DIGITS[self.rng.integers(0, 16, size=(n, 32))]
+        return [
+            f"{''.join(r[:8])}-{''.join(r[8:12])}-{''.join(r[12:16])}-"
+            f"{''.join(r[16:20])}-{''.join(r[20:])}"
+            for r in grid
+        ]
+
+    def phrases(
+        self, n: int, vocabulary: Sequence[str], min_words: int, max_words: int, sep: str = " "
+    ) -> List[str]:
+        """
+        n phrases of min_words..max_words words from vocabulary joined by sep.
+        """
+        counts = self.integers(n, min_words, max_words)
+        words = self.choice(n * max_words, vocabulary).reshape(n, max_words)
+        return [sep.join(row[:c]) for row, c in zip(words, counts)]
+
+
+
+def stream_seed(master_seed: int, name: str, chunk: int = 0) -> np.random.SeedSequence:
+    """
+    Seed for stream name (e.g. a table) and chunk derived from master_seed.
+
+    Streams are keyed by a CRC32 of name rather than by creation order, so
+    the draws of one stream do not depend on which other streams ran before
+    it, on which thread, or in which process.
+    """
+    return np.random.SeedSequence(master_seed, spawn_key=(zlib.crc32(name.encode()), chunk))
+
+
+def to_datetimes(values: np.ndarray) -> List[datetime.datetime]:
+    """
+    Convert a datetime64[s] array to a list of datetime.datetime.
+    """
+    return np.asarray(values, dtype="datetime64[s]").astype(object).tolist()
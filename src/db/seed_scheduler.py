@@ -0,0 +1,215 @@
+"""
+seed_scheduler.py
+
+Run the seed generators in foreign-key dependency order.
+
+Provides:
+- GENERATOR_DEPS: generator name → generators whose rows it reads
+- clear_seed_tables(): truncate all generator-owned tables in one statement
+- seed_levels(): topological levels of generators (independent within a level)
+- run_generators(): execute all generators on a worker pool as soon as
+  their dependencies have finished, or sequentially in one transaction
+
+Every generator checks out its own connection from the process-wide pool
+(src.db.connection), so each worker holds one connection at a time. Wall-clock time is bounded by the critical path
+(accounts → payment_methods → bookings_and_payments → payouts) rather than
+by the sum of all generators.
+"""
+# Stdlib imports
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
+from pathlib import Path
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Third-party imports
+from psycopg2 import sql
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Internal imports
+from src.db import bulk_load as bulk_loader
+from src.db import gen_seed_data as gen
+from src.db.connection import pooled_connection
+import src.db.sql_repo as sqlrepo
+from src.utils.logger import logger
+
+
+
+# Declared dependencies (generator name without the gen_dummydata_ prefix)
+GENERATOR_DEPS: Dict[str, Tuple[str, ...]] = {
+    "accounts": (),
+    "credentials": ("accounts",),
+    "addresses": (),
+    "accommodations": ("accounts", "addresses"),
+    "images": (),
+    "payment_methods": ("accounts",),
+    "credit_cards": ("payment_methods",),
+    "paypal": ("payment_methods",),
+    "reviews": ("accounts", "accommodations"),
+    "conversations": (),
+    "messages": ("accounts", "conversations"),
+    "review_images": ("reviews", "images"),
+    "accommodation_images": ("accommodations", "images", "review_images"),
+    "notifications": ("accounts",),
+    "payout_accounts": ("accounts",),
+    "bookings_and_payments": ("accounts", "accommodations", "payment_methods"),
+    "payouts": ("bookings_and_payments", "payout_accounts"),
+    "accommodation_calendar": ("accommodations", "bookings_and_payments"),
+    "accommodation_amenities": ("accommodations",),
+}
+
+# Tables written by the generators (amenities is static seed data)
+SEED_TABLES = [
+    table for table in sqlrepo.COPY_COLUMNS if table != "amenities"
+]
+
+
+
+# Scheduling
+def seed_levels() -> List[List[str]]:
+    """
+    Group generators into topological levels.
+
+    Generators in the same level have no dependencies on each other.
+    Names within a level keep the declaration order of GENERATOR_DEPS.
+
+    Returns:
+        list[list[str]]: generator names, level by level.
+    """
+    order = list(GENERATOR_DEPS)
+    sorter = TopologicalSorter(GENERATOR_DEPS)
+    sorter.prepare()
+
+    levels = []
+    while sorter.is_active():
+        ready = sorted(sorter.get_ready(), key=order.index)
+        levels.append(ready)
+        sorter.done(*ready)
+    return levels
+
+
+def clear_seed_tables(conn=None):
+    """
+    Truncate all generator-owned tables in a single statement.
+
+    Doing this once up front avoids concurrent TRUNCATE ... CASCADE calls
+    that would take overlapping locks and could deadlock. With conn the
+    TRUNCATE joins that connection's open transaction.
+    """
+    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(
+        sql.SQL(", ").join(sql.Identifier(table) for table in SEED_TABLES)
+    )
+    if conn is not None:
+        with conn.cursor() as cur:
+            cur.execute(query)
+        return
+
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(query)
+
+
+def _run_generator(name: str, use_copy: bool) -> float:
+    """
+    Run one generator and return its duration in seconds.
+    """
+    started = time.perf_counter()
+    getattr(gen, f"gen_dummydata_{name}")(use_copy=use_copy)
+    return time.perf_counter() - started
+
+
+def _run_single_transaction(use_copy: bool) -> Dict[str, float]:
+    """
+    Run all generators sequentially on one connection in one transaction.
+
+    The bulk-load session profile (sqlrepo.BULK_LOAD_SESSION) applies for
+    the whole run, every generator runs inside its own savepoint, and the
+    run commits once at the end. Any failure rolls the whole run back.
+    """
+    durations = {}
+    with pooled_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                sqlrepo.BULK_LOAD_SESSION,
+                (gen.seeds.bulk_load_work_mem, gen.seeds.bulk_load_maintenance_work_mem),
+            )
+        clear_seed_tables(conn)
+        gen.world.reset()
+        gen.truncate_before_insert = False
+        gen.run_connection = conn
+        try:
+            for level in seed_levels():
+                for name in level:
+                    durations[name] = _run_generator(name, use_copy)
+                    logger.info(f"Generator {name} finished in {durations[name]:.2f}s")
+        finally:
+            gen.run_connection = None
+            gen.truncate_before_insert = True
+
+    logger.info("Seed run committed in a single transaction")
+    return durations
+
+
+def run_generators(
+    max_workers: int = 4,
+    use_copy: bool = True,
+    single_transaction: bool = False,
+    bulk_load: bool = False,
+) -> Dict[str, float]:
+    """
+    Run all seed generators on a thread pool in dependency order.
+
+    A generator is submitted as soon as all of its dependencies have
+    finished, so independent chains never wait on each other.
+
+    Args:
+        max_workers (int): concurrent generators (and connections).
+            1 runs everything sequentially in dependency order.
+        use_copy (bool): passed through to every generator.
+        single_transaction (bool): run everything sequentially on one
+            connection in one transaction (savepoint per generator,
+            bulk-load session profile); max_workers is ignored.
+        bulk_load (bool): drop secondary indexes and FKs of the seed tables
+            for the load and rebuild them afterwards (see src.db.bulk_load);
+            the rebuild runs on max_workers connections.
+
+    Returns:
+        dict[str, float]: generator name → duration in seconds.
+    """
+    if bulk_load:
+        with bulk_loader.secondary_objects_deferred(SEED_TABLES, workers=max_workers):
+            return run_generators(max_workers, use_copy, single_transaction)
+
+    if single_transaction:
+        return _run_single_transaction(use_copy)
+
+    clear_seed_tables()
+    gen.world.reset()
+    gen.truncate_before_insert = False
+
+    order = list(GENERATOR_DEPS)
+    sorter = TopologicalSorter(GENERATOR_DEPS)
+    sorter.prepare()
+
+    durations = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            running = {}
+            while sorter.is_active():
+                for name in sorted(sorter.get_ready(), key=order.index):
+                    running[pool.submit(_run_generator, name, use_copy)] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    # result() re-raises the generator's exception
+                    durations[name] = future.result()
+                    logger.info(f"Generator {name} finished in {durations[name]:.2f}s")
+                    sorter.done(name)
+    finally:
+        gen.truncate_before_insert = True
+
+    return durations
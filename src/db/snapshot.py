@@ -0,0 +1,231 @@
+"""
+snapshot.py
+
+Seeded-database snapshots as PostgreSQL template databases.
+
+Provides:
+- snapshot_key(): schema version/checksum + scale factor + seed of a dataset
+- template_name(): template database name for a key
+- current_key(): key for the migrations on disk and the given seed options
+- snapshot_exists(): True if a template for the key exists
+- create_snapshot(): copy the working database into a template
+- restore_snapshot(): recreate the working database from a template
+- list_snapshots(): all templates of the working database
+- SnapshotError: raised when no template matches a key
+
+CREATE DATABASE ... TEMPLATE copies the data files on the server, so a
+restore takes seconds instead of re-running migrations and generators.
+Both directions need the source database to be free of other sessions:
+the process-wide pool is closed and remaining backends are terminated
+first. Statements run in autocommit on config.DB_MAINTENANCE_NAME because
+CREATE/DROP DATABASE cannot run inside a transaction.
+"""
+# Stdlib imports
+from contextlib import contextmanager
+import hashlib
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+# Third-party imports
+from psycopg2 import sql
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Internal imports
+from src import config
+from src.db.connection import close_pool, db_connection
+import src.db.data_lists as seeds
+from src.db.run_sql_files import Migration, discover_migrations
+import src.db.sql_repo as sqlrepo
+from src.utils.logger import logger
+
+
+
+# PostgreSQL truncates identifiers beyond 63 bytes
+MAX_IDENTIFIER_LENGTH = 63
+TEMPLATE_INFIX = "_tpl_"
+
+
+
+class SnapshotError(RuntimeError):
+    """
+    No template database matches the requested snapshot key.
+    """
+
+
+
+# Keys and names
+def snapshot_key(
+    migrations: Sequence[Migration], scale_factor: float, master_seed: int
+) -> Dict:
+    """
+    Identify a seeded dataset by schema version, scale factor and seed.
+
+    The schema checksum covers every migration file, so editing the
+    schema yields a new key even without a new version number.
+    """
+    digest = hashlib.sha256("".join(m.checksum for m in migrations).encode()).hexdigest()
+    return {
+        "schema_version": migrations[-1].version if migrations else 0,
+        "schema_checksum": digest[:16],
+        "scale_factor": float(scale_factor),
+        "master_seed": int(master_seed),
+    }
+
+
+def template_name(db_name: str, key: Dict) -> str:
+    """
+    Template database name for key: <db_name>_tpl_v<version>_<hash>.
+    """
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:12]
+    suffix = f"{TEMPLATE_INFIX}v{key['schema_version']}_{digest}"
+    return db_name[: MAX_IDENTIFIER_LENGTH - len(suffix)] + suffix
+
+
+def current_key(scale_factor: float = None, master_seed: int = None) -> Dict:
+    """
+    Snapshot key for the migrations on disk; seed options default to src.db.data_lists.
+    """
+    return snapshot_key(
+        discover_migrations(),
+        seeds.scale_factor if scale_factor is None else scale_factor,
+        seeds.master_seed if master_seed is None else master_seed,
+    )
+
+
+
+# Helpers
+@contextmanager
+def _maintenance_cursor():
+    """
+    Autocommit cursor on the maintenance database.
+    """
+    conn = db_connection(config.DB_MAINTENANCE_NAME)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            yield cur
+    finally:
+        conn.close()
+
+
+def _database_exists(cur, name: str) -> bool:
+    cur.execute(sqlrepo.DATABASE_EXISTS, (name,))
+    return cur.fetchone()[0]
+
+
+def _disconnect(cur, name: str):
+    """
+    Close our pooled connections and terminate other sessions on database name.
+    """
+    close_pool()
+    cur.execute(sqlrepo.TERMINATE_DATABASE_BACKENDS, (name,))
+    terminated = cur.fetchone()[0]
+    if terminated:
+        logger.warning(f"Terminated {terminated} session(s) on {name}")
+
+
+def _drop_template(cur, name: str):
+    """
+    Drop a template database (templates must be unmarked first).
+    """
+    db = sql.Identifier(name)
+    cur.execute(sql.SQL(sqlrepo.UNMARK_DATABASE_TEMPLATE).format(db=db))
+    cur.execute(sql.SQL(sqlrepo.DROP_DATABASE).format(db=db))
+
+
+
+# Snapshot / restore
+def snapshot_exists(key: Dict = None) -> bool:
+    """
+    True if a template database for key (default: current_key()) exists.
+    """
+    key = key or current_key()
+    with _maintenance_cursor() as cur:
+        return _database_exists(cur, template_name(config.DB_NAME, key))
+
+
+def create_snapshot(key: Dict = None, replace: bool = False) -> str:
+    """
+    Copy the working database into the template database for key.
+
+    Args:
+        key (dict): snapshot key; current_key() if None. Must describe the
+            data currently in the working database.
+        replace (bool): rebuild an existing template instead of keeping it.
+
+    Returns:
+        str: the template database name.
+    """
+    key = key or current_key()
+    name = template_name(config.DB_NAME, key)
+    started = time.perf_counter()
+
+    with _maintenance_cursor() as cur:
+        if _database_exists(cur, name):
+            if not replace:
+                logger.info(f"Snapshot {name} already exists")
+                return name
+            _drop_template(cur, name)
+
+        _disconnect(cur, config.DB_NAME)
+        db = sql.Identifier(name)
+        cur.execute(sql.SQL(sqlrepo.CREATE_DATABASE_FROM_TEMPLATE).format(
+            db=db, template=sql.Identifier(config.DB_NAME)
+        ))
+        cur.execute(sql.SQL(sqlrepo.COMMENT_ON_DATABASE).format(
+            db=db, comment=sql.Literal(json.dumps(key, sort_keys=True))
+        ))
+        cur.execute(sql.SQL(sqlrepo.MARK_DATABASE_TEMPLATE).format(db=db))
+
+    logger.info(f"Created snapshot {name} in {time.perf_counter() - started:.2f}s")
+    return name
+
+
+def restore_snapshot(key: Dict = None) -> Tuple[str, float]:
+    """
+    Drop the working database and recreate it from the template for key.
+
+    Raises:
+        SnapshotError: if no template exists for key.
+
+    Returns:
+        tuple[str, float]: template name and restore duration in seconds.
+    """
+    key = key or current_key()
+    name = template_name(config.DB_NAME, key)
+    started = time.perf_counter()
+
+    with _maintenance_cursor() as cur:
+        if not _database_exists(cur, name):
+            raise SnapshotError(f"No snapshot {name} for {key}; create one with 'snapshot' first")
+
+        _disconnect(cur, config.DB_NAME)
+        db = sql.Identifier(config.DB_NAME)
+        cur.execute(sql.SQL(sqlrepo.DROP_DATABASE).format(db=db))
+        cur.execute(sql.SQL(sqlrepo.CREATE_DATABASE_FROM_TEMPLATE).format(
+            db=db, template=sql.Identifier(name)
+        ))
+
+    seconds = time.perf_counter() - started
+    logger.info(f"Restored {config.DB_NAME} from {name} in {seconds:.2f}s")
+    return name, seconds
+
+
+def list_snapshots() -> List[Tuple[str, Dict, int]]:
+    """
+    All template databases of the working database.
+
+    Returns:
+        list[tuple[str, dict, int]]: (name, key, size in bytes).
+    """
+    prefix = (config.DB_NAME + TEMPLATE_INFIX).replace("_", r"\_")
+    with _maintenance_cursor() as cur:
+        cur.execute(sqlrepo.FETCH_SNAPSHOT_DATABASES, (prefix + "%",))
+        rows = cur.fetchall()
+    return [(name, json.loads(comment or "{}"), size) for name, comment, size in rows]
@@ -4,7 +4,7 @@ sql_repo.py
 Central store for SQL statements used by DB utilities.
 
 Principles:
-- Keep introspection queries generic and based on information_schema.
+- Keep introspection queries generic; whole-schema reads use pg_catalog in one query.
 - Do NOT format identifiers with f-strings; use psycopg2.sql.
 - For tables with auto-increment IDs, omit the id column in INSERTs.
 """
@@ -23,7 +23,8 @@ FETCH_TABLE_METADATA = """
         column_name,
         data_type,
         is_nullable,
-        column_default
+        column_default,
+        udt_name
     FROM information_schema.columns
     WHERE table_schema = 'public'
       AND table_name = %s
@@ -39,13 +40,346 @@ FETCH_TABLE_COLUMNS = """
     ORDER BY ordinal_position;
 """
 
+# Whole-schema catalog (public schema) as one JSON document: tables with
+# columns (information_schema-style data_type), primary key, FKs, indexes,
+# plus enum labels. Partitions are folded into their parent table.
+FETCH_SCHEMA_CATALOG = """
+    SELECT json_build_object(
+        'tables', COALESCE((
+            SELECT json_object_agg(t.relname, json_build_object(
+                'columns', (
+                    SELECT json_agg(json_build_object(
+                        'name', a.attname,
+                        'data_type', CASE WHEN ty.typtype = 'e' THEN 'USER-DEFINED'
+                                          ELSE format_type(a.atttypid, NULL) END,
+                        'udt_name', ty.typname,
+                        'is_nullable', CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END,
+                        'default', pg_get_expr(d.adbin, d.adrelid)
+                    ) ORDER BY a.attnum)
+                    FROM pg_attribute a
+                    JOIN pg_type ty ON ty.oid = a.atttypid
+                    LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+                    WHERE a.attrelid = t.oid
+                      AND a.attnum > 0
+                      AND NOT a.attisdropped
+                ),
+                'primary_key', COALESCE((
+                    SELECT json_agg(a.attname ORDER BY k.ord)
+                    FROM pg_constraint c
+                    CROSS JOIN unnest(c.conkey) WITH ORDINALITY AS k(attnum, ord)
+                    JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+                    WHERE c.conrelid = t.oid
+                      AND c.contype = 'p'
+                ), '[]'::json),
+                'foreign_keys', COALESCE((
+                    SELECT json_agg(json_build_object(
+                        'name', c.conname,
+                        'columns', (
+                            SELECT json_agg(a.attname ORDER BY k.ord)
+                            FROM unnest(c.conkey) WITH ORDINALITY AS k(attnum, ord)
+                            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+                        ),
+                        'references', c.confrelid::regclass::text,
+                        'definition', pg_get_constraintdef(c.oid)
+                    ) ORDER BY c.conname)
+                    FROM pg_constraint c
+                    WHERE c.conrelid = t.oid
+                      AND c.contype = 'f'
+                ), '[]'::json),
+                'indexes', COALESCE((
+                    SELECT json_agg(json_build_object(
+                        'name', i.relname,
+                        'primary', ix.indisprimary,
+                        'unique', ix.indisunique,
+                        'partial', ix.indpred IS NOT NULL,
+                        -- key columns in order; null for expression columns
+                        'columns', (
+                            SELECT json_agg(a.attname ORDER BY k.ord)
+                            FROM unnest(ix.indkey::int2[]) WITH ORDINALITY AS k(attnum, ord)
+                            LEFT JOIN pg_attribute a
+                                ON a.attrelid = ix.indrelid AND a.attnum = k.attnum AND k.attnum > 0
+                            WHERE k.ord <= ix.indnkeyatts
+                        ),
+                        'definition', pg_get_indexdef(ix.indexrelid)
+                    ) ORDER BY i.relname)
+                    FROM pg_index ix
+                    JOIN pg_class i ON i.oid = ix.indexrelid
+                    WHERE ix.indrelid = t.oid
+                ), '[]'::json)
+            ))
+            FROM pg_class t
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname = 'public'
+              AND t.relkind IN ('r', 'p')
+              AND NOT t.relispartition
+        ), '{}'::json),
+        'enums', COALESCE((
+            SELECT json_object_agg(typname, labels)
+            FROM (
+                SELECT t.typname, json_agg(e.enumlabel ORDER BY e.enumsortorder) AS labels
+                FROM pg_enum e
+                JOIN pg_type t ON t.oid = e.enumtypid
+                JOIN pg_namespace n ON n.oid = t.typnamespace
+                WHERE n.nspname = 'public'
+                GROUP BY t.typname
+            ) enums
+        ), '{}'::json)
+    );
+"""
+
+# Planner statistics for index size estimates: estimated rows per table and
+# per-column width in bytes (fixed length, else pg_stats average, else the
+# given default). Param: default width for unanalyzed variable-length columns.
+FETCH_INDEX_SIZING = """
+    SELECT c.relname,
+           CASE WHEN c.relkind = 'p' THEN (
+               SELECT COALESCE(sum(GREATEST(pc.reltuples, 0)), 0)
+               FROM pg_partition_tree(c.oid) p
+               JOIN pg_class pc ON pc.oid = p.relid
+               WHERE p.isleaf
+           ) ELSE GREATEST(c.reltuples, 0) END::bigint,
+           json_object_agg(
+               a.attname,
+               CASE WHEN a.attlen > 0 THEN a.attlen ELSE COALESCE(s.avg_width, %s) END
+           )
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    LEFT JOIN pg_stats s
+        ON s.schemaname = n.nspname AND s.tablename = c.relname AND s.attname = a.attname
+    WHERE n.nspname = 'public'
+      AND c.relkind IN ('r', 'p')
+    GROUP BY c.oid, c.relname, c.reltuples, c.relkind;
+"""
+
+# Cheap fingerprint of the public schema's DDL state (relations, columns,
+# constraints, enum labels); changes whenever the DDL does. "char" columns
+# (relkind, contype) need a ::text cast: text || "char" is ambiguous.
+FETCH_SCHEMA_FINGERPRINT = """
+    SELECT md5(COALESCE(string_agg(item, ',' ORDER BY item), ''))
+    FROM (
+        SELECT c.oid::text || ':' || c.relname || ':' || c.relkind::text AS item
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public'
+        UNION ALL
+        SELECT a.attrelid::text || ':' || a.attnum || ':' || a.attname || ':'
+               || a.atttypid || ':' || a.attnotnull || ':' || a.attisdropped
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public'
+          AND a.attnum > 0
+        UNION ALL
+        SELECT con.oid::text || ':' || con.conname || ':' || con.contype::text || ':' || con.convalidated
+        FROM pg_constraint con
+        JOIN pg_namespace n ON n.oid = con.connamespace
+        WHERE n.nspname = 'public'
+        UNION ALL
+        SELECT e.enumtypid::text || ':' || e.enumlabel || ':' || e.enumsortorder
+        FROM pg_enum e
+    ) items;
+"""
+
 DUMP_TABLE = """
     SELECT *
     FROM {};
 """
 
+DUMP_TABLE_EMPTY = """
+    SELECT *
+    FROM {}
+    LIMIT 0;
+"""
+
+# Snapshot-consistent export: the coordinator opens a repeatable-read
+# transaction and exports its snapshot; every worker imports it.
+BEGIN_SNAPSHOT_TRANSACTION = """
+    SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY;
+"""
+
+EXPORT_SNAPSHOT = """
+    SELECT pg_export_snapshot();
+"""
+
+IMPORT_SNAPSHOT = """
+    SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY;
+    SET TRANSACTION SNAPSHOT %s;
+"""
+
+# COPY (SELECT ...) also works for partitioned tables
+COPY_TABLE_TO_CSV = """
+    COPY (SELECT * FROM {}) TO STDOUT WITH (FORMAT csv, HEADER true);
+"""
+
+# Tables (partitioned parents, not their partitions) as of the exported snapshot
+FETCH_EXPORT_TABLE_NAMES = """
+    SELECT c.relname
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public'
+      AND c.relkind IN ('r', 'p')
+      AND NOT c.relispartition
+    ORDER BY c.relname;
+"""
+
+# Params: table names (text[]); largest first for load balancing
+FETCH_TABLE_SIZES = """
+    SELECT c.relname,
+           COALESCE(
+               (SELECT sum(pg_total_relation_size(p.relid)) FROM pg_partition_tree(c.oid) p),
+               pg_total_relation_size(c.oid)
+           )
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public'
+      AND c.relname = ANY(%s)
+    ORDER BY 2 DESC, 1;
+"""
+
+
+# 2. Schema migrations (src/db/run_sql_files.py)
+CREATE_MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name TEXT NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        applied_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        duration_ms INT NOT NULL
+    );
+"""
+
+FETCH_APPLIED_MIGRATIONS = """
+    SELECT version, name, checksum
+    FROM schema_migrations
+    ORDER BY version;
+"""
+
+INSERT_APPLIED_MIGRATION = """
+    INSERT INTO schema_migrations (version, name, checksum, duration_ms)
+    VALUES (%s, %s, %s, %s);
+"""
+
+# Param: table name; true if it exists in the search path
+TABLE_EXISTS = """
+    SELECT to_regclass(%s) IS NOT NULL;
+"""
+
+# Serialize concurrent runners; param: lock key (bigint)
+LOCK_MIGRATIONS = """
+    SELECT pg_advisory_lock(%s);
+"""
+
+UNLOCK_MIGRATIONS = """
+    SELECT pg_advisory_unlock(%s);
+"""
+
+
+# 3. Template-database snapshots (src/db/snapshot.py); run in autocommit
+# on the maintenance database, identifiers via psycopg2.sql
+DATABASE_EXISTS = """
+    SELECT EXISTS (SELECT 1 FROM pg_database WHERE datname = %s);
+"""
+
+FETCH_SNAPSHOT_DATABASES = """
+    SELECT d.datname, shobj_description(d.oid, 'pg_database'),
+           pg_database_size(d.oid)
+    FROM pg_database d
+    WHERE d.datname LIKE %s
+    ORDER BY d.datname;
+"""
+
+TERMINATE_DATABASE_BACKENDS = """
+    SELECT count(pg_terminate_backend(pid))
+    FROM pg_stat_activity
+    WHERE datname = %s AND pid <> pg_backend_pid();
+"""
+
+CREATE_DATABASE_FROM_TEMPLATE = """
+    CREATE DATABASE {db} TEMPLATE {template};
+"""
+
+DROP_DATABASE = """
+    DROP DATABASE IF EXISTS {db};
+"""
+
+# ALLOW_CONNECTIONS false keeps the template free of sessions that would block cloning
+MARK_DATABASE_TEMPLATE = """
+    ALTER DATABASE {db} WITH IS_TEMPLATE true ALLOW_CONNECTIONS false;
+"""
+
+UNMARK_DATABASE_TEMPLATE = """
+    ALTER DATABASE {db} WITH IS_TEMPLATE false;
+"""
+
+COMMENT_ON_DATABASE = """
+    COMMENT ON DATABASE {db} IS {comment};
+"""
+
+
+# 4. Materialized reporting views (src/db/reporting.py); identifiers via psycopg2.sql
+FETCH_MATVIEW_POPULATED = """
+    SELECT ispopulated
+    FROM pg_matviews
+    WHERE schemaname = current_schema()
+      AND matviewname = %s;
+"""
+
+REFRESH_MATVIEW = """
+    REFRESH MATERIALIZED VIEW {view};
+"""
+
+# Needs a populated view with a unique index; readers are not blocked
+REFRESH_MATVIEW_CONCURRENTLY = """
+    REFRESH MATERIALIZED VIEW CONCURRENTLY {view};
+"""
+
+INSERT_REFRESH_LOG = """
+    INSERT INTO reporting_refresh_log (view_name, concurrent, row_count, started_at, duration_ms)
+    VALUES (%s, %s, %s, %s, %s);
+"""
 
-# 2. Drop all data from a specific table
+# Latest refresh per view
+FETCH_LATEST_REFRESHES = """
+    SELECT DISTINCT ON (view_name)
+        view_name, concurrent, row_count, started_at, duration_ms
+    FROM reporting_refresh_log
+    ORDER BY view_name, started_at DESC;
+"""
+
+
+# 5. Bulk load via COPY (identifiers formatted with psycopg2.sql)
+COPY_FROM_STDIN = """
+    COPY {tbl} ({cols})
+    FROM STDIN;
+"""
+
+
+# 6. Reserve a contiguous ID range from a table's serial sequence.
+# Params: (table, table, n, n); returns the first reserved ID.
+RESERVE_ID_RANGE = """
+    SELECT setval(
+        pg_get_serial_sequence(%s, 'id'),
+        nextval(pg_get_serial_sequence(%s, 'id')) + %s - 1
+    ) - %s + 1;
+"""
+
+# 7. Generic INSERT for explicit column lists (identifiers via psycopg2.sql)
+INSERT_ROWS = """
+    INSERT INTO {tbl} ({cols})
+    VALUES ({vals});
+"""
+
+
+# 8. Multi-row INSERT returning the generated IDs (rows via execute_values: %s)
+INSERT_ROWS_RETURNING_IDS = """
+    INSERT INTO {tbl} ({cols})
+    VALUES %s
+    RETURNING id;
+"""
+
+
+# 9. Drop all data from a specific table
 DROP_ALL_TABLE_DATA = """
     TRUNCATE TABLE {}     
     RESTART IDENTITY 
@@ -53,7 +387,7 @@ DROP_ALL_TABLE_DATA = """
 """
 
 
-# 2. Retrieve ID column name
+# 10. Retrieve ID column name
 FETCH_ID_COLUMN_NAME = """
     SELECT a.attname
     FROM pg_index i, pg_attribute a
@@ -64,14 +398,138 @@ FETCH_ID_COLUMN_NAME = """
 """
 
 
-# 3. Retrieve ID's
+# 11. Bulk-load session profile for a single-transaction seed run (SET LOCAL:
+# reverts at commit/rollback). Params: work_mem, maintenance_work_mem.
+BULK_LOAD_SESSION = """
+    SET LOCAL synchronous_commit = off;
+    SELECT set_config('work_mem', %s, true),
+           set_config('maintenance_work_mem', %s, true);
+    SET CONSTRAINTS ALL DEFERRED;
+"""
+
+SAVEPOINT = """
+    SAVEPOINT {};
+"""
+
+RELEASE_SAVEPOINT = """
+    RELEASE SAVEPOINT {};
+"""
+
+ROLLBACK_TO_SAVEPOINT = """
+    ROLLBACK TO SAVEPOINT {};
+"""
+
+
+# 12. Bulk-load mode: secondary indexes and foreign keys of the seed tables.
+# Params: table names (text[]). Non-PK indexes, with the UNIQUE ('u') or
+# EXCLUDE ('x') constraint they back (NULLs for plain indexes).
+FETCH_SECONDARY_INDEXES = """
+    SELECT
+        t.relname AS table_name,
+        i.relname AS index_name,
+        -- partitioned indexes print as ON ONLY; rebuild them on all partitions
+        replace(pg_get_indexdef(ix.indexrelid), ' ON ONLY ', ' ON ') AS index_def,
+        con.conname AS constraint_name,
+        con.contype AS constraint_type,
+        pg_get_constraintdef(con.oid) AS constraint_def
+    FROM pg_index ix
+    JOIN pg_class i ON i.oid = ix.indexrelid
+    JOIN pg_class t ON t.oid = ix.indrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    LEFT JOIN pg_constraint con
+        ON con.conindid = ix.indexrelid
+       AND con.conrelid = ix.indrelid
+       AND con.contype IN ('u', 'x')
+    WHERE n.nspname = current_schema()
+      AND NOT ix.indisprimary
+      AND t.relname = ANY(%s)
+    ORDER BY t.relname, i.relname;
+"""
+
+# Params: table names (text[]). FKs defined on those tables; partitioned
+# tables cannot take NOT VALID FKs and are re-added validated.
+FETCH_FOREIGN_KEYS = """
+    SELECT
+        t.relname AS table_name,
+        con.conname AS constraint_name,
+        pg_get_constraintdef(con.oid) AS constraint_def,
+        t.relkind = 'p' AS partitioned
+    FROM pg_constraint con
+    JOIN pg_class t ON t.oid = con.conrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    WHERE n.nspname = current_schema()
+      AND con.contype = 'f'
+      AND t.relname = ANY(%s)
+    ORDER BY t.relname, con.conname;
+"""
+
+DROP_INDEX = """
+    DROP INDEX IF EXISTS {};
+"""
+
+DROP_CONSTRAINT = """
+    ALTER TABLE {tbl}
+    DROP CONSTRAINT IF EXISTS {name};
+"""
+
+# {definition} is pg_get_constraintdef() output
+ADD_CONSTRAINT_NOT_VALID = """
+    ALTER TABLE {tbl}
+    ADD CONSTRAINT {name} {definition} NOT VALID;
+"""
+
+VALIDATE_CONSTRAINT = """
+    ALTER TABLE {tbl}
+    VALIDATE CONSTRAINT {name};
+"""
+
+# Exclusion constraints build their own index and cannot be NOT VALID
+ADD_CONSTRAINT = """
+    ALTER TABLE {tbl}
+    ADD CONSTRAINT {name} {definition};
+"""
+
+ADD_UNIQUE_USING_INDEX = """
+    ALTER TABLE {tbl}
+    ADD CONSTRAINT {name} UNIQUE USING INDEX {idx};
+"""
+
+# Transaction-local index build settings.
+# Params: max_parallel_maintenance_workers, maintenance_work_mem.
+INDEX_BUILD_SESSION = """
+    SELECT set_config('max_parallel_maintenance_workers', %s, true),
+           set_config('maintenance_work_mem', %s, true);
+"""
+
+
+# 13. Bounded post-insert verification (identifiers via psycopg2.sql)
+VERIFY_COUNT = """
+    SELECT count(*)
+    FROM {tbl};
+"""
+
+VERIFY_MINMAX = """
+    SELECT count(*), {aggs}
+    FROM {tbl};
+"""
+
+VERIFY_SAMPLE = """
+    SELECT *
+    FROM {tbl}
+    ORDER BY {keys}
+    LIMIT %s;
+"""
+
+
+# 14. Retrieve ID's
 FETCH_IDS = """
     SELECT {col}
     FROM {tbl}
+    ORDER BY {col}
 """
 
 
-# 4. Retrieve host account ID's
+# 15. Retrieve host account ID's
 FETCH_HOST_IDS = """
     SELECT id
     FROM accounts
@@ -92,6 +550,13 @@ FETCH_FIRST_PAYMENTMETHOD_ID_FOR_USER = """
     LIMIT 1;
 """
 
+FETCH_FIRST_PAYMENTMETHOD_PER_CUSTOMER = """
+    SELECT DISTINCT ON (customer_id) customer_id, id
+    FROM payment_methods
+    WHERE customer_id IS NOT NULL
+    ORDER BY customer_id, id;
+"""
+
 FETCH_PAYMENT_ID_FOR_USER = """
     SELECT id
     FROM payments
@@ -104,11 +569,12 @@ FETCH_IMAGE_IDS_FROM_REVIEW_IMGS = """
 """
 
 
-# 5. Retrieve table ID's with where condition
+# 16. Retrieve table ID's with where condition (param: value of {where_col})
 FETCH_IDS_WHERE = """
     SELECT {col}
     FROM {tbl}
-    WHERE {where};
+    WHERE {where_col} = %s
+    ORDER BY {col};
 """
 FETCH_IMG_ID_FROM_REVIEW_IMGS = """
     SELECT image_id
@@ -116,7 +582,7 @@ FETCH_IMG_ID_FROM_REVIEW_IMGS = """
 """
 
 
-# 6. Get Accomodation prices
+# 17. Get Accomodation prices
 FETCH_ACCOMMODATION_PRICE = """
     SELECT price_cents
     FROM accommodations
@@ -124,7 +590,13 @@ FETCH_ACCOMMODATION_PRICE = """
 """
 
 
-# 7. Get Payout related stuff
+FETCH_ACCOMMODATION_PRICES = """
+    SELECT id, price_cents
+    FROM accommodations;
+"""
+
+
+# 18. Get Payout related stuff
 GET_PAYOUT_RELEVANTS_FROM_BOOKINGS = """
     SELECT id, accommodation_id, payment_id
     FROM bookings;
@@ -148,14 +620,157 @@ GET_PAYOUT_ACCOUNT_ID_WITH_HOST_ID = """
     WHERE host_account_id = %s;
 """
 
-# 8. Fetch booking dates for accommodation 
+# One payout per booking to the host's default (else first) payout account.
+# Params: currencies, statuses (text arrays), seed (bigint). Picks hash the
+# booking id with the seed, so they do not depend on row or plan order.
+INSERT_PAYOUTS_FROM_BOOKINGS = """
+    INSERT INTO payouts (
+        host_account_id,
+        payout_account_id,
+        booking_id,
+        amount_cents,
+        currency,
+        status
+    )
+    SELECT
+        a.host_account_id,
+        pa.id,
+        b.id,
+        p.amount_cents,
+        (%(currencies)s::text[])[
+            1 + mod(mod(hashint8extended(b.id, %(seed)s), cardinality(%(currencies)s::text[]))
+                    + cardinality(%(currencies)s::text[]), cardinality(%(currencies)s::text[]))::int
+        ],
+        (%(statuses)s::text[])[
+            1 + mod(mod(hashint8extended(b.id, %(seed)s + 1), cardinality(%(statuses)s::text[]))
+                    + cardinality(%(statuses)s::text[]), cardinality(%(statuses)s::text[]))::int
+        ]
+    FROM bookings b
+    JOIN payments p ON p.id = b.payment_id
+    JOIN accommodations a ON a.id = b.accommodation_id
+    JOIN (
+        SELECT DISTINCT ON (host_account_id) host_account_id, id
+        FROM payout_accounts
+        ORDER BY host_account_id, is_default DESC, id
+    ) pa ON pa.host_account_id = a.host_account_id
+    ORDER BY b.id;
+"""
+
+# 19. Fetch booking dates for accommodation 
 FETCH_BOOKING_DATES = """
     SELECT start_date, end_date
     FROM bookings
     WHERE accommodation_id = %s;
 """
 
-# 9. Table-specific INSERT templates (without ID columns)
+# Availability (src/db/availability.py). Stays are half-open [start, end)
+# tsranges; "status <> 'cancelled'" matches the predicate of the partial
+# bookings_no_overlap GiST index, so every probe is one index lookup.
+FETCH_CONFLICTING_BOOKINGS = """
+    SELECT id, lower(stay), upper(stay), status
+    FROM bookings
+    WHERE accommodation_id = %s
+      AND stay && tsrange(%s, %s, '[)')
+      AND status <> 'cancelled'
+    ORDER BY lower(stay);
+"""
+
+# Params: accommodation ids (int[]), starts, ends (timestamp[]); one row per
+# request in input order.
+CHECK_AVAILABILITY_BATCH = """
+    SELECT NOT EXISTS (
+        SELECT 1
+        FROM bookings b
+        WHERE b.accommodation_id = r.accommodation_id
+          AND b.stay && tsrange(r.start_date, r.end_date, '[)')
+          AND b.status <> 'cancelled'
+    )
+    FROM unnest(%s::int[], %s::timestamp[], %s::timestamp[])
+        WITH ORDINALITY AS r(accommodation_id, start_date, end_date, ord)
+    ORDER BY r.ord;
+"""
+
+# Active accommodations free for the whole stay. Params: start, end, and
+# candidate ids (int[]) or NULL for all.
+FETCH_AVAILABLE_ACCOMMODATIONS = """
+    SELECT a.id
+    FROM accommodations a
+    WHERE a.is_active
+      AND (%(ids)s::int[] IS NULL OR a.id = ANY(%(ids)s::int[]))
+      AND NOT EXISTS (
+          SELECT 1
+          FROM bookings b
+          WHERE b.accommodation_id = a.id
+            AND b.stay && tsrange(%(start)s, %(end)s, '[)')
+            AND b.status <> 'cancelled'
+      )
+    ORDER BY a.id;
+"""
+
+# Full calendar grid: accommodations × [first_day, last_day], blocked where a
+# booked night (start day inclusive, end day exclusive) falls on the day.
+# Price addition and min nights hash (accommodation, day) with seed (bigint).
+# {tbl} is accommodation_calendar or the partition holding [first_day, last_day].
+INSERT_ACCOMMODATION_CALENDAR_GRID = """
+    WITH days AS (
+        SELECT d::date AS day
+        FROM generate_series(%(first_day)s::date, %(last_day)s::date, interval '1 day') AS d
+    ),
+    booked AS (
+        SELECT DISTINCT b.accommodation_id, n::date AS day
+        FROM bookings b
+        CROSS JOIN LATERAL generate_series(
+            GREATEST(b.start_date::date, %(first_day)s::date),
+            LEAST(b.end_date::date - 1, %(last_day)s::date),
+            interval '1 day'
+        ) AS n
+        WHERE b.start_date < %(last_day)s::date + 1
+          AND b.end_date > %(first_day)s::date
+    )
+    INSERT INTO {tbl} (
+        accommodation_id,
+        day,
+        is_blocked,
+        price_addition_cents,
+        min_nights
+    )
+    SELECT
+        a.id,
+        days.day,
+        booked.accommodation_id IS NOT NULL,
+        %(price_min)s + mod(mod(hashtextextended(a.id || ':' || days.day, %(seed)s),
+                                %(price_span)s) + %(price_span)s, %(price_span)s)::int,
+        %(nights_min)s + mod(mod(hashtextextended(a.id || ':' || days.day, %(seed)s + 1),
+                                 %(nights_span)s) + %(nights_span)s, %(nights_span)s)::int
+    FROM accommodations a
+    CROSS JOIN days
+    LEFT JOIN booked
+        ON booked.accommodation_id = a.id
+       AND booked.day = days.day;
+"""
+
+# Monthly range partitions (src/sql/05_partition_time_series.sql).
+# Params: parent table (regclass), first day, last day; returns partitions created.
+ENSURE_MONTHLY_PARTITIONS = """
+    SELECT ensure_monthly_partitions(%s::regclass, %s::date, %s::date);
+"""
+
+# Params: parent table names (text[])
+FETCH_PARTITIONS = """
+    SELECT parent.relname,
+           child.relname,
+           pg_get_expr(child.relpartbound, child.oid),
+           pg_total_relation_size(child.oid)
+    FROM pg_inherits i
+    JOIN pg_class parent ON parent.oid = i.inhparent
+    JOIN pg_class child ON child.oid = i.inhrelid
+    WHERE parent.relname = ANY(%s)
+      AND parent.relkind = 'p'
+    ORDER BY parent.relname, child.relname;
+"""
+
+
+# 20. Table-specific INSERT templates (without ID columns)
 INSERT_PAYOUT_ACCOUNTS = """
     INSERT INTO payout_accounts (host_account_id, type, is_default)
     VALUES (%s, %s, %s);
@@ -320,3 +935,79 @@ INSERT_PAYPAL = """
     INSERT INTO paypal (payment_method_id, paypal_user_id, email)
     VALUES (%s, %s, %s);
 """
+
+
+# 21. Column lists for COPY (same order as the INSERT templates above)
+COPY_COLUMNS = {
+    "accounts": ("email", "first_name", "last_name", "role", "created_at"),
+    "credentials": ("account_id", "password_hash", "password_updated_at"),
+    "addresses": ("line1", "line2", "city", "postal_code", "country"),
+    "amenities": ("name", "category"),
+    "accommodations": (
+        "host_account_id", "title", "address_id", "price_cents", "is_active", "created_at",
+    ),
+    "accommodation_amenities": ("accommodation_id", "amenity_id"),
+    "images": ("mime", "storage_key", "created_at"),
+    "accommodation_images": (
+        "accommodation_id", "image_id", "sort_order", "is_cover", "caption", "room_tag",
+    ),
+    "accommodation_calendar": (
+        "accommodation_id", "day", "is_blocked", "price_addition_cents", "min_nights",
+    ),
+    "payment_methods": ("customer_id", "type", "created_at"),
+    "payments": ("customer_id", "amount_cents", "status", "payment_method_id"),
+    "bookings": (
+        "guest_account_id", "accommodation_id", "start_date", "end_date",
+        "payment_id", "status", "created_at",
+    ),
+    "reviews": ("accommodation_id", "author_account_id", "rating", "description", "created_at"),
+    "review_images": ("review_id", "image_id"),
+    "conversations": ("created_at",),
+    "messages": ("sender_id", "receiver_id", "conversation_id", "body", "sent_at", "is_read"),
+    "credit_cards": ("payment_method_id", "brand", "last4", "exp_month", "exp_year"),
+    "paypal": ("payment_method_id", "paypal_user_id", "email"),
+    "payout_accounts": ("host_account_id", "type", "is_default"),
+    "payouts": (
+        "host_account_id", "payout_account_id", "booking_id", "amount_cents", "currency", "status",
+    ),
+    "notifications": ("account_id", "payload", "sent_at"),
+}
+
+
+# 22. INSERT fallback per table (used when COPY is disabled or RETURNING is needed)
+INSERT_TEMPLATES = {
+    "accounts": INSERT_ACCOUNTS,
+    "credentials": INSERT_CREDENTIALS,
+    "addresses": INSERT_ADDRESSES,
+    "amenities": INSERT_AMENITIES,
+    "accommodations": INSERT_ACCOMMODATIONS,
+    "accommodation_amenities": INSERT_ACCOMMODATION_AMENITIES,
+    "images": INSERT_IMAGES,
+    "accommodation_images": INSERT_ACCOMMODATION_IMAGES,
+    "accommodation_calendar": INSERT_ACCOMMODATION_CALENDAR,
+    "payment_methods": INSERT_PAYMENT_METHODS,
+    "payments": INSERT_PAYMENTS,
+    "bookings": INSERT_BOOKINGS,
+    "reviews": INSERT_REVIEWS,
+    "review_images": INSERT_REVIEW_IMAGES,
+    "conversations": INSERT_CONVERSATIONS,
+    "messages": INSERT_MESSAGES,
+    "credit_cards": INSERT_CREDIT_CARDS,
+    "paypal": INSERT_PAYPAL,
+    "payout_accounts": INSERT_PAYOUT_ACCOUNTS,
+    "payouts": INSERT_PAYOUTS,
+    "notifications": INSERT_NOTIFICATIONS,
+}
+
+
+# 23. Key columns per table (primary key) for verification summaries
+VERIFY_KEY_COLUMNS = {
+    table: ("id",) for table in COPY_COLUMNS
+}
+VERIFY_KEY_COLUMNS.update({
+    "credentials": ("account_id",),
+    "accommodation_amenities": ("accommodation_id", "amenity_id"),
+    "accommodation_images": ("accommodation_id", "image_id"),
+    "accommodation_calendar": ("accommodation_id", "day"),
+    "review_images": ("review_id", "image_id"),
+})
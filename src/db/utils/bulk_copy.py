@@ -0,0 +1,175 @@
+"""
+bulk_copy.py
+
+Bulk writers for the seed generators.
+
+Provides:
+- copy_rows(): stream rows into a table via COPY ... FROM STDIN
+- insert_rows(): fall back to a per-table INSERT template (executemany)
+- bulk_insert(): dispatch between the two
+- insert_returning_ids(): batched multi-row INSERT ... RETURNING id, IDs in row order
+
+Rows are encoded in PostgreSQL's text COPY format into a spooled buffer,
+so small loads stay in memory and large loads spill to a temp file.
+"""
+# Stdlib imports
+import datetime
+import tempfile
+from typing import Iterable, List, Sequence
+
+# Third-party imports
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+# Internal imports
+import src.db.sql_repo as sqlrepo
+
+
+
+# Buffer configuration
+SPOOL_MAX_BYTES = 32 * 1024 * 1024  # spill to disk above 32 MB
+RETURNING_PAGE_SIZE = 5000  # rows per INSERT ... RETURNING statement
+
+# Characters that must be escaped in COPY text format
+_COPY_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+
+
+# Encoding helpers
+def _encode_value(value) -> str:
+    """
+    Encode a single Python value as a COPY text field.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _encode_row(row: Sequence) -> str:
+    """
+    Encode one row as a tab-separated, newline-terminated COPY line.
+    """
+    return "\t".join(_encode_value(value) for value in row) + "\n"
+
+
+
+# Writers
+def copy_rows(cur, table_name: str, columns: Sequence[str], rows: Iterable[Sequence]) -> int:
+    """
+    Stream rows into table_name via COPY ... FROM STDIN.
+
+    Args:
+        cur: open psycopg2 cursor.
+        table_name (str): target table.
+        columns (Sequence[str]): target columns, in row order.
+        rows (Iterable[Sequence]): row tuples matching columns.
+
+    Returns:
+        int: number of rows written.
+    """
+    row_count = 0
+    with tempfile.SpooledTemporaryFile(
+        max_size=SPOOL_MAX_BYTES, mode="w+", encoding="utf-8", newline=""
+    ) as buf:
+        for row in rows:
+            buf.write(_encode_row(row))
+            row_count += 1
+        buf.seek(0)
+
+        query = sql.SQL(sqlrepo.COPY_FROM_STDIN).format(
+            tbl=sql.Identifier(table_name),
+            cols=sql.SQL(", ").join(sql.Identifier(col) for col in columns),
+        )
+        cur.copy_expert(query, buf)
+
+    return row_count
+
+
+def insert_rows(cur, insert_query, rows: Iterable[Sequence]) -> int:
+    """
+    Insert rows one statement per row using an INSERT template from sql_repo.
+
+    Use this for tables whose INSERT needs RETURNING or other per-row logic.
+
+    Returns:
+        int: number of rows written.
+    """
+    rows = list(rows)
+    cur.executemany(insert_query, rows)
+    return len(rows)
+
+
+def bulk_insert(
+    cur,
+    table_name: str,
+    rows: Iterable[Sequence],
+    use_copy: bool = True,
+    with_ids: bool = False,
+) -> int:
+    """
+    Write rows into table_name with COPY, or with the table's INSERT template
+    from sql_repo when use_copy is False.
+
+    Column order is taken from sqlrepo.COPY_COLUMNS and matches the
+    corresponding INSERT_* template. With with_ids=True every row starts with
+    a pre-allocated "id" value.
+
+    Returns:
+        int: number of rows written.
+    """
+    columns = sqlrepo.COPY_COLUMNS[table_name]
+    if with_ids:
+        columns = ("id", *columns)
+
+    if use_copy:
+        return copy_rows(cur, table_name, columns, rows)
+
+    if not with_ids:
+        return insert_rows(cur, sqlrepo.INSERT_TEMPLATES[table_name], rows)
+
+    query = sql.SQL(sqlrepo.INSERT_ROWS).format(
+        tbl=sql.Identifier(table_name),
+        cols=sql.SQL(", ").join(sql.Identifier(col) for col in columns),
+        vals=sql.SQL(", ").join(sql.Placeholder() * len(columns)),
+    )
+    return insert_rows(cur, query, rows)
+
+
+def insert_returning_ids(
+    cur,
+    table_name: str,
+    rows: Iterable[Sequence],
+    page_size: int = RETURNING_PAGE_SIZE,
+) -> List[int]:
+    """
+    Insert rows (without id) into table_name with multi-row
+    INSERT ... VALUES ... RETURNING id, page_size rows per statement.
+
+    The serial sequence assigns IDs in VALUES order, so each page's IDs are
+    sorted to line up with its rows regardless of RETURNING order.
+
+    Returns:
+        list[int]: generated IDs, one per row in input order.
+    """
+    rows = list(rows)
+    columns = sqlrepo.COPY_COLUMNS[table_name]
+    query = sql.SQL(sqlrepo.INSERT_ROWS_RETURNING_IDS).format(
+        tbl=sql.Identifier(table_name),
+        cols=sql.SQL(", ").join(sql.Identifier(col) for col in columns),
+    )
+
+    ids = []
+    for offset in range(0, len(rows), page_size):
+        page = rows[offset:offset + page_size]
+        returned = execute_values(cur, query, page, page_size=len(page), fetch=True)
+        ids.extend(sorted(row[0] for row in returned))
+    return ids
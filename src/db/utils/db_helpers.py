@@ -3,10 +3,20 @@ db_helpers.py
 
 Utility functions for database operations, including:
 - printing all rows from a specified table for debugging purposes.
+- summarize_table(): bounded post-insert verification (count, min/max of
+  key columns, first N rows, or off) with one query per table.
 """
+from contextlib import nullcontext
+
 from psycopg2 import sql
 
-from src.db.connection import db_connection
+from src.db.connection import pooled_connection
+import src.db.sql_repo as sqlrepo
+
+
+
+# Supported verification summaries
+VERIFY_MODES = ("count", "minmax", "sample", "off")
 
 
 
@@ -15,27 +25,22 @@ def get_tbl_contents_as_str(table_name: str) -> str:
     Connects to the database, retrieves all rows from the specified table,
     and returns a formatted string.
 
+    Reads the whole table; use summarize_table() after bulk inserts.
+
     Args:
         table_name (str): name of the table to print.
 
     Returns:
         str: formatted string containing all table rows.
     """
-    conn = db_connection()
-    cur = conn.cursor()
-
-    q = sql.SQL("SELECT * FROM {}").format(
-        sql.Identifier(table_name),
-    )
-    cur.execute(q)
-    rows = cur.fetchall()
+    with pooled_connection() as conn, conn.cursor() as cur:
+        q = sql.SQL("SELECT * FROM {}").format(
+            sql.Identifier(table_name),
+        )
+        cur.execute(q)
+        rows = cur.fetchall()
 
-    result_string = f"Table: {table_name}\n"
-    for row in rows:
-        result_string += f"{row}\n"
-
-    cur.close()
-    conn.close()
+    result_string = f"Table: {table_name}\n" + "".join(f"{row}\n" for row in rows)
 
     return result_string
 
@@ -44,27 +49,84 @@ def get_tbl_contents_as_str_sorted_by(table_name: str, sort_by: str) -> str:
     Connects to the database, retrieves all rows from the specified table,
     and returns a formatted string.
 
+    Reads the whole table; use summarize_table() after bulk inserts.
+
     Args:
         table_name (str): name of the table to print.
 
     Returns:
         str: formatted string containing all table rows.
     """
-    conn = db_connection()
-    cur = conn.cursor()
+    with pooled_connection() as conn, conn.cursor() as cur:
+        q = sql.SQL("SELECT * FROM {} ORDER BY {}").format(
+            sql.Identifier(table_name),
+            sql.Identifier(sort_by),
+        )
+        cur.execute(q)
+        rows = cur.fetchall()
 
-    q = sql.SQL("SELECT * FROM {} ORDER BY {}").format(
-        sql.Identifier(table_name),
-        sql.Identifier(sort_by),
-    )
-    cur.execute(q)
-    rows = cur.fetchall()
+    result_string = f"Table: {table_name}\n" + "".join(f"{row}\n" for row in rows)
 
-    result_string = f"Table: {table_name}\n"
-    for row in rows:
-        result_string += f"{row}\n"
+    return result_string
+
+def summarize_table(
+    table_name: str, mode: str = "count", sample_rows: int = 5, conn=None
+) -> str:
+    """
+    Build a bounded verification summary of table_name with one query.
 
-    cur.close()
-    conn.close()
+    Modes:
+        count:  row count
+        minmax: row count plus min/max of the key columns
+        sample: the first sample_rows rows in key order (index scan)
+        off:    no query, returns an empty string
 
-    return result_string
\ No newline at end of file
+    Args:
+        table_name (str): table to summarize (must be in sqlrepo.VERIFY_KEY_COLUMNS
+            for "minmax" and "sample").
+        mode (str): one of VERIFY_MODES.
+        sample_rows (int): row limit for "sample".
+        conn: connection to query on (e.g. of an open seed transaction);
+            a pooled connection is checked out if None.
+
+    Returns:
+        str: summary text ("" for "off").
+    """
+    if mode not in VERIFY_MODES:
+        raise ValueError(f"Unknown verify mode {mode!r}; expected one of {VERIFY_MODES}")
+    if mode == "off":
+        return ""
+
+    tbl = sql.Identifier(table_name)
+    keys = sqlrepo.VERIFY_KEY_COLUMNS.get(table_name, ())
+
+    checkout = nullcontext(conn) if conn is not None else pooled_connection()
+    with checkout as conn, conn.cursor() as cur:
+        if mode == "count":
+            cur.execute(sql.SQL(sqlrepo.VERIFY_COUNT).format(tbl=tbl))
+            summary = f"Table: {table_name}: {cur.fetchone()[0]} rows"
+
+        elif mode == "minmax":
+            aggs = sql.SQL(", ").join(
+                sql.SQL("min({col}), max({col})").format(col=sql.Identifier(key))
+                for key in keys
+            )
+            cur.execute(sql.SQL(sqlrepo.VERIFY_MINMAX).format(tbl=tbl, aggs=aggs))
+            row_count, *bounds = cur.fetchone()
+            ranges = ", ".join(
+                f"{key} [{bounds[2 * i]} .. {bounds[2 * i + 1]}]" for i, key in enumerate(keys)
+            )
+            summary = f"Table: {table_name}: {row_count} rows; {ranges}"
+
+        else:
+            query = sql.SQL(sqlrepo.VERIFY_SAMPLE).format(
+                tbl=tbl,
+                keys=sql.SQL(", ").join(sql.Identifier(key) for key in keys),
+            )
+            cur.execute(query, (sample_rows,))
+            rows = cur.fetchall()
+            summary = f"Table: {table_name} (first {len(rows)} rows)\n" + "".join(
+                f"{row}\n" for row in rows
+            )
+
+    return summary
@@ -1,4 +1,19 @@
+"""
+db_introspect.py
+
+Schema introspection and table dumps.
+
+Provides:
+- fetch_schema_catalog(): whole public schema (tables, columns, types, PKs,
+  FKs, indexes, enums) from one pg_catalog query, cached on disk per schema
+  fingerprint
+- fetch_all_tbl_names() / fetch_db_schema_list() / fetch_db_schema_DfOutput():
+  table names, column names and column-metadata frames from the catalog
+- dtype mapping, streaming and in-memory table dumps (see below)
+"""
 # Stdlib imports
+import json
+import os
 import sys
 from pathlib import Path
 
@@ -16,56 +31,96 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 
 # Internal imports
-from src.db.connection import db_connection
+from src.db.connection import pooled_connection
 from src.db import sql_repo as sqlrepo
 
 
 
-# Table name discovery
-def fetch_all_tbl_names():
-    """
-    Retrieve all table names from the target schema.
+# Schema catalog cache
+SCHEMA_CACHE_DIR = PROJECT_ROOT / ".cache" / "schema"
+
+# Bump when FETCH_SCHEMA_CATALOG's output shape changes, so older cache files are not reused
+CATALOG_FORMAT = 2
+
+# Column-metadata frame layout (as produced by FETCH_TABLE_METADATA)
+METADATA_COLUMNS = ["attr_name", "data_type", "is_nullable", "default_value", "udt_name"]
+
+
+def fetch_schema_catalog(use_cache: bool = True) -> dict:
     """
-    # Connect to database
-    conn = db_connection()
-    cur = conn.cursor()
+    Return the public schema as a dict, read with one pg_catalog query.
 
-    # Fetch list of all table names
-    cur.execute(sqlrepo.FETCH_ALL_TABLE_NAMES)
-    result = cur.fetchall()
+    The result is cached in SCHEMA_CACHE_DIR/v<format>-<fingerprint>.json, where the
+    fingerprint (FETCH_SCHEMA_FINGERPRINT) changes with any DDL change, so a
+    stale cache is never used.
 
-    # Flatten and deduplicate
-    table_name_list = list({item[0] for item in result})
+    Returns:
+        dict: {"fingerprint": str,
+               "tables": {table: {"columns": [...], "primary_key": [...],
+                                  "foreign_keys": [{"name", "columns", "references",
+                                                    "definition"}],
+                                  "indexes": [{"name", "primary", "unique", "partial",
+                                               "columns", "definition"}]}},
+               "enums": {type_name: [labels]}}
+    """
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_SCHEMA_FINGERPRINT)
+        fingerprint = cur.fetchone()[0]
+
+        cache_path = SCHEMA_CACHE_DIR / f"v{CATALOG_FORMAT}-{fingerprint}.json"
+        if use_cache and cache_path.exists():
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        cur.execute(sqlrepo.FETCH_SCHEMA_CATALOG)
+        catalog = cur.fetchone()[0]
+
+    catalog["fingerprint"] = fingerprint
+    if use_cache:
+        # Write-then-rename so concurrent readers never see a partial file
+        SCHEMA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(catalog, f)
+        os.replace(tmp_path, cache_path)
+    return catalog
+
+
+def metadata_frame(columns: list) -> pd.DataFrame:
+    """
+    Build a column-metadata frame (METADATA_COLUMNS) from catalog column entries.
+    """
+    return pd.DataFrame(
+        data=[
+            (col["name"], col["data_type"], col["is_nullable"], col["default"], col["udt_name"])
+            for col in columns
+        ],
+        columns=METADATA_COLUMNS,
+    )
 
-    # Close cursor (connection intentionally left as in original logic)
-    cur.close()
 
-    # Return the table name list
-    return table_name_list
+
+# Table name discovery
+def fetch_all_tbl_names():
+    """
+    Retrieve all table names from the target schema.
+    """
+    return sorted(fetch_schema_catalog()["tables"])
 
 
 # Table column names discovery
 def fetch_db_schema_list():
-    # Connect to database
-    conn = db_connection()
-    cur = conn.cursor()
-
-    # Discover tables
-    table_name_list = fetch_all_tbl_names()
-
-    # Init dict: table_name → DataFrame
-    table_col_dict = {table_name: None for table_name in table_name_list}
+    """
+    Retrieve all tables and their column names (in column order).
 
-    # Fetch column metadata for each table
-    for table_name in table_name_list:
-        cur.execute(sqlrepo.FETCH_TABLE_COLUMNS, (table_name,))
-        result = cur.fetchall()
-        
-        # Append column names to table names
-        table_col_dict[table_name] = [column_name[0] for column_name in result]
-    
-    # Return the dictionary
-    return table_col_dict
+    Returns:
+        dict[str, list[str]]: mapping table_name → column names
+    """
+    tables = fetch_schema_catalog()["tables"]
+    return {
+        table_name: [col["name"] for col in table["columns"]]
+        for table_name, table in sorted(tables.items())
+    }
 
 
 
@@ -77,73 +132,190 @@ def fetch_db_schema_DfOutput():
     Returns:
         dict[str, pandas.DataFrame]: mapping table_name → column-metadata-DF
     """
-    # Connect to database
-    conn = db_connection()
-    cur = conn.cursor()
+    tables = fetch_schema_catalog()["tables"]
+    return {
+        table_name: metadata_frame(table["columns"])
+        for table_name, table in sorted(tables.items())
+    }
+
+
+
+# Column type mapping
+# information_schema data_type → pandas dtype; enums (USER-DEFINED) become
+# categoricals with the enum's labels, anything else stays object.
+PANDAS_DTYPES = {
+    "smallint": "Int32",
+    "integer": "Int32",
+    "bigint": "Int64",
+    "boolean": "boolean",
+    "real": "float32",
+    "double precision": "float64",
+    "date": "datetime64[ns]",
+    "timestamp without time zone": "datetime64[ns]",
+    "timestamp with time zone": "datetime64[ns, UTC]",
+}
+
+
+def enum_categories(enums: dict) -> dict:
+    """
+    Return enum type name → CategoricalDtype with the enum labels in sort order.
 
-    # Discover tables
-    table_name_list = fetch_all_tbl_names()
+    Args:
+        enums (dict): type name → labels, as in fetch_schema_catalog()["enums"].
+    """
+    return {
+        type_name: pd.CategoricalDtype(categories=values, ordered=True)
+        for type_name, values in enums.items()
+    }
 
-    # Init dict: table_name → DataFrame
-    table_df_dict = {table_name: None for table_name in table_name_list}
 
-    # Fetch column metadata for each table
-    for table_name in table_name_list:
-        cur.execute(sqlrepo.FETCH_TABLE_METADATA, (table_name,))
-        result = cur.fetchall()
+def pandas_dtypes(metadata: pd.DataFrame, enum_categories: dict) -> dict:
+    """
+    Map a column-metadata frame (see fetch_db_schema_DfOutput) to pandas dtypes.
 
-        df_columns = ["attr_name", "data_type", "is_nullable", "default_value"]
-        table_df_dict[table_name] = pd.DataFrame(data=result, columns=df_columns)
+    NOT NULL booleans become plain bool, nullable ones the nullable
+    "boolean" dtype; integers use nullable Int32/Int64 so NULLs survive.
 
-    # Close cursor (connection intentionally left as in original logic)
-    cur.close()
+    Returns:
+        dict[str, dtype]: column name → dtype, for mapped columns only.
+    """
+    dtypes = {}
+    for row in metadata.itertuples(index=False):
+        if row.data_type == "USER-DEFINED" and row.udt_name in enum_categories:
+            dtypes[row.attr_name] = enum_categories[row.udt_name]
+        elif row.data_type == "boolean" and row.is_nullable == "NO":
+            dtypes[row.attr_name] = "bool"
+        elif row.data_type in PANDAS_DTYPES:
+            dtypes[row.attr_name] = PANDAS_DTYPES[row.data_type]
+    return dtypes
+
+
+def fetch_table_dtypes(table: str) -> dict:
+    """
+    Look up the pandas dtypes of table's columns from the (cached) catalog.
+    """
+    catalog = fetch_schema_catalog()
+    metadata = metadata_frame(catalog["tables"][table]["columns"])
+    return pandas_dtypes(metadata, enum_categories(catalog["enums"]))
 
-    # Return mapping
-    return table_df_dict
 
+def build_frame(rows, column_names, dtypes: dict) -> pd.DataFrame:
+    """
+    Build a DataFrame from row tuples with catalog dtypes, indexed on the first column.
+    """
+    df = pd.DataFrame(columns=column_names, data=rows)
+    df = df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+    return df.set_index(column_names[0])
 
 
-# Full database dump
-def dump_database_contents():
+
+# Streaming dump configuration
+DUMP_ITERSIZE = 10_000  # rows per server round trip (named cursor itersize)
+DUMP_CHUNK_ROWS = 50_000  # rows per yielded chunk
+
+
+
+# Streaming table dump
+def iter_table_chunks(
+    table: str,
+    chunk_rows: int = DUMP_CHUNK_ROWS,
+    itersize: int = DUMP_ITERSIZE,
+    as_dataframe: bool = True,
+):
     """
-    Dump the contents of all discovered tables.
+    Stream one table in chunks through a server-side (named) cursor.
 
-    Builds two dicts internally:
-    - tbl_dump_dict: table_name → raw rows
-    - tbl_dump_df_dict: table_name → DataFrame with index on first column
+    Only one chunk is held in memory at a time; the pooled connection is
+    returned once the generator is exhausted or closed. DataFrame chunks
+    use the column dtypes from the catalog (fetch_table_dtypes).
 
-    The dicts are constructed to be consumed later in the pipeline.
+    Args:
+        table (str): table to dump.
+        chunk_rows (int): rows per yielded chunk.
+        itersize (int): rows fetched from the server per round trip.
+        as_dataframe (bool): yield DataFrames indexed on the first column
+            (True) or lists of row tuples (False).
+
+    Yields:
+        pandas.DataFrame | list[tuple]: consecutive chunks of the table.
     """
-    # Connect to database
-    conn = db_connection()
-    cur = conn.cursor()
+    query = sql.SQL(sqlrepo.DUMP_TABLE).format(sql.Identifier(table))
+    dtypes = fetch_table_dtypes(table) if as_dataframe else {}
+    with pooled_connection() as conn, conn.cursor(name=f"dump_{table}") as cur:
+        cur.itersize = itersize
+        cur.execute(query)
 
-    # Fetch all table names
-    table_name_list = fetch_all_tbl_names()
+        while True:
+            rows = cur.fetchmany(chunk_rows)
+            if not rows:
+                break
+            if not as_dataframe:
+                yield rows
+                continue
+            column_names = [desc[0] for desc in cur.description]
+            yield build_frame(rows, column_names, dtypes)
 
-    # Dict for raw dumps
-    tbl_dump_dict = {table_name: None for table_name in table_name_list}
 
-    # Dict for DataFrame dumps
-    tbl_dump_df_dict = {table: None for table in table_name_list}
+def stream_database_contents(chunk_rows: int = DUMP_CHUNK_ROWS, as_dataframe: bool = True):
+    """
+    Stream all discovered tables chunk by chunk.
 
-    # Fetch content per table
-    for table in table_name_list:
-        query = sql.SQL(sqlrepo.DUMP_TABLE).format(sql.Identifier(table))
-        cur.execute(query)
-        result = cur.fetchall()
+    Yields:
+        tuple[str, pandas.DataFrame | list[tuple]]: (table_name, chunk)
+    """
+    for table in fetch_all_tbl_names():
+        for chunk in iter_table_chunks(table, chunk_rows, as_dataframe=as_dataframe):
+            yield table, chunk
+
+
+def dump_database_to_dir(out_dir, chunk_rows: int = DUMP_CHUNK_ROWS) -> dict:
+    """
+    Write every table to out_dir/<table>.csv, appending chunk by chunk so
+    memory use does not grow with table size.
+
+    Returns:
+        dict[str, int]: table_name → rows written
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    row_counts = {}
+    for table in fetch_all_tbl_names():
+        path = out_dir / f"{table}.csv"
+        row_counts[table] = 0
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            for chunk in iter_table_chunks(table, chunk_rows):
+                chunk.to_csv(f, header=row_counts[table] == 0)
+                row_counts[table] += len(chunk)
+    return row_counts
 
-        # store raw rows
-        tbl_dump_dict[table] = result
 
-        # build DataFrame with column names
-        column_names = [desc[0] for desc in cur.description]
-        tbl_dump_df_dict[table] = (
-            pd.DataFrame(columns=column_names, data=result).set_index(column_names[0])
-        )
 
-    # Close cursor (connection intentionally left as in original logic)
-    cur.close()
+# Full database dump
+def dump_database_contents():
+    """
+    Dump the contents of all discovered tables into memory.
+
+    Tables are read through the streaming dump (iter_table_chunks) and
+    concatenated, so no raw row copy is kept next to the DataFrames. For
+    large databases use stream_database_contents() or dump_database_to_dir().
+
+    Returns:
+        dict[str, pandas.DataFrame]: table_name → DataFrame with index on first column
+    """
+    tbl_dump_df_dict = {}
+    for table in fetch_all_tbl_names():
+        chunks = list(iter_table_chunks(table))
+        if chunks:
+            tbl_dump_df_dict[table] = pd.concat(chunks)
+            continue
+
+        # Empty table: keep the column layout and dtypes
+        dtypes = fetch_table_dtypes(table)
+        with pooled_connection() as conn, conn.cursor() as cur:
+            cur.execute(sql.SQL(sqlrepo.DUMP_TABLE_EMPTY).format(sql.Identifier(table)))
+            column_names = [desc[0] for desc in cur.description]
+        tbl_dump_df_dict[table] = build_frame([], column_names, dtypes)
 
     # Return the dataframe dict for later use
     return tbl_dump_df_dict
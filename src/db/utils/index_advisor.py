@@ -0,0 +1,286 @@
+"""
+index_advisor.py
+
+Index advice for foreign keys and the lookups in sql_repo.
+
+Provides:
+- lookup_predicates(): equality lookups and DISTINCT ON orderings found in
+  single-table queries (statically, from the SQL text)
+- plan_indexes(): indexes that cover every unindexed FK and every lookup,
+  merged so one composite index serves several needs
+- estimate_btree_bytes(): B-tree size estimate from row count and key widths
+- advise(): plan_indexes() for the live catalog, with size estimates
+- format_advice() / advice_ddl(): report table and CREATE INDEX script
+
+A foreign key counts as indexed when some non-partial index starts with
+its columns (in any order); a lookup when some index starts with its
+equality columns followed by its ORDER BY columns. Size estimates use
+planner statistics (reltuples, pg_stats.avg_width), so run ANALYZE first
+for useful numbers.
+"""
+# Stdlib imports
+from collections import namedtuple
+import math
+from pathlib import Path
+import re
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Internal imports
+from src.db import sql_repo as sqlrepo
+
+
+
+# B-tree layout constants (default 8 kB block, leaf fillfactor 90)
+BLOCK_SIZE = 8192
+PAGE_OVERHEAD = 24 + 16          # page header + B-tree special space
+INDEX_TUPLE_OVERHEAD = 8 + 4     # IndexTupleData header + line pointer
+BTREE_FILLFACTOR = 0.9
+
+# Assumed width of variable-length columns without statistics
+DEFAULT_VARLENA_WIDTH = 32
+
+IndexSuggestion = namedtuple("IndexSuggestion", ["table", "columns", "reasons", "est_bytes"])
+
+# Single-table query with a WHERE clause, optionally ordered
+_LOOKUP_RE = re.compile(
+    r"FROM\s+(\w+)\s+WHERE\s+(.*?)(?:\s+ORDER\s+BY\s+(.*?))?\s*(?:LIMIT\b|;|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+# DISTINCT ON (...) ... FROM table ... ORDER BY ... (also inside a subquery)
+_DISTINCT_ON_RE = re.compile(
+    r"DISTINCT\s+ON\s*\((.*?)\).*?FROM\s+(\w+)\b.*?ORDER\s+BY\s+(.*?)\s*(?:\)|LIMIT\b|;|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+# column = %s / column = %(name)s
+_EQUALITY_PARAM_RE = re.compile(r"\b(\w+)\s*=\s*%(?:\(\w+\))?s")
+# ORDER BY item a plain B-tree can serve: bare column, optional direction
+_ORDER_COLUMN_RE = re.compile(r"^\w+(?:\s+(?:ASC|DESC))?$", re.IGNORECASE)
+
+
+
+# Helpers
+def _column_name(column: str) -> str:
+    """
+    Column name of an index column spec ("is_default DESC" → "is_default").
+    """
+    return column.split()[0]
+
+
+def _order_columns(order_by: str) -> List[str]:
+    """
+    Split an ORDER BY list into column specs, up to the first item that is
+    not a bare column (e.g. lower(stay)); later items cannot use the index
+    order either.
+    """
+    columns = []
+    for part in order_by.split(","):
+        spec = " ".join(part.split())
+        if not _ORDER_COLUMN_RE.match(spec):
+            break
+        columns.append(spec)
+    return columns
+
+
+def _maxalign(n: int) -> int:
+    return (n + 7) // 8 * 8
+
+
+def index_name(table: str, columns: Sequence[str]) -> str:
+    """
+    PostgreSQL-style default index name: <table>_<col>_..._idx (max 63 chars),
+    reduced to [a-z0-9_] so it is a valid unquoted identifier.
+    """
+    parts = [table] + [_column_name(c) for c in columns] + ["idx"]
+    name = "_".join(re.sub(r"[^a-z0-9_]+", "_", part.lower()).strip("_") for part in parts)
+    return name[:63]
+
+
+
+# Static scan of sql_repo
+def repo_queries() -> Dict[str, str]:
+    """
+    All SQL string constants of src.db.sql_repo by name.
+    """
+    return {
+        name: value for name, value in vars(sqlrepo).items()
+        if name.isupper() and isinstance(value, str)
+    }
+
+
+def lookup_predicates(queries: Dict[str, str]) -> List[Tuple[str, Tuple[str, ...], str]]:
+    """
+    Find index-friendly access paths in single-table queries.
+
+    - FROM t WHERE a = %s [AND b = %s] [ORDER BY c] → (a, b, c)
+    - DISTINCT ON (a) ... FROM t ... ORDER BY a, c  → (a, c)
+
+    Args:
+        queries: query name → SQL text.
+
+    Returns:
+        list[tuple[str, tuple[str, ...], str]]: (table, column specs, query name).
+    """
+    lookups = []
+    for name, query in queries.items():
+        for match in _LOOKUP_RE.finditer(query):
+            table, where, order_by = match.groups()
+            equal = _EQUALITY_PARAM_RE.findall(where)
+            if not equal:
+                continue
+            order = [c for c in _order_columns(order_by or "") if _column_name(c) not in equal]
+            lookups.append((table, tuple(equal + order), name))
+
+        for match in _DISTINCT_ON_RE.finditer(query):
+            _, table, order_by = match.groups()
+            order = _order_columns(order_by)
+            if order:
+                lookups.append((table, tuple(order), name))
+    return lookups
+
+
+
+# Planning
+def _covers(index_columns: Sequence[str], columns: Sequence[str], any_order: bool) -> bool:
+    """
+    True if an index on index_columns starts with columns.
+    """
+    names = [_column_name(c) for c in columns]
+    prefix = [_column_name(c) if c else None for c in index_columns[: len(names)]]
+    if any_order:
+        return len(prefix) == len(names) and set(prefix) == set(names)
+    return prefix == names
+
+
+def plan_indexes(
+    tables: Dict[str, Dict], lookups: Sequence[Tuple[str, Tuple[str, ...], str]]
+) -> List[IndexSuggestion]:
+    """
+    Plan the indexes needed for unindexed FKs and uncovered lookups.
+
+    Candidates are considered widest first, so a composite index for a
+    lookup also absorbs an FK on its leading column. Candidates already
+    covered by an existing index are dropped.
+
+    Args:
+        tables: catalog["tables"] from fetch_schema_catalog().
+        lookups: output of lookup_predicates(); unknown tables are ignored.
+
+    Returns:
+        list[IndexSuggestion]: sorted by table and columns; est_bytes is None.
+    """
+    candidates = []
+    for table, entry in tables.items():
+        for fk in entry["foreign_keys"]:
+            candidates.append(
+                (table, tuple(fk["columns"]), f"fk {fk['name']} → {fk['references']}", True)
+            )
+    for table, columns, query_name in lookups:
+        if table in tables:
+            candidates.append((table, columns, f"lookup {query_name}", False))
+    candidates.sort(key=lambda c: (-len(c[1]), c[0], c[1]))
+
+    planned: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+    for table, columns, reason, any_order in candidates:
+        existing = [
+            index["columns"] for index in tables[table]["indexes"]
+            if not index.get("partial") and index.get("columns")
+        ]
+        if any(_covers(index_columns, columns, any_order) for index_columns in existing):
+            continue
+
+        target = next(
+            (key for key in planned
+             if key[0] == table and _covers(key[1], columns, any_order)),
+            None,
+        )
+        if target is None:
+            target = (table, columns)
+            planned[target] = []
+        planned[target].append(reason)
+
+    return [
+        IndexSuggestion(table, columns, reasons, None)
+        for (table, columns), reasons in sorted(planned.items())
+    ]
+
+
+def estimate_btree_bytes(rows: int, key_widths: Sequence[int]) -> int:
+    """
+    Estimate the size of a freshly built B-tree index.
+
+    Args:
+        rows (int): indexed rows.
+        key_widths (Sequence[int]): average width in bytes of each key column.
+
+    Returns:
+        int: estimated size in bytes (metapage, leaf and inner pages).
+    """
+    entry = _maxalign(8 + sum(key_widths)) + 4
+    per_page = max(1, int((BLOCK_SIZE - PAGE_OVERHEAD) * BTREE_FILLFACTOR) // entry)
+    pages = 1 + max(1, math.ceil(rows / per_page))
+
+    # inner levels until a single root page remains
+    level = pages - 1
+    while level > 1:
+        level = math.ceil(level / per_page)
+        pages += level
+    return pages * BLOCK_SIZE
+
+
+
+# Live advice
+def advise(use_cache: bool = True) -> List[IndexSuggestion]:
+    """
+    Plan indexes for the current database and estimate their sizes.
+    """
+    from src.db.connection import pooled_connection
+    from src.db.utils.db_introspect import fetch_schema_catalog
+
+    catalog = fetch_schema_catalog(use_cache=use_cache)
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_INDEX_SIZING, (DEFAULT_VARLENA_WIDTH,))
+        sizing = {table: (rows, widths) for table, rows, widths in cur.fetchall()}
+
+    suggestions = plan_indexes(catalog["tables"], lookup_predicates(repo_queries()))
+    sized = []
+    for suggestion in suggestions:
+        rows, widths = sizing.get(suggestion.table, (0, {}))
+        key_widths = [
+            widths.get(_column_name(c), DEFAULT_VARLENA_WIDTH) for c in suggestion.columns
+        ]
+        sized.append(suggestion._replace(est_bytes=estimate_btree_bytes(rows, key_widths)))
+    return sized
+
+
+def advice_ddl(suggestions: Sequence[IndexSuggestion]) -> str:
+    """
+    CREATE INDEX statements for suggestions.
+    """
+    return "".join(
+        f"CREATE INDEX IF NOT EXISTS {index_name(s.table, s.columns)} "
+        f"ON {s.table} ({', '.join(s.columns)});\n"
+        for s in suggestions
+    )
+
+
+def format_advice(suggestions: Sequence[IndexSuggestion]) -> str:
+    """
+    Render suggestions as an aligned text table with a size total.
+    """
+    if not suggestions:
+        return "All foreign keys and sql_repo lookups are covered by an index."
+
+    rows = [
+        (f"{s.table} ({', '.join(s.columns)})", f"{(s.est_bytes or 0) / 2**20:9.2f} MiB", "; ".join(s.reasons))
+        for s in suggestions
+    ]
+    width = max(len(target) for target, _, _ in rows)
+    lines = [f"{target:<{width}}  {size}  {reasons}" for target, size, reasons in rows]
+    total = sum(s.est_bytes or 0 for s in suggestions) / 2**20
+    lines.append(f"{'total':<{width}}  {total:9.2f} MiB")
+    return f"{len(suggestions)} suggested indexes:\n" + "\n".join(lines)
@@ -0,0 +1,133 @@
+"""
+world_model.py
+
+In-memory model of the entities generated during a seed run.
+
+Provides:
+- EntityColumns: column-oriented store (array-backed IDs) for one table
+- WorldModel: one EntityColumns per generated table that later generators read
+- WORLD_SCHEMA: table → columns kept in memory besides the ID
+
+Generators record what they insert here, so downstream generators can sample
+parents from memory instead of re-reading IDs from the database.
+"""
+# Stdlib imports
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+
+# Columns kept per table (besides "id"); only what downstream generators need
+WORLD_SCHEMA: Dict[str, Tuple[str, ...]] = {
+    "accounts": ("role",),
+    "addresses": (),
+    "accommodations": ("host_account_id", "price_cents"),
+    "images": (),
+    "payment_methods": ("customer_id", "type"),
+    "reviews": (),
+    "review_images": ("image_id",),  # "id" holds review_id (no own PK)
+    "conversations": (),
+    "payout_accounts": ("host_account_id", "is_default"),
+    "payments": ("customer_id", "amount_cents"),
+    "bookings": ("accommodation_id", "start_date", "end_date", "payment_id"),
+}
+
+# Columns stored as compact int64 arrays instead of Python lists
+_INT_COLUMNS = {
+    "id",
+    "host_account_id",
+    "price_cents",
+    "customer_id",
+    "image_id",
+    "amount_cents",
+    "accommodation_id",
+    "payment_id",
+}
+
+
+
+class EntityColumns:
+    """
+    Column-oriented store for the generated rows of one table.
+    """
+    __slots__ = ("table", "columns")
+
+    def __init__(self, table: str, column_names: Sequence[str]):
+        self.table = table
+        self.columns = {
+            name: array("q") if name in _INT_COLUMNS else []
+            for name in ("id", *column_names)
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def extend(self, **columns: Iterable):
+        """
+        Append rows given as equally long column iterables.
+
+        Every column of the store must be passed.
+        """
+        if set(columns) != set(self.columns):
+            raise ValueError(
+                f"{self.table}: expected columns {sorted(self.columns)}, got {sorted(columns)}"
+            )
+        for name, values in columns.items():
+            self.columns[name].extend(values)
+
+    def clear(self):
+        """
+        Drop all stored rows.
+        """
+        for name, values in self.columns.items():
+            self.columns[name] = array("q") if name in _INT_COLUMNS else []
+
+    def column(self, name: str) -> Sequence:
+        """
+        Return one column (IDs via name="id").
+        """
+        return self.columns[name]
+
+    def ids_where(self, column: str, value) -> List[int]:
+        """
+        Return the IDs of all rows where column == value.
+        """
+        return [
+            row_id
+            for row_id, cell in zip(self.columns["id"], self.columns[column])
+            if cell == value
+        ]
+
+
+
+class WorldModel:
+    """
+    All entity stores of one seed run, keyed by table name.
+    """
+    __slots__ = ("tables",)
+
+    def __init__(self):
+        self.tables = {
+            table: EntityColumns(table, column_names)
+            for table, column_names in WORLD_SCHEMA.items()
+        }
+
+    def __getitem__(self, table: str) -> EntityColumns:
+        return self.tables[table]
+
+    def __contains__(self, table: str) -> bool:
+        return table in self.tables
+
+    def has_rows(self, table: str) -> bool:
+        """
+        True if table is modelled and has rows recorded in this run.
+        """
+        return table in self.tables and len(self.tables[table]) > 0
+
+    def reset(self, table: str = None):
+        """
+        Clear one table's store, or all stores when table is None.
+        """
+        targets = self.tables.values() if table is None else [self.tables[table]]
+        for entity in targets:
+            entity.clear()
@@ -1,36 +1,310 @@
-from db import gen_seed_data as gen
-from db import run_sql_files as setup
+"""
+main.py
 
+Command-line entry point for the data mart tooling.
 
-def main():
+Provides subcommands:
+- seed: apply pending SQL migrations and generate all seed data
+- migrate: apply pending SQL migrations only
+- reset: clear all generator-owned tables, or clone a fresh database from a snapshot
+- snapshot: seed once and keep the result as a template database
+- dump: write every table to disk (streamed CSV, or a parallel snapshot export)
+- introspect: print the schema catalog
+- partitions: create future monthly partitions (or list them)
+- refresh-views: refresh the materialized reporting views (CONCURRENTLY)
+- advise-indexes: report unindexed foreign keys and lookups, with size estimates
+- bench: time a seed run per generator
+
+Heavy modules (psycopg2, numpy, pandas, the generators) are imported inside
+the commands, and nothing touches the database until a command runs, so
+`--help` and argument errors return immediately.
+
+Usage:
+    python -m src.main seed --scale-factor 10 --workers 8
+"""
+# Stdlib imports
+from pathlib import Path
+import sys
+
+# Third-party imports
+import click
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+
+# Shared options
+def _seed_options(command):
     """
-    (1) Run all sql setup files.
-    (2) Generate and fill all seed data.
+    Attach the seed-run options shared by `seed` and `bench`.
+    """
+    options = [
+        click.option(
+            "--scale-factor",
+            type=float,
+            default=None,
+            help="Dataset scale factor (SF1, SF10, ...). Defaults to SEED_SCALE_FACTOR or 1.",
+        ),
+        click.option(
+            "--seed",
+            type=int,
+            default=None,
+            help="Master random seed; the same seed reproduces the same dataset. Defaults to SEED_MASTER_SEED or 0.",
+        ),
+        click.option(
+            "--verify",
+            type=click.Choice(["count", "minmax", "sample", "off"]),
+            default=None,
+            help="Post-insert summary per table. Defaults to SEED_VERIFY_MODE or count.",
+        ),
+        click.option(
+            "--workers",
+            type=int,
+            default=4,
+            show_default=True,
+            help="Generators run concurrently within one dependency level.",
+        ),
+        click.option(
+            "--single-transaction",
+            is_flag=True,
+            help="Seed sequentially in one transaction (savepoint per generator, bulk-load session settings).",
+        ),
+        click.option(
+            "--bulk-load",
+            is_flag=True,
+            help="Drop secondary indexes and FKs during the load, rebuild and validate them afterwards.",
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def _run_seed(scale_factor, seed, verify, workers, single_transaction, bulk_load) -> dict:
+    """
+    Apply the seed options, pending SQL migrations and all generators.
+
+    Returns:
+        dict[str, float]: generator name → duration in seconds.
     """
-    # Run SQL files
+    import src.db.data_lists as seeds
+    from src.db import run_sql_files as setup
+    from src.db import seed_scheduler as scheduler
+
+    # Apply options on the seeds module the generators read from
+    if scale_factor is not None:
+        seeds.scale_factor = scale_factor
+    if seed is not None:
+        seeds.master_seed = seed
+    if verify is not None:
+        seeds.verify_mode = verify
+
+    # Apply pending SQL migrations
     setup.run_sql_files()
 
-    # Geneerate and fill all seed data
-    gen.gen_dummydata_accounts()
-    gen.gen_dummydata_credentials()
-    gen.gen_dummydata_addresses()
-    gen.gen_dummydata_accommodations()
-    gen.gen_dummydata_images()
-    gen.gen_dummydata_payment_methods()
-    gen.gen_dummydata_credit_cards()
-    gen.gen_dummydata_paypal()
-    gen.gen_dummydata_reviews()
-    gen.gen_dummydata_conversations()
-    gen.gen_dummydata_messages()
-    gen.gen_dummydata_review_images()
-    gen.gen_dummydata_accommodation_images()
-    gen.gen_dummydata_notifications()
-    gen.gen_dummydata_payout_accounts()
-    gen.gen_dummydata_bookings_and_payments()
-    gen.gen_dummydata_payouts()
-    gen.gen_dummydata_accommodation_calendar()
-    gen.gen_dummydata_accommodation_amenities()
+    # Generate and fill all seed data in FK dependency order
+    return scheduler.run_generators(
+        max_workers=workers,
+        single_transaction=single_transaction,
+        bulk_load=bulk_load,
+    )
+
+
+
+# Commands
+@click.group()
+def cli():
+    """
+    Airbnb data mart tooling.
+    """
+
+
+@cli.command()
+@_seed_options
+def seed(**options):
+    """
+    (1) Apply pending sql migrations.
+    (2) Generate and fill all seed data.
+    """
+    _run_seed(**options)
+
+
+@cli.command()
+def migrate():
+    """
+    Apply pending SQL migrations from src/sql.
+    """
+    from src.db import run_sql_files as setup
+
+    applied = setup.run_sql_files()
+    for migration in applied:
+        click.echo(f"applied {migration.path.name}")
+    click.echo(f"{len(applied)} migration(s) applied")
+
+
+@cli.command()
+@click.option(
+    "--from-snapshot",
+    is_flag=True,
+    help="Recreate the database from the template snapshot instead of truncating.",
+)
+@click.option("--scale-factor", type=float, default=None, help="Snapshot to restore (default: SEED_SCALE_FACTOR).")
+@click.option("--seed", type=int, default=None, help="Snapshot to restore (default: SEED_MASTER_SEED).")
+def reset(from_snapshot, scale_factor, seed):
+    """
+    Clear all generator-owned tables (TRUNCATE ... RESTART IDENTITY),
+    or clone a fresh database from a snapshot.
+    """
+    if from_snapshot:
+        from src.db import snapshot
+
+        name, seconds = snapshot.restore_snapshot(snapshot.current_key(scale_factor, seed))
+        click.echo(f"Restored from {name} in {seconds:.2f}s")
+        return
+
+    from src.db import seed_scheduler as scheduler
+
+    scheduler.clear_seed_tables()
+    click.echo(f"Cleared {len(scheduler.SEED_TABLES)} tables")
+
+
+@cli.command(name="snapshot")
+@_seed_options
+@click.option("--replace", is_flag=True, help="Re-seed and rebuild an existing snapshot.")
+@click.option("--list", "list_only", is_flag=True, help="List existing snapshots and exit.")
+def snapshot_cmd(replace, list_only, **options):
+    """
+    Seed the database and store it as a template snapshot keyed by
+    schema version, scale factor and seed.
+    """
+    from src import config
+    from src.db import snapshot
+
+    if list_only:
+        for name, key, size in snapshot.list_snapshots():
+            click.echo(f"{name:<50} {size / 2**20:10.1f} MiB  {key}")
+        return
+
+    key = snapshot.current_key(options["scale_factor"], options["seed"])
+    if snapshot.snapshot_exists(key) and not replace:
+        click.echo(f"Snapshot {snapshot.template_name(config.DB_NAME, key)} already exists")
+        return
+
+    _run_seed(**options)
+    click.echo(f"Created snapshot {snapshot.create_snapshot(key, replace=replace)}")
+
+
+@cli.command()
+@click.argument("out_dir", type=click.Path(file_okay=False))
+@click.option(
+    "--parallel",
+    is_flag=True,
+    help="Snapshot-consistent parallel export (gzip CSV + manifest) instead of a streamed dump.",
+)
+@click.option("--workers", type=int, default=4, show_default=True, help="Parallel export jobs.")
+def dump(out_dir, parallel, workers):
+    """
+    Write every table to OUT_DIR.
+    """
+    if parallel:
+        from src.db.utils.db_export import export_database
+
+        manifest = export_database(out_dir, workers=workers)
+        row_counts = {table: entry["rows"] for table, entry in manifest["tables"].items()}
+    else:
+        from src.db.utils.db_introspect import dump_database_to_dir
+
+        row_counts = dump_database_to_dir(out_dir)
+
+    for table, rows in sorted(row_counts.items()):
+        click.echo(f"{table:<28} {rows:>12}")
+
+
+@cli.command()
+@click.option("--refresh", is_flag=True, help="Ignore the on-disk catalog cache.")
+@click.option("--as-json", is_flag=True, help="Print the full catalog as JSON.")
+def introspect(refresh, as_json):
+    """
+    Print the tables and columns of the schema catalog.
+    """
+    from src.db.utils.db_introspect import fetch_schema_catalog
+
+    catalog = fetch_schema_catalog(use_cache=not refresh)
+    if as_json:
+        import json
+
+        click.echo(json.dumps(catalog, indent=2))
+        return
+
+    for table, entry in sorted(catalog["tables"].items()):
+        columns = ", ".join(col["name"] for col in entry["columns"])
+        click.echo(f"{table}({columns})")
+
+
+@cli.command()
+@click.option("--months-ahead", type=int, default=3, show_default=True, help="Future months to keep partitioned.")
+@click.option("--list", "list_only", is_flag=True, help="List partitions instead of creating any.")
+def partitions(months_ahead, list_only):
+    """
+    Create missing monthly partitions through MONTHS_AHEAD months from now.
+    """
+    from src.db import partitions as partitioning
+
+    if list_only:
+        for parent, partition, bound, size in partitioning.list_partitions():
+            click.echo(f"{partition:<36} {size / 2**20:9.2f} MiB  {bound}")
+        return
+
+    for table, created in partitioning.ensure_future_partitions(months_ahead).items():
+        click.echo(f"{table:<28} {created:>4} partitions created")
+
+
+@cli.command(name="refresh-views")
+@click.option("--workers", type=int, default=3, show_default=True, help="Views refreshed in parallel.")
+@click.option("--blocking", is_flag=True, help="Plain REFRESH instead of CONCURRENTLY (blocks readers).")
+@click.option("--history", is_flag=True, help="Show the last recorded refresh per view and exit.")
+def refresh_views(workers, blocking, history):
+    """
+    Refresh the materialized reporting views and record the timings.
+    """
+    from src.db import reporting
+
+    if history:
+        for view, concurrent, rows, started_at, duration_ms in reporting.latest_refreshes():
+            mode = "concurrent" if concurrent else "blocking"
+            click.echo(f"{view:<36} {started_at:%Y-%m-%d %H:%M:%S}  {mode:<10} {rows:>10} rows {duration_ms:>8} ms")
+        return
+
+    click.echo(reporting.format_refresh_report(reporting.refresh_views(workers=workers, blocking=blocking)))
+
+
+@cli.command(name="advise-indexes")
+@click.option("--refresh", is_flag=True, help="Ignore the on-disk catalog cache.")
+@click.option("--ddl", is_flag=True, help="Print CREATE INDEX statements instead of the report.")
+def advise_indexes(refresh, ddl):
+    """
+    Report unindexed foreign keys and sql_repo lookups with estimated index sizes.
+    """
+    from src.db.utils import index_advisor
+
+    suggestions = index_advisor.advise(use_cache=not refresh)
+    click.echo(index_advisor.advice_ddl(suggestions) if ddl else index_advisor.format_advice(suggestions))
+
+
+@cli.command()
+@_seed_options
+def bench(**options):
+    """
+    Run a full seed and report the duration of every generator.
+    """
+    durations = _run_seed(**options)
+
+    for name, seconds in sorted(durations.items(), key=lambda item: -item[1]):
+        click.echo(f"{name:<28} {seconds:8.2f}s")
+    click.echo(f"{'total (sum)':<28} {sum(durations.values()):8.2f}s")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli()
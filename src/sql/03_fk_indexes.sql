@@ -0,0 +1,48 @@
+-- 03_fk_indexes.sql
+-- Indexes on foreign-key columns and the lookup paths in src/db/sql_repo.py
+-- (see src/db/utils/index_advisor.py). Without them every join on these
+-- columns and every ON DELETE CASCADE scans the referencing table.
+
+-- FKs covered by a PRIMARY KEY or UNIQUE constraint are left out:
+-- credentials.account_id, accommodation_amenities.accommodation_id,
+-- accommodation_images.accommodation_id, accommodation_calendar.accommodation_id,
+-- review_images.review_id, credit_cards/paypal.payment_method_id.
+
+-- Migrations run inside a transaction, so these are plain (locking) builds;
+-- use CREATE INDEX CONCURRENTLY by hand on a busy database.
+
+-- CORE TABLES
+CREATE INDEX IF NOT EXISTS accommodations_host_account_id_idx ON accommodations (host_account_id);
+CREATE INDEX IF NOT EXISTS accommodations_address_id_idx ON accommodations (address_id);
+CREATE INDEX IF NOT EXISTS accommodation_amenities_amenity_id_idx ON accommodation_amenities (amenity_id);
+CREATE INDEX IF NOT EXISTS accommodation_images_image_id_idx ON accommodation_images (image_id);
+
+-- BOOKINGS + REVIEWS
+-- (accommodation_id, start_date) also serves FETCH_BOOKING_DATES and date-range checks
+CREATE INDEX IF NOT EXISTS bookings_accommodation_id_start_date_idx ON bookings (accommodation_id, start_date);
+CREATE INDEX IF NOT EXISTS bookings_guest_account_id_idx ON bookings (guest_account_id);
+CREATE INDEX IF NOT EXISTS bookings_payment_id_idx ON bookings (payment_id);
+CREATE INDEX IF NOT EXISTS reviews_accommodation_id_idx ON reviews (accommodation_id);
+CREATE INDEX IF NOT EXISTS reviews_author_account_id_idx ON reviews (author_account_id);
+CREATE INDEX IF NOT EXISTS review_images_image_id_idx ON review_images (image_id);
+
+-- MESSAGING SYSTEM
+-- (conversation_id, sent_at) returns a conversation in message order
+CREATE INDEX IF NOT EXISTS messages_conversation_id_sent_at_idx ON messages (conversation_id, sent_at);
+CREATE INDEX IF NOT EXISTS messages_sender_id_idx ON messages (sender_id);
+CREATE INDEX IF NOT EXISTS messages_receiver_id_idx ON messages (receiver_id);
+
+-- PAYMENTS + METHODS
+-- (customer_id, id) serves FETCH_FIRST_PAYMENTMETHOD_ID_FOR_USER and the DISTINCT ON per customer
+CREATE INDEX IF NOT EXISTS payment_methods_customer_id_id_idx ON payment_methods (customer_id, id);
+CREATE INDEX IF NOT EXISTS payments_customer_id_idx ON payments (customer_id);
+CREATE INDEX IF NOT EXISTS payments_payment_method_id_idx ON payments (payment_method_id);
+
+-- PAYOUTS + NOTIFICATIONS
+-- matches the default-account pick in INSERT_PAYOUTS_FROM_BOOKINGS
+CREATE INDEX IF NOT EXISTS payout_accounts_host_account_id_is_default_id_idx
+    ON payout_accounts (host_account_id, is_default DESC, id);
+CREATE INDEX IF NOT EXISTS payouts_host_account_id_idx ON payouts (host_account_id);
+CREATE INDEX IF NOT EXISTS payouts_payout_account_id_idx ON payouts (payout_account_id);
+CREATE INDEX IF NOT EXISTS payouts_booking_id_idx ON payouts (booking_id);
+CREATE INDEX IF NOT EXISTS notifications_account_id_idx ON notifications (account_id);
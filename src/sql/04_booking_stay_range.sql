@@ -0,0 +1,22 @@
+-- 04_booking_stay_range.sql
+-- Range-typed stays for bookings, with double bookings rejected by the database.
+
+-- stay mirrors [start_date, end_date) as a tsrange (generated, so writers keep
+-- filling start_date/end_date). The exclusion constraint's GiST index answers
+-- "is accommodation X free during R" with one index probe (src/db/availability.py).
+-- Cancelled bookings do not block a stay; queries must repeat the
+-- status <> 'cancelled' predicate so the planner can use the partial index.
+
+-- btree_gist provides GiST equality for accommodation_id
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+ALTER TABLE bookings
+    ADD COLUMN stay TSRANGE GENERATED ALWAYS AS (tsrange(start_date, end_date, '[)')) STORED;
+
+ALTER TABLE bookings
+    ADD CONSTRAINT bookings_end_after_start CHECK (end_date > start_date);
+
+ALTER TABLE bookings
+    ADD CONSTRAINT bookings_no_overlap
+    EXCLUDE USING gist (accommodation_id WITH =, stay WITH &&)
+    WHERE (status <> 'cancelled');
@@ -0,0 +1,120 @@
+-- 05_partition_time_series.sql
+-- Monthly range partitions for the high-volume, time-keyed tables:
+-- accommodation_calendar (by day), messages and notifications (by sent_at).
+
+-- Partitions are named <table>_pYYYYMM. ensure_monthly_partitions() creates
+-- missing ones for a month range and is what src/db/partitions.py (seed
+-- generators, the 'partitions' CLI command) calls to keep future months
+-- available. There is no DEFAULT partition: rows outside every partition are
+-- rejected instead of silently piling up in one heap.
+
+-- A partitioned table's primary key must contain the partition key, so
+-- messages and notifications are keyed by (id, sent_at) and sent_at becomes
+-- NOT NULL. Existing rows are copied over (NULL sent_at → migration time).
+
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(parent REGCLASS, first_day DATE, last_day DATE)
+RETURNS INT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month DATE := date_trunc('month', first_day)::date;
+    partition_name TEXT;
+    created INT := 0;
+BEGIN
+    WHILE month <= last_day LOOP
+        partition_name := format('%s_p%s', parent::text, to_char(month, 'YYYYMM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                partition_name, parent, month, (month + interval '1 month')::date
+            );
+            created := created + 1;
+        END IF;
+        month := (month + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END;
+$$;
+
+
+-- ACCOMMODATION CALENDAR
+ALTER TABLE accommodation_calendar RENAME TO accommodation_calendar_unpartitioned;
+
+CREATE TABLE accommodation_calendar (
+    accommodation_id INT NOT NULL REFERENCES accommodations(id) ON DELETE CASCADE DEFERRABLE,
+    day DATE NOT NULL,
+    is_blocked BOOLEAN DEFAULT FALSE,
+    price_addition_cents INT,
+    min_nights INT DEFAULT 1
+) PARTITION BY RANGE (day);
+
+SELECT ensure_monthly_partitions('accommodation_calendar', min(day), max(day))
+FROM accommodation_calendar_unpartitioned;
+
+INSERT INTO accommodation_calendar
+SELECT accommodation_id, day, is_blocked, price_addition_cents, min_nights
+FROM accommodation_calendar_unpartitioned;
+
+DROP TABLE accommodation_calendar_unpartitioned;
+
+ALTER TABLE accommodation_calendar ADD PRIMARY KEY (accommodation_id, day);
+
+
+-- MESSAGES
+ALTER TABLE messages RENAME TO messages_unpartitioned;
+ALTER SEQUENCE messages_id_seq OWNED BY NONE;
+
+CREATE TABLE messages (
+    id INT NOT NULL DEFAULT nextval('messages_id_seq'),
+    sender_id INT REFERENCES accounts(id) ON DELETE CASCADE DEFERRABLE,
+    receiver_id INT REFERENCES accounts(id) ON DELETE CASCADE DEFERRABLE,
+    conversation_id INT REFERENCES conversations(id) ON DELETE CASCADE DEFERRABLE,
+    body TEXT NOT NULL,
+    sent_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    is_read BOOLEAN DEFAULT FALSE
+) PARTITION BY RANGE (sent_at);
+
+SELECT ensure_monthly_partitions('messages', min(COALESCE(sent_at, now()))::date, max(COALESCE(sent_at, now()))::date)
+FROM messages_unpartitioned;
+
+INSERT INTO messages
+SELECT id, sender_id, receiver_id, conversation_id, body, COALESCE(sent_at, CURRENT_TIMESTAMP), is_read
+FROM messages_unpartitioned;
+
+DROP TABLE messages_unpartitioned;
+ALTER SEQUENCE messages_id_seq OWNED BY messages.id;
+
+ALTER TABLE messages ADD PRIMARY KEY (id, sent_at);
+CREATE INDEX messages_conversation_id_sent_at_idx ON messages (conversation_id, sent_at);
+CREATE INDEX messages_sender_id_idx ON messages (sender_id);
+CREATE INDEX messages_receiver_id_idx ON messages (receiver_id);
+
+
+-- NOTIFICATIONS
+ALTER TABLE notifications RENAME TO notifications_unpartitioned;
+ALTER SEQUENCE notifications_id_seq OWNED BY NONE;
+
+CREATE TABLE notifications (
+    id INT NOT NULL DEFAULT nextval('notifications_id_seq'),
+    account_id INT REFERENCES accounts(id) DEFERRABLE,
+    payload JSON,
+    sent_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+) PARTITION BY RANGE (sent_at);
+
+SELECT ensure_monthly_partitions('notifications', min(COALESCE(sent_at, now()))::date, max(COALESCE(sent_at, now()))::date)
+FROM notifications_unpartitioned;
+
+INSERT INTO notifications
+SELECT id, account_id, payload, COALESCE(sent_at, CURRENT_TIMESTAMP)
+FROM notifications_unpartitioned;
+
+DROP TABLE notifications_unpartitioned;
+ALTER SEQUENCE notifications_id_seq OWNED BY notifications.id;
+
+ALTER TABLE notifications ADD PRIMARY KEY (id, sent_at);
+CREATE INDEX notifications_account_id_idx ON notifications (account_id);
+
+
+-- Current month plus three months ahead for live writes
+SELECT ensure_monthly_partitions(parent, current_date, (current_date + interval '3 months')::date)
+FROM unnest(ARRAY['accommodation_calendar', 'messages', 'notifications']::regclass[]) AS parent;
@@ -0,0 +1,76 @@
+-- 06_reporting_views.sql
+-- Materialized reporting views over the fact tables, refreshed by
+-- src/db/reporting.py ('refresh-views' CLI command).
+
+-- Every view has a unique index so it can be refreshed CONCURRENTLY
+-- (readers keep seeing the previous rows while the refresh runs; only
+-- changed rows are written). Views are created WITH DATA because a
+-- concurrent refresh needs a populated view. Each refresh is recorded in
+-- reporting_refresh_log.
+
+-- Host revenue per month of stay start; cancelled bookings excluded.
+-- gross_cents counts settled payments ('payed'), payout_cents all payouts.
+CREATE MATERIALIZED VIEW mv_host_revenue_monthly AS
+SELECT
+    a.host_account_id,
+    date_trunc('month', b.start_date)::date AS month,
+    count(*) AS bookings,
+    sum(b.end_date::date - b.start_date::date) AS nights,
+    COALESCE(sum(p.amount_cents) FILTER (WHERE p.status = 'payed'), 0) AS gross_cents,
+    COALESCE(sum(po.amount_cents), 0) AS payout_cents
+FROM bookings b
+JOIN accommodations a ON a.id = b.accommodation_id
+LEFT JOIN payments p ON p.id = b.payment_id
+LEFT JOIN payouts po ON po.booking_id = b.id
+WHERE b.status <> 'cancelled'
+GROUP BY a.host_account_id, date_trunc('month', b.start_date)::date
+WITH DATA;
+
+CREATE UNIQUE INDEX mv_host_revenue_monthly_key
+    ON mv_host_revenue_monthly (host_account_id, month);
+
+
+-- Calendar occupancy per accommodation and month (blocked days / days)
+CREATE MATERIALIZED VIEW mv_accommodation_occupancy_monthly AS
+SELECT
+    c.accommodation_id,
+    date_trunc('month', c.day)::date AS month,
+    count(*) AS days,
+    count(*) FILTER (WHERE c.is_blocked) AS blocked_days,
+    round(count(*) FILTER (WHERE c.is_blocked)::numeric / count(*), 4) AS occupancy_rate
+FROM accommodation_calendar c
+GROUP BY c.accommodation_id, date_trunc('month', c.day)::date
+WITH DATA;
+
+CREATE UNIQUE INDEX mv_accommodation_occupancy_monthly_key
+    ON mv_accommodation_occupancy_monthly (accommodation_id, month);
+
+
+-- Rating summary per reviewed accommodation
+CREATE MATERIALIZED VIEW mv_accommodation_ratings AS
+SELECT
+    r.accommodation_id,
+    count(*) AS reviews,
+    round(avg(r.rating), 2) AS avg_rating,
+    count(*) FILTER (WHERE r.rating <= 2) AS low_ratings,
+    max(r.created_at) AS last_review_at
+FROM reviews r
+GROUP BY r.accommodation_id
+WITH DATA;
+
+CREATE UNIQUE INDEX mv_accommodation_ratings_key
+    ON mv_accommodation_ratings (accommodation_id);
+
+
+-- Refresh history
+CREATE TABLE reporting_refresh_log (
+    id SERIAL PRIMARY KEY,
+    view_name TEXT NOT NULL,
+    concurrent BOOLEAN NOT NULL,
+    row_count BIGINT NOT NULL,
+    started_at TIMESTAMPTZ NOT NULL,
+    duration_ms INT NOT NULL
+);
+
+CREATE INDEX reporting_refresh_log_view_name_started_at_idx
+    ON reporting_refresh_log (view_name, started_at DESC);
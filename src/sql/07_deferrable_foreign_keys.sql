@@ -0,0 +1,38 @@
+-- 07_deferrable_foreign_keys.sql
+-- Make the foreign keys of 01_schema.sql DEFERRABLE (INITIALLY IMMEDIATE),
+-- so a bulk load may check them at commit with SET CONSTRAINTS ALL DEFERRED
+-- (sql_repo.BULK_LOAD_SESSION). Checks stay immediate everywhere else.
+
+-- accommodation_calendar, messages and notifications are left out: they
+-- were recreated by 05_partition_time_series.sql with DEFERRABLE FKs.
+
+-- CORE TABLES
+ALTER TABLE credentials ALTER CONSTRAINT credentials_account_id_fkey DEFERRABLE;
+ALTER TABLE accommodations ALTER CONSTRAINT accommodations_host_account_id_fkey DEFERRABLE;
+ALTER TABLE accommodations ALTER CONSTRAINT accommodations_address_id_fkey DEFERRABLE;
+ALTER TABLE accommodation_amenities ALTER CONSTRAINT accommodation_amenities_accommodation_id_fkey DEFERRABLE;
+ALTER TABLE accommodation_amenities ALTER CONSTRAINT accommodation_amenities_amenity_id_fkey DEFERRABLE;
+ALTER TABLE accommodation_images ALTER CONSTRAINT accommodation_images_accommodation_id_fkey DEFERRABLE;
+ALTER TABLE accommodation_images ALTER CONSTRAINT accommodation_images_image_id_fkey DEFERRABLE;
+
+-- PAYMENTS
+ALTER TABLE payment_methods ALTER CONSTRAINT payment_methods_customer_id_fkey DEFERRABLE;
+ALTER TABLE payments ALTER CONSTRAINT payments_customer_id_fkey DEFERRABLE;
+ALTER TABLE payments ALTER CONSTRAINT payments_payment_method_id_fkey DEFERRABLE;
+ALTER TABLE credit_cards ALTER CONSTRAINT credit_cards_payment_method_id_fkey DEFERRABLE;
+ALTER TABLE paypal ALTER CONSTRAINT paypal_payment_method_id_fkey DEFERRABLE;
+
+-- BOOKINGS + REVIEWS
+ALTER TABLE bookings ALTER CONSTRAINT bookings_guest_account_id_fkey DEFERRABLE;
+ALTER TABLE bookings ALTER CONSTRAINT bookings_accommodation_id_fkey DEFERRABLE;
+ALTER TABLE bookings ALTER CONSTRAINT bookings_payment_id_fkey DEFERRABLE;
+ALTER TABLE reviews ALTER CONSTRAINT reviews_accommodation_id_fkey DEFERRABLE;
+ALTER TABLE reviews ALTER CONSTRAINT reviews_author_account_id_fkey DEFERRABLE;
+ALTER TABLE review_images ALTER CONSTRAINT review_images_review_id_fkey DEFERRABLE;
+ALTER TABLE review_images ALTER CONSTRAINT review_images_image_id_fkey DEFERRABLE;
+
+-- PAYOUTS
+ALTER TABLE payout_accounts ALTER CONSTRAINT payout_accounts_host_account_id_fkey DEFERRABLE;
+ALTER TABLE payouts ALTER CONSTRAINT payouts_host_account_id_fkey DEFERRABLE;
+ALTER TABLE payouts ALTER CONSTRAINT payouts_payout_account_id_fkey DEFERRABLE;
+ALTER TABLE payouts ALTER CONSTRAINT payouts_booking_id_fkey DEFERRABLE;
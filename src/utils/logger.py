@@ -7,6 +7,8 @@ Features:
 - writes to logs/app.log under project root
 - mirrors all output to stdout
 - UTF-8 encoding and INFO-level default
+- no filesystem access on import: logs/ and the file are created on the
+  first logged record
 """
 
 
@@ -18,17 +20,29 @@ from pathlib import Path
 
 # Path setup
 LOG_DIR = Path(__file__).resolve().parents[2] / "logs"
-LOG_DIR.mkdir(exist_ok=True)
-
 LOG_FILE = LOG_DIR / "app.log"
 
 
+
+class _LazyFileHandler(logging.FileHandler):
+    """
+    FileHandler that opens its file (creating the directory) on first emit.
+    """
+
+    def __init__(self, filename, encoding=None):
+        super().__init__(filename, encoding=encoding, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 # Logging configuration
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(filename)s:%(lineno)s: %(message)s",
     handlers=[
-        logging.FileHandler(LOG_FILE, encoding="utf-8"),
+        _LazyFileHandler(LOG_FILE, encoding="utf-8"),
         logging.StreamHandler(sys.stdout),
     ],
 )
@@ -0,0 +1,28 @@
+# Stdlib imports
+import logging
+
+# Third-party imports
+import psycopg2
+import pytest
+
+# Internal imports
+from src.db.connection import db_connection
+
+
+
+@pytest.fixture
+def db_cursor():
+    """Cursor on the configured database inside a transaction that is always
+    rolled back; skips the test if no database is reachable"""
+    try:
+        conn = db_connection()
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"database not reachable: {e}")
+
+    logging.info("==== db_cursor: connected =====")
+    try:
+        with conn.cursor() as cur:
+            yield cur
+    finally:
+        conn.rollback()
+        conn.close()
@@ -0,0 +1,29 @@
+# Stdlib imports
+import datetime
+import logging
+
+# Third-party imports
+import pytest
+
+# Internal imports
+from src.db.availability import check_availability, is_available
+
+
+
+def test_empty_or_reversed_stay_is_rejected():
+    """Test if a stay that does not end after its start raises before querying"""
+    logging.info("==== test_empty_or_reversed_stay_is_rejected =====")
+
+    day = datetime.datetime(2024, 5, 1)
+
+    with pytest.raises(ValueError):
+        is_available(1, day, day, conn=object())
+    with pytest.raises(ValueError):
+        check_availability([(1, day, day - datetime.timedelta(days=1))], conn=object())
+
+
+def test_empty_batch_needs_no_query():
+    """Test if an empty batch returns an empty result without a connection"""
+    logging.info("==== test_empty_batch_needs_no_query =====")
+
+    assert check_availability([], conn=object()) == []
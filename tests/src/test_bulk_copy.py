@@ -0,0 +1,58 @@
+# Stdlib imports
+import datetime
+import logging
+
+# Internal imports
+from src.db.utils.bulk_copy import RETURNING_PAGE_SIZE, _encode_row, insert_returning_ids
+import src.db.sql_repo as sqlrepo
+
+
+
+def test_encode_row_copy_text_format():
+    """Test if rows are encoded as valid COPY text lines"""
+    logging.info("==== test_encode_row_copy_text_format =====")
+
+    row = (
+        1,
+        None,
+        True,
+        datetime.datetime(2024, 12, 24, 18, 30),
+        "tab\there\nnew line \\ backslash",
+    )
+    line = _encode_row(row)
+
+    assert line == (
+        "1\t\\N\tt\t2024-12-24T18:30:00\t"
+        "tab\\there\\nnew line \\\\ backslash\n"
+    )
+
+
+def test_copy_columns_cover_insert_templates():
+    """Test if every INSERT template has a matching COPY column list"""
+    logging.info("==== test_copy_columns_cover_insert_templates =====")
+
+    assert set(sqlrepo.COPY_COLUMNS) == set(sqlrepo.INSERT_TEMPLATES)
+    for table, columns in sqlrepo.COPY_COLUMNS.items():
+        template = sqlrepo.INSERT_TEMPLATES[table]
+        assert template.count("%s") == len(columns), table
+
+
+def test_insert_returning_ids_pairs_ids_with_rows(db_cursor):
+    """Test if IDs from several RETURNING pages come back in input order and belong to their rows"""
+    logging.info("==== test_insert_returning_ids_pairs_ids_with_rows =====")
+
+    n = 2 * RETURNING_PAGE_SIZE + 17
+    created_at = datetime.datetime(2024, 1, 1)
+    # descending emails, so an ID order that merely follows the data would fail
+    rows = [
+        (f"returning-probe-{n - i:06d}@example.test", "Probe", str(i), "guest", created_at)
+        for i in range(n)
+    ]
+
+    ids = insert_returning_ids(db_cursor, "accounts", rows)
+
+    assert len(ids) == len(set(ids)) == n
+    db_cursor.execute("SELECT id, email FROM accounts WHERE id = ANY(%s);", (ids,))
+    email_by_id = dict(db_cursor.fetchall())
+    assert [email_by_id[row_id] for row_id in ids] == [row[0] for row in rows]
+
@@ -0,0 +1,56 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+import src.db.bulk_load as bulk_load
+from src.db.bulk_load import format_rebuild_report, index_jobs_by_table
+
+
+
+def test_format_rebuild_report_totals():
+    """Test if the rebuild report lists every step and sums the timings"""
+    logging.info("==== test_format_rebuild_report_totals =====")
+
+    report = [
+        ("accounts.accounts_email_key", "unique index", 1.5),
+        ("bookings.bookings_guest_account_id_fkey", "validate fk", 0.25),
+    ]
+    text = format_rebuild_report(report)
+
+    assert "accounts.accounts_email_key" in text
+    assert "validate fk" in text
+    assert text.splitlines()[-1].split()[-1] == "1.75s"
+
+
+def test_index_jobs_group_each_table_into_one_job():
+    """Test if all indexes of a table end up in the same (serial) rebuild job"""
+    logging.info("==== test_index_jobs_group_each_table_into_one_job =====")
+
+    indexes = [
+        ("paypal", "paypal_email_key", "CREATE UNIQUE INDEX ...", "paypal_email_key", "u", "UNIQUE (email)"),
+        ("bookings", "bookings_no_overlap", "CREATE INDEX ...", "bookings_no_overlap", "x", "EXCLUDE ..."),
+        ("paypal", "paypal_paypal_user_id_key", "CREATE UNIQUE INDEX ...", "paypal_paypal_user_id_key", "u", "UNIQUE (paypal_user_id)"),
+    ]
+    jobs = index_jobs_by_table(indexes)
+
+    assert [[index[1] for index in job] for job in jobs] == [
+        ["paypal_email_key", "paypal_paypal_user_id_key"],
+        ["bookings_no_overlap"],
+    ]
+
+
+def test_pending_objects_round_trip(tmp_path, monkeypatch):
+    """Test if captured definitions survive on disk until they are cleared"""
+    logging.info("==== test_pending_objects_round_trip =====")
+
+    monkeypatch.setattr(bulk_load, "PENDING_DIR", tmp_path)
+    objects = {
+        "indexes": [("paypal", "paypal_email_key", "CREATE UNIQUE INDEX ...", "paypal_email_key", "u", "UNIQUE (email)")],
+        "foreign_keys": [("paypal", "paypal_account_id_fkey", "FOREIGN KEY ...", False)],
+    }
+
+    assert bulk_load.load_pending_objects() is None
+    bulk_load.save_pending_objects(objects)
+    assert bulk_load.load_pending_objects() == objects
+    bulk_load.clear_pending_objects()
+    assert bulk_load.load_pending_objects() is None
@@ -0,0 +1,61 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+import src.db.sql_repo as sqlrepo
+
+
+
+# Scratch tables, created and rolled back inside the test transaction
+PROBE_DDL = """
+    CREATE TABLE catalog_probe_parent (id INT PRIMARY KEY);
+    CREATE TABLE catalog_probe_child (
+        id INT PRIMARY KEY,
+        parent_id INT REFERENCES catalog_probe_parent(id),
+        email TEXT UNIQUE
+    );
+"""
+
+
+
+def test_schema_fingerprint_runs_and_tracks_ddl(db_cursor):
+    """Test if the fingerprint query runs on the server and changes with DDL"""
+    logging.info("==== test_schema_fingerprint_runs_and_tracks_ddl =====")
+
+    db_cursor.execute(sqlrepo.FETCH_SCHEMA_FINGERPRINT)
+    before = db_cursor.fetchone()[0]
+    db_cursor.execute(PROBE_DDL)
+    db_cursor.execute(sqlrepo.FETCH_SCHEMA_FINGERPRINT)
+    after = db_cursor.fetchone()[0]
+
+    assert len(before) == 32
+    assert after != before
+
+
+def test_schema_catalog_lists_keys_and_indexes(db_cursor):
+    """Test if the catalog query returns PK, FK and index columns of a table"""
+    logging.info("==== test_schema_catalog_lists_keys_and_indexes =====")
+
+    db_cursor.execute(PROBE_DDL)
+    db_cursor.execute(sqlrepo.FETCH_SCHEMA_CATALOG)
+    catalog = db_cursor.fetchone()[0]
+    child = catalog["tables"]["catalog_probe_child"]
+
+    assert child["primary_key"] == ["id"]
+    assert [fk["columns"] for fk in child["foreign_keys"]] == [["parent_id"]]
+    assert sorted(index["columns"] for index in child["indexes"]) == [["email"], ["id"]]
+
+
+def test_foreign_keys_are_deferrable(db_cursor):
+    """Test if every FK of the migrated schema can be deferred by SET CONSTRAINTS ALL DEFERRED"""
+    logging.info("==== test_foreign_keys_are_deferrable =====")
+
+    db_cursor.execute("""
+        SELECT conrelid::regclass::text, conname
+        FROM pg_constraint
+        WHERE contype = 'f'
+          AND NOT condeferrable
+          AND connamespace = current_schema()::regnamespace;
+    """)
+
+    assert db_cursor.fetchall() == []
@@ -0,0 +1,31 @@
+# Stdlib imports
+import gzip
+import json
+import logging
+
+# Third-party imports
+from psycopg2 import sql
+
+# Internal imports
+from src.db.utils.db_export import MANIFEST_NAME, export_database
+import src.db.sql_repo as sqlrepo
+
+
+
+def test_export_manifest_matches_table_counts(db_cursor, tmp_path):
+    """Test if every table is exported and manifest.json row counts match count(*)"""
+    logging.info("==== test_export_manifest_matches_table_counts =====")
+
+    manifest = export_database(tmp_path, workers=2)
+
+    with open(tmp_path / MANIFEST_NAME, encoding="utf-8") as f:
+        assert json.load(f) == manifest
+
+    db_cursor.execute(sqlrepo.FETCH_EXPORT_TABLE_NAMES)
+    assert sorted(manifest["tables"]) == [row[0] for row in db_cursor.fetchall()]
+
+    for table, entry in manifest["tables"].items():
+        db_cursor.execute(sql.SQL(sqlrepo.VERIFY_COUNT).format(tbl=sql.Identifier(table)))
+        assert entry["rows"] == db_cursor.fetchone()[0], table
+        with gzip.open(tmp_path / entry["file"], "rt", encoding="utf-8") as f:
+            assert f.readline(), table  # CSV header
@@ -0,0 +1,28 @@
+# Stdlib imports
+import logging
+
+# Third-party imports
+import pytest
+
+# Internal imports
+from src.db.utils.db_helpers import summarize_table
+import src.db.sql_repo as sqlrepo
+
+
+
+def test_verify_key_columns_exist():
+    """Test if every verification key column is a column of its table"""
+    logging.info("==== test_verify_key_columns_exist =====")
+
+    for table, keys in sqlrepo.VERIFY_KEY_COLUMNS.items():
+        columns = ("id", *sqlrepo.COPY_COLUMNS[table])
+        assert set(keys) <= set(columns), table
+
+
+def test_summarize_table_modes():
+    """Test if "off" skips the query and unknown modes are rejected"""
+    logging.info("==== test_summarize_table_modes =====")
+
+    assert summarize_table("accounts", mode="off") == ""
+    with pytest.raises(ValueError):
+        summarize_table("accounts", mode="everything")
@@ -0,0 +1,68 @@
+# Stdlib imports
+import logging
+
+# Third-party imports
+import pandas as pd
+
+# Internal imports
+from src.db.utils.db_introspect import build_frame, metadata_frame, pandas_dtypes
+
+
+
+def test_pandas_dtypes_from_metadata():
+    """Test if catalog metadata maps to compact pandas dtypes"""
+    logging.info("==== test_pandas_dtypes_from_metadata =====")
+
+    metadata = pd.DataFrame(
+        data=[
+            ("id", "integer", "NO", "nextval('accounts_id_seq'::regclass)", "int4"),
+            ("role", "USER-DEFINED", "NO", None, "role"),
+            ("is_active", "boolean", "NO", "true", "bool"),
+            ("is_read", "boolean", "YES", None, "bool"),
+            ("created_at", "timestamp without time zone", "YES", None, "timestamp"),
+            ("email", "character varying", "NO", None, "varchar"),
+        ],
+        columns=["attr_name", "data_type", "is_nullable", "default_value", "udt_name"],
+    )
+    roles = pd.CategoricalDtype(["guest", "host", "admin"], ordered=True)
+    dtypes = pandas_dtypes(metadata, {"role": roles})
+
+    assert dtypes == {
+        "id": "Int32",
+        "role": roles,
+        "is_active": "bool",
+        "is_read": "boolean",
+        "created_at": "datetime64[ns]",
+    }
+
+
+def test_build_frame_applies_dtypes():
+    """Test if frames are built with catalog dtypes and NULLs survive"""
+    logging.info("==== test_build_frame_applies_dtypes =====")
+
+    roles = pd.CategoricalDtype(["guest", "host", "admin"], ordered=True)
+    df = build_frame(
+        [(1, "guest", None), (2, "admin", 7)],
+        ["id", "role", "score"],
+        {"id": "Int32", "role": roles, "score": "Int32"},
+    )
+
+    assert df["role"].dtype == roles
+    assert str(df["score"].dtype) == "Int32"
+    assert df["score"].isna().sum() == 1
+
+
+def test_metadata_frame_from_catalog_columns():
+    """Test if catalog column entries convert to the metadata frame layout"""
+    logging.info("==== test_metadata_frame_from_catalog_columns =====")
+
+    columns = [
+        {"name": "id", "data_type": "integer", "udt_name": "int4",
+         "is_nullable": "NO", "default": "nextval('accounts_id_seq'::regclass)"},
+        {"name": "role", "data_type": "USER-DEFINED", "udt_name": "role",
+         "is_nullable": "NO", "default": None},
+    ]
+    metadata = metadata_frame(columns)
+
+    assert list(metadata["attr_name"]) == ["id", "role"]
+    assert pandas_dtypes(metadata, {})["id"] == "Int32"
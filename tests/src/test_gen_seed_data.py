@@ -1,10 +1,14 @@
 # Stdlib imports
 import logging
 from psycopg2 import sql
+import pytest
 
 # Internal imports
 import src.db.utils.db_introspect as introspect
 from src.db.connection import db_connection
+from src.db import gen_seed_data as gen
+from src.db import seed_scheduler as scheduler
+from src.db.world_model import WorldModel
 
 
 
@@ -625,4 +629,132 @@ def test_bookings_integrity():
 
     logging.info("")
     cur.close()
-    con.close()
\ No newline at end of file
+    con.close()
+
+
+
+# Set-based generators, run inside the rolled-back test transaction
+@pytest.fixture(params=[True, False], ids=["copy", "insert"])
+def seeded_cursor(request, db_cursor, monkeypatch):
+    """db_cursor after a full seed run on its own connection (COPY or INSERT
+    path), with small booking batches so IDs are paired across batches"""
+    conn = db_cursor.connection
+    monkeypatch.setattr(gen, "run_connection", conn)
+    monkeypatch.setattr(gen, "world", WorldModel())
+    monkeypatch.setattr(gen, "truncate_before_insert", False)
+    monkeypatch.setattr(gen.seeds, "booking_batch_size", 7)
+
+    scheduler.clear_seed_tables(conn)
+    for level in scheduler.seed_levels():
+        for name in level:
+            getattr(gen, f"gen_dummydata_{name}")(use_copy=request.param)
+    return db_cursor
+
+
+def test_bookings_never_overlap_per_accommodation(seeded_cursor):
+    """Test if the slot calculation keeps every stay of an accommodation apart, cancelled ones included"""
+    logging.info("==== test_bookings_never_overlap_per_accommodation =====")
+
+    seeded_cursor.execute("SELECT COUNT(*) FROM bookings;")
+    assert seeded_cursor.fetchone()[0] > 0
+
+    seeded_cursor.execute("""
+        SELECT COUNT(*)
+        FROM bookings a
+        JOIN bookings b
+          ON b.accommodation_id = a.accommodation_id
+         AND b.id > a.id
+         AND b.start_date < a.end_date
+         AND a.start_date < b.end_date;
+    """)
+    assert seeded_cursor.fetchone()[0] == 0
+
+
+def test_each_booking_has_one_matching_payment(seeded_cursor):
+    """Test if payments and bookings are paired one to one with the guest, method and full-stay amount"""
+    logging.info("==== test_each_booking_has_one_matching_payment =====")
+
+    seeded_cursor.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM bookings),
+            (SELECT COUNT(DISTINCT payment_id) FROM bookings),
+            (SELECT COUNT(*) FROM payments);
+    """)
+    bookings, paid_bookings, payments = seeded_cursor.fetchone()
+    assert bookings == paid_bookings == payments
+
+    seeded_cursor.execute("""
+        SELECT COUNT(*)
+        FROM bookings b
+        JOIN accommodations ac ON ac.id = b.accommodation_id
+        LEFT JOIN payments p ON p.id = b.payment_id
+        LEFT JOIN payment_methods pm ON pm.id = p.payment_method_id
+        WHERE p.id IS NULL
+           OR p.customer_id <> b.guest_account_id
+           OR pm.customer_id IS DISTINCT FROM b.guest_account_id
+           OR p.amount_cents <> ac.price_cents * (b.end_date::date - b.start_date::date);
+    """)
+    assert seeded_cursor.fetchone()[0] == 0
+
+
+def test_each_booking_has_one_payout_to_its_host(seeded_cursor):
+    """Test if INSERT_PAYOUTS_FROM_BOOKINGS pays each booking once to the accommodation's host"""
+    logging.info("==== test_each_booking_has_one_payout_to_its_host =====")
+
+    seeded_cursor.execute("""
+        SELECT COUNT(*)
+        FROM bookings b
+        JOIN accommodations ac ON ac.id = b.accommodation_id
+        JOIN payments p ON p.id = b.payment_id
+        LEFT JOIN payouts po ON po.booking_id = b.id
+        LEFT JOIN payout_accounts pa ON pa.id = po.payout_account_id
+        WHERE EXISTS (SELECT 1 FROM payout_accounts WHERE host_account_id = ac.host_account_id)
+          AND (po.id IS NULL
+               OR po.host_account_id <> ac.host_account_id
+               OR pa.host_account_id <> ac.host_account_id
+               OR po.amount_cents <> p.amount_cents);
+    """)
+    assert seeded_cursor.fetchone()[0] == 0
+
+    seeded_cursor.execute("SELECT COUNT(*) - COUNT(DISTINCT booking_id) FROM payouts;")
+    assert seeded_cursor.fetchone()[0] == 0
+
+
+def test_calendar_partitions_hold_one_row_per_accommodation_and_day(seeded_cursor):
+    """Test if every calendar partition holds exactly one row per accommodation per day of its month"""
+    logging.info("==== test_calendar_partitions_hold_one_row_per_accommodation_and_day =====")
+
+    seeded_cursor.execute("SELECT COUNT(*) FROM accommodations;")
+    accommodations = seeded_cursor.fetchone()[0]
+
+    seeded_cursor.execute("""
+        SELECT
+            tableoid::regclass::text,
+            COUNT(*),
+            COUNT(DISTINCT (accommodation_id, day)),
+            COUNT(DISTINCT day),
+            bool_and(tableoid::regclass::text = 'accommodation_calendar_p' || to_char(day, 'YYYYMM'))
+        FROM accommodation_calendar
+        GROUP BY 1;
+    """)
+    partitions = seeded_cursor.fetchall()
+
+    assert partitions
+    for partition, rows, pairs, days, in_month in partitions:
+        assert in_month, partition
+        assert rows == pairs == accommodations * days, partition
+    assert sum(days for _, _, _, days, _ in partitions) == gen.seeds.calendar_look_ahead
+
+
+
+def test_world_ids_falls_back_to_callers_cursor(db_cursor, monkeypatch):
+    """Test if _world_ids() reads from the caller's cursor with a bound value when the world is empty"""
+    logging.info("==== test_world_ids_falls_back_to_callers_cursor =====")
+
+    monkeypatch.setattr(gen, "world", WorldModel())
+    db_cursor.execute("SELECT id FROM accounts WHERE role = 'guest' ORDER BY id;")
+    guest_ids = [row[0] for row in db_cursor.fetchall()]
+
+    assert gen._world_ids(db_cursor, "accounts", "role", "guest") == guest_ids
+    # a quote in the value is data, not SQL
+    assert gen._world_ids(db_cursor, "accounts", "email", "x' OR 'x' = 'x") == []
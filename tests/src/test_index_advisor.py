@@ -0,0 +1,115 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+from src.db.utils.index_advisor import (
+    advice_ddl,
+    estimate_btree_bytes,
+    index_name,
+    lookup_predicates,
+    plan_indexes,
+)
+
+
+
+QUERIES = {
+    "FETCH_FIRST_METHOD": """
+        SELECT id
+        FROM payment_methods
+        WHERE customer_id = %s
+        ORDER BY id
+        LIMIT 1;
+    """,
+    "FETCH_FIRST_PER_CUSTOMER": """
+        SELECT DISTINCT ON (customer_id) customer_id, id
+        FROM payment_methods
+        WHERE customer_id IS NOT NULL
+        ORDER BY customer_id, id;
+    """,
+    "FETCH_BY_ID": "SELECT price_cents FROM accommodations WHERE id = %s;",
+    "JOINED": "SELECT * FROM bookings b JOIN payments p ON p.id = b.payment_id;",
+}
+
+TABLES = {
+    "payment_methods": {
+        "foreign_keys": [
+            {"name": "payment_methods_customer_id_fkey", "columns": ["customer_id"], "references": "accounts"},
+        ],
+        "indexes": [{"columns": ["id"], "partial": False}],
+    },
+    "accommodations": {
+        "foreign_keys": [],
+        "indexes": [{"columns": ["id"], "partial": False}],
+    },
+    "review_images": {
+        "foreign_keys": [
+            {"name": "review_images_review_id_fkey", "columns": ["review_id"], "references": "reviews"},
+            {"name": "review_images_image_id_fkey", "columns": ["image_id"], "references": "images"},
+        ],
+        "indexes": [{"columns": ["review_id", "image_id"], "partial": False}],
+    },
+}
+
+
+
+def test_lookup_predicates_finds_equality_and_ordering():
+    """Test if lookups yield equality columns followed by ORDER BY columns"""
+    logging.info("==== test_lookup_predicates_finds_equality_and_ordering =====")
+
+    lookups = lookup_predicates(QUERIES)
+
+    assert ("payment_methods", ("customer_id", "id"), "FETCH_FIRST_METHOD") in lookups
+    assert ("payment_methods", ("customer_id", "id"), "FETCH_FIRST_PER_CUSTOMER") in lookups
+    assert ("accommodations", ("id",), "FETCH_BY_ID") in lookups
+    assert not any(name == "JOINED" for _, _, name in lookups)
+
+
+def test_plan_indexes_merges_fks_into_composite_lookups():
+    """Test if one composite index covers FK and lookups and PK prefixes are skipped"""
+    logging.info("==== test_plan_indexes_merges_fks_into_composite_lookups =====")
+
+    plan = plan_indexes(TABLES, lookup_predicates(QUERIES))
+
+    assert [(s.table, s.columns) for s in plan] == [
+        ("payment_methods", ("customer_id", "id")),
+        ("review_images", ("image_id",)),
+    ]
+    assert len(plan[0].reasons) == 3
+    assert "CREATE INDEX IF NOT EXISTS review_images_image_id_idx" in advice_ddl(plan)
+
+
+def test_estimate_btree_bytes_scales_with_rows_and_width():
+    """Test if the size estimate is close to a real int4 B-tree and grows with width"""
+    logging.info("==== test_estimate_btree_bytes_scales_with_rows_and_width =====")
+
+    one_million_ints = estimate_btree_bytes(1_000_000, [4])
+
+    assert 20 * 2**20 < one_million_ints < 24 * 2**20
+    assert estimate_btree_bytes(1_000_000, [4, 8]) > one_million_ints
+    assert estimate_btree_bytes(0, [4]) == 2 * 8192
+
+
+def test_order_by_expressions_are_not_index_columns():
+    """Test if ORDER BY expressions end the suggested columns and names stay valid identifiers"""
+    logging.info("==== test_order_by_expressions_are_not_index_columns =====")
+
+    queries = {
+        "CONFLICTS": """
+            SELECT id
+            FROM bookings
+            WHERE accommodation_id = %s
+              AND stay && tsrange(%s, %s, '[)')
+            ORDER BY lower(stay), id;
+        """,
+        "LATEST": """
+            SELECT DISTINCT ON (view_name) view_name
+            FROM refresh_log
+            ORDER BY view_name, started_at DESC;
+        """,
+    }
+
+    lookups = lookup_predicates(queries)
+
+    assert ("bookings", ("accommodation_id",), "CONFLICTS") in lookups
+    assert ("refresh_log", ("view_name", "started_at DESC"), "LATEST") in lookups
+    assert index_name("bookings", ["accommodation_id", "lower(stay)"]) == "bookings_accommodation_id_lower_stay_idx"
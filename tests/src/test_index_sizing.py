@@ -0,0 +1,37 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+import src.db.sql_repo as sqlrepo
+
+
+
+# Partitioned scratch table, created and rolled back inside the test transaction
+PROBE_DDL = """
+    CREATE TABLE sizing_probe (
+        id INT NOT NULL,
+        sent_at TIMESTAMP NOT NULL,
+        body TEXT
+    ) PARTITION BY RANGE (sent_at);
+    CREATE TABLE sizing_probe_p202401 PARTITION OF sizing_probe
+        FOR VALUES FROM ('2024-01-01') TO ('2024-02-01');
+    INSERT INTO sizing_probe
+    SELECT g, '2024-01-01'::timestamp + g * interval '1 minute', 'x'
+    FROM generate_series(1, 100) AS g;
+    ANALYZE sizing_probe_p202401;
+"""
+
+
+
+def test_index_sizing_sums_partition_rows(db_cursor):
+    """Test if the sizing query runs and reports a partitioned table's rows from its partitions"""
+    logging.info("==== test_index_sizing_sums_partition_rows =====")
+
+    db_cursor.execute(PROBE_DDL)
+    db_cursor.execute(sqlrepo.FETCH_INDEX_SIZING, (32,))
+    sizing = {table: (rows, widths) for table, rows, widths in db_cursor.fetchall()}
+
+    rows, widths = sizing["sizing_probe"]
+    assert rows == 100
+    assert widths["id"] == 4
+    assert sizing["sizing_probe_p202401"][0] == 100
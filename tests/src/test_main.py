@@ -0,0 +1,36 @@
+# Stdlib imports
+import logging
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+
+def test_cli_import_is_lightweight():
+    """Test if importing the CLI pulls in no DB, numpy or pandas modules"""
+    logging.info("==== test_cli_import_is_lightweight =====")
+
+    code = (
+        "import sys, src.main; "
+        "heavy = [m for m in ('psycopg2', 'numpy', 'pandas', 'src.db.connection') "
+        "if m in sys.modules]; "
+        "print(','.join(heavy))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_cli_help_lists_subcommands():
+    """Test if --help works without a database and lists all subcommands"""
+    logging.info("==== test_cli_help_lists_subcommands =====")
+
+    result = subprocess.run(
+        [sys.executable, "-m", "src.main", "--help"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    for command in ("seed", "migrate", "reset", "snapshot", "dump", "introspect", "partitions", "refresh-views", "advise-indexes", "bench"):
+        assert command in result.stdout
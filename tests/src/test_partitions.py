@@ -0,0 +1,31 @@
+# Stdlib imports
+import datetime
+import logging
+
+# Internal imports
+from src.db.partitions import month_ranges, partition_name
+
+
+
+def test_partition_name_uses_year_and_month():
+    """Test if dates and timestamps map to their monthly partition"""
+    logging.info("==== test_partition_name_uses_year_and_month =====")
+
+    assert partition_name("messages", datetime.datetime(2024, 2, 29, 23, 59)) == "messages_p202402"
+    assert partition_name("accommodation_calendar", datetime.date(2025, 12, 1)) == "accommodation_calendar_p202512"
+
+
+def test_month_ranges_split_at_month_boundaries():
+    """Test if a day range is split into clipped per-month ranges across a year end"""
+    logging.info("==== test_month_ranges_split_at_month_boundaries =====")
+
+    ranges = month_ranges(datetime.date(2024, 11, 15), datetime.date(2025, 1, 10))
+
+    assert ranges == [
+        (datetime.date(2024, 11, 15), datetime.date(2024, 11, 30)),
+        (datetime.date(2024, 12, 1), datetime.date(2024, 12, 31)),
+        (datetime.date(2025, 1, 1), datetime.date(2025, 1, 10)),
+    ]
+    assert month_ranges(datetime.date(2024, 3, 5), datetime.date(2024, 3, 5)) == [
+        (datetime.date(2024, 3, 5), datetime.date(2024, 3, 5))
+    ]
@@ -0,0 +1,94 @@
+# Stdlib imports
+from contextlib import nullcontext
+import logging
+
+# Third-party imports
+from psycopg2 import sql
+import pytest
+
+# Internal imports
+from src.db import reporting
+from src.db.reporting import REPORTING_VIEWS, format_refresh_report, latest_refreshes, refresh_views
+import src.db.sql_repo as sqlrepo
+
+
+
+# Unpopulated scratch view with the unique index CONCURRENTLY needs
+PROBE_DDL = """
+    CREATE MATERIALIZED VIEW refresh_probe AS
+    SELECT g AS id FROM generate_series(1, 3) AS g
+    WITH NO DATA;
+    CREATE UNIQUE INDEX ON refresh_probe (id);
+"""
+
+
+@pytest.fixture
+def refresh_cursor(db_cursor, monkeypatch):
+    """db_cursor whose connection also serves every refresh, so refreshes and
+    log rows are rolled back with the test"""
+    monkeypatch.setattr(reporting, "pooled_connection", lambda: nullcontext(db_cursor.connection))
+    return db_cursor
+
+
+
+def test_format_refresh_report_totals():
+    """Test if the refresh report lists every view with its mode and sums the timings"""
+    logging.info("==== test_format_refresh_report_totals =====")
+
+    report = [
+        ("mv_host_revenue_monthly", "concurrent", 120, 0.5),
+        ("mv_accommodation_ratings", "blocking", 40, 0.25),
+    ]
+    text = format_refresh_report(report)
+
+    assert "mv_host_revenue_monthly" in text
+    assert "blocking" in text
+    assert text.splitlines()[-1].split()[-1] == "0.75s"
+
+
+def test_refresh_mode_follows_population_and_is_logged(refresh_cursor):
+    """Test if an unpopulated view gets a blocking refresh, a populated one CONCURRENTLY, and each refresh is logged"""
+    logging.info("==== test_refresh_mode_follows_population_and_is_logged =====")
+
+    refresh_cursor.execute(PROBE_DDL)
+
+    first = refresh_views(["refresh_probe"], workers=1)
+    second = refresh_views(["refresh_probe"], workers=1)
+    forced = refresh_views(["refresh_probe"], workers=1, blocking=True)
+
+    assert [(view, mode, rows) for view, mode, rows, _ in first + second + forced] == [
+        ("refresh_probe", "blocking", 3),
+        ("refresh_probe", "concurrent", 3),
+        ("refresh_probe", "blocking", 3),
+    ]
+
+    refresh_cursor.execute("""
+        SELECT concurrent, row_count
+        FROM reporting_refresh_log
+        WHERE view_name = 'refresh_probe'
+        ORDER BY id;
+    """)
+    assert refresh_cursor.fetchall() == [(False, 3), (True, 3), (False, 3)]
+
+    latest = {row[0]: row for row in latest_refreshes()}
+    assert latest["refresh_probe"][1:3] == (False, 3)
+
+
+def test_refresh_views_covers_reporting_views(refresh_cursor):
+    """Test if the default refresh reports every reporting view with its current row count"""
+    logging.info("==== test_refresh_views_covers_reporting_views =====")
+
+    report = refresh_views(workers=1)
+
+    assert [view for view, _, _, _ in report] == list(REPORTING_VIEWS)
+    for view, _, rows, _ in report:
+        refresh_cursor.execute(sql.SQL(sqlrepo.VERIFY_COUNT).format(tbl=sql.Identifier(view)))
+        assert rows == refresh_cursor.fetchone()[0], view
+
+
+def test_refresh_unknown_view_raises(refresh_cursor):
+    """Test if refreshing a name that is not a materialized view raises ValueError"""
+    logging.info("==== test_refresh_unknown_view_raises =====")
+
+    with pytest.raises(ValueError):
+        refresh_views(["no_such_view"], workers=1)
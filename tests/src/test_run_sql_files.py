@@ -0,0 +1,99 @@
+# Stdlib imports
+import logging
+
+# Third-party imports
+import pytest
+
+# Internal imports
+from src.db.run_sql_files import (
+    LEGACY_VERSIONS,
+    MigrationError,
+    baseline_legacy_schema,
+    check_applied,
+    discover_migrations,
+)
+import src.db.sql_repo as sqlrepo
+
+
+
+def test_discover_migrations_orders_by_version(tmp_path):
+    """Test if migrations are ordered numerically and non-migration files are skipped"""
+    logging.info("==== test_discover_migrations_orders_by_version =====")
+
+    for name in ("10_views.sql", "02_seed.sql", "01_schema.sql", "notes.sql"):
+        (tmp_path / name).write_text(f"-- {name}\n", encoding="utf-8")
+
+    migrations = discover_migrations(tmp_path)
+
+    assert [m.version for m in migrations] == [1, 2, 10]
+    assert [m.name for m in migrations] == ["schema", "seed", "views"]
+    assert all(len(m.checksum) == 64 for m in migrations)
+
+
+def test_discover_migrations_rejects_duplicate_versions(tmp_path):
+    """Test if two files with the same version number raise MigrationError"""
+    logging.info("==== test_discover_migrations_rejects_duplicate_versions =====")
+
+    (tmp_path / "01_schema.sql").write_text("SELECT 1;", encoding="utf-8")
+    (tmp_path / "1_other.sql").write_text("SELECT 2;", encoding="utf-8")
+
+    with pytest.raises(MigrationError):
+        discover_migrations(tmp_path)
+
+
+def test_check_applied_returns_pending_and_detects_edits(tmp_path):
+    """Test if applied versions are skipped and an edited applied file raises"""
+    logging.info("==== test_check_applied_returns_pending_and_detects_edits =====")
+
+    (tmp_path / "01_schema.sql").write_text("SELECT 1;", encoding="utf-8")
+    (tmp_path / "02_seed.sql").write_text("SELECT 2;", encoding="utf-8")
+    schema, seed = discover_migrations(tmp_path)
+
+    assert check_applied([schema, seed], {1: ("schema", schema.checksum)}) == [seed]
+
+    with pytest.raises(MigrationError):
+        check_applied([schema, seed], {1: ("schema", "0" * 64)})
+    with pytest.raises(MigrationError):
+        check_applied([schema], {1: ("schema", schema.checksum), 2: ("seed", seed.checksum)})
+
+
+
+def _untracked_legacy_database(cur):
+    """
+    Turn the test transaction's view of the database into one set up by the
+    old runner: baseline schema present, schema_migrations empty.
+    """
+    cur.execute(sqlrepo.CREATE_MIGRATIONS_TABLE)
+    cur.execute("DELETE FROM schema_migrations;")
+    cur.execute("CREATE TABLE IF NOT EXISTS accounts (id INT);")
+
+
+def test_baseline_records_legacy_files_without_running_them(db_cursor):
+    """Test if an untracked database with the baseline schema gets 01 and 02 recorded with their checksums"""
+    logging.info("==== test_baseline_records_legacy_files_without_running_them =====")
+
+    _untracked_legacy_database(db_cursor)
+    migrations = discover_migrations()
+
+    baselined = baseline_legacy_schema(db_cursor, migrations)
+    db_cursor.execute(sqlrepo.FETCH_APPLIED_MIGRATIONS)
+    applied = {version: (name, checksum) for version, name, checksum in db_cursor.fetchall()}
+
+    assert [m.version for m in baselined] == list(LEGACY_VERSIONS)
+    assert applied == {m.version: (m.name, m.checksum) for m in baselined}
+    assert [m.version for m in check_applied(migrations, applied)] == [
+        m.version for m in migrations if m.version not in LEGACY_VERSIONS
+    ]
+
+
+def test_baseline_leaves_tracked_databases_alone(db_cursor):
+    """Test if a database with recorded migrations is not baselined again"""
+    logging.info("==== test_baseline_leaves_tracked_databases_alone =====")
+
+    _untracked_legacy_database(db_cursor)
+    schema = discover_migrations()[0]
+    db_cursor.execute(
+        sqlrepo.INSERT_APPLIED_MIGRATION, (schema.version, schema.name, schema.checksum, 5)
+    )
+
+    assert baseline_legacy_schema(db_cursor, discover_migrations()) == []
@@ -0,0 +1,47 @@
+# Stdlib imports
+import datetime
+import logging
+
+# Internal imports
+from src.db.sampling import BatchSampler, stream_seed, to_datetimes
+
+
+
+def test_sampler_is_reproducible_per_seed():
+    """Test if two samplers with the same seed draw the same columns"""
+    logging.info("==== test_sampler_is_reproducible_per_seed =====")
+
+    first, second = BatchSampler(42), BatchSampler(42)
+    assert first.integers(100, 1, 6).tolist() == second.integers(100, 1, 6).tolist()
+    assert first.uuids(5) == second.uuids(5)
+
+
+def test_sampler_respects_bounds():
+    """Test if batched draws stay inside their inclusive bounds"""
+    logging.info("==== test_sampler_respects_bounds =====")
+
+    rand = BatchSampler(1)
+    values = rand.integers(1000, 1, 3)
+    assert values.min() >= 1 and values.max() <= 3
+
+    start = datetime.datetime(2024, 1, 1)
+    stop = datetime.datetime(2024, 1, 2)
+    stamps = to_datetimes(rand.timestamps(1000, start, stop))
+    assert all(start <= stamp <= stop for stamp in stamps)
+
+    rows = rand.sample_rows([2, 5, 0], ["a", "b", "c"])
+    assert [len(row) for row in rows] == [2, 3, 0]
+    assert all(len(set(row)) == len(row) for row in rows)
+
+
+def test_stream_seed_is_independent_per_table_and_chunk():
+    """Test if streams repeat per (seed, table, chunk) and differ otherwise"""
+    logging.info("==== test_stream_seed_is_independent_per_table_and_chunk =====")
+
+    def draw(master_seed, name, chunk=0):
+        return BatchSampler(stream_seed(master_seed, name, chunk)).integers(50, 0, 10**9).tolist()
+
+    assert draw(7, "accounts") == draw(7, "accounts")
+    assert draw(7, "accounts") != draw(7, "images")
+    assert draw(7, "bookings", 1) != draw(7, "bookings", 2)
+    assert draw(7, "accounts") != draw(8, "accounts")
@@ -0,0 +1,155 @@
+# Stdlib imports
+import logging
+import re
+import threading
+import time
+
+# Third-party imports
+from psycopg2 import sql
+import pytest
+
+# Internal imports
+from src.db import gen_seed_data as gen
+from src.db import seed_scheduler as scheduler
+import src.db.sql_repo as sqlrepo
+
+
+
+# bookings and payments are written by one generator
+TABLE_GENERATORS = {"bookings": "bookings_and_payments", "payments": "bookings_and_payments"}
+
+REFERENCES_RE = re.compile(r"REFERENCES\s+(\w+)")
+
+
+def _generator(table: str) -> str:
+    return TABLE_GENERATORS.get(table, table)
+
+
+def _ancestors(name: str) -> set:
+    """
+    All generators name transitively depends on.
+    """
+    seen = set()
+    stack = list(scheduler.GENERATOR_DEPS[name])
+    while stack:
+        dep = stack.pop()
+        if dep not in seen:
+            seen.add(dep)
+            stack.extend(scheduler.GENERATOR_DEPS[dep])
+    return seen
+
+
+def _seed_table_counts(cur) -> dict:
+    counts = {}
+    for table in scheduler.SEED_TABLES:
+        cur.execute(sql.SQL(sqlrepo.VERIFY_COUNT).format(tbl=sql.Identifier(table)))
+        counts[table] = cur.fetchone()[0]
+    return counts
+
+
+def _stub_generators(monkeypatch, events, fail=None):
+    """
+    Replace every generator with a stub that records its start and finish;
+    the generator named fail raises instead.
+    """
+    lock = threading.Lock()
+
+    def stub(name):
+        def run(use_copy=True):
+            with lock:
+                events.append(("start", name))
+            time.sleep(0.01)
+            if name == fail:
+                raise ValueError(f"{name} failed")
+            with lock:
+                events.append(("finish", name))
+        return run
+
+    for name in scheduler.GENERATOR_DEPS:
+        monkeypatch.setattr(gen, f"gen_dummydata_{name}", stub(name))
+    monkeypatch.setattr(scheduler, "clear_seed_tables", lambda conn=None: None)
+
+
+
+def test_generator_deps_cover_foreign_keys(db_cursor):
+    """Test if every FK between seed tables is ordered by the declared generator dependencies"""
+    logging.info("==== test_generator_deps_cover_foreign_keys =====")
+
+    db_cursor.execute(sqlrepo.FETCH_FOREIGN_KEYS, (scheduler.SEED_TABLES,))
+    foreign_keys = db_cursor.fetchall()
+
+    missing = []
+    for table, name, definition, _ in foreign_keys:
+        parent = REFERENCES_RE.search(definition).group(1)
+        child_gen, parent_gen = _generator(table), _generator(parent)
+        if parent not in scheduler.SEED_TABLES or child_gen == parent_gen:
+            continue
+        if parent_gen not in _ancestors(child_gen):
+            missing.append((name, child_gen, parent_gen))
+
+    assert foreign_keys
+    assert missing == []
+
+
+def test_run_generators_starts_after_dependencies(monkeypatch):
+    """Test if no generator starts before all of its dependencies have finished"""
+    logging.info("==== test_run_generators_starts_after_dependencies =====")
+
+    events = []
+    _stub_generators(monkeypatch, events)
+
+    durations = scheduler.run_generators(max_workers=4)
+
+    assert set(durations) == set(scheduler.GENERATOR_DEPS)
+    position = {event: i for i, event in enumerate(events)}
+    for name, deps in scheduler.GENERATOR_DEPS.items():
+        for dep in deps:
+            assert position[("finish", dep)] < position[("start", name)], (dep, name)
+
+
+def test_run_generators_propagates_failures(monkeypatch):
+    """Test if a failing generator's exception reaches the caller and its dependants never start"""
+    logging.info("==== test_run_generators_propagates_failures =====")
+
+    events = []
+    _stub_generators(monkeypatch, events, fail="bookings_and_payments")
+
+    with pytest.raises(ValueError, match="bookings_and_payments failed"):
+        scheduler.run_generators(max_workers=4)
+
+    started = {name for kind, name in events if kind == "start"}
+    assert "payouts" not in started
+    assert "accommodation_calendar" not in started
+    assert gen.truncate_before_insert is True
+
+
+def test_single_transaction_failure_rolls_back_everything(db_cursor, monkeypatch):
+    """Test if a failing generator rolls back the whole single-transaction run, TRUNCATE included"""
+    logging.info("==== test_single_transaction_failure_rolls_back_everything =====")
+
+    before = _seed_table_counts(db_cursor)
+    # release the read locks, the run's TRUNCATE would wait on them
+    db_cursor.connection.rollback()
+
+    inside = {}
+
+    def failing_payouts(use_copy=True):
+        with gen.run_connection.cursor() as cur:
+            cur.execute("SHOW work_mem;")
+            inside["work_mem"] = cur.fetchone()[0]
+            inside["counts"] = _seed_table_counts(cur)
+        raise ValueError("payouts failed")
+
+    for name in scheduler.GENERATOR_DEPS:
+        monkeypatch.setattr(gen, f"gen_dummydata_{name}", lambda use_copy=True: None)
+    monkeypatch.setattr(gen, "gen_dummydata_payouts", failing_payouts)
+
+    with pytest.raises(ValueError, match="payouts failed"):
+        scheduler.run_generators(single_transaction=True)
+
+    # inside the run: session profile applied, tables truncated
+    assert inside["work_mem"] == gen.seeds.bulk_load_work_mem
+    assert set(inside["counts"].values()) == {0}
+    # after the run: nothing of it is left
+    assert _seed_table_counts(db_cursor) == before
+    assert gen.run_connection is None
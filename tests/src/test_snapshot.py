@@ -0,0 +1,39 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+from src.db.run_sql_files import Migration
+from src.db.snapshot import MAX_IDENTIFIER_LENGTH, snapshot_key, template_name
+
+
+
+MIGRATIONS = [
+    Migration(1, "schema", None, "a" * 64),
+    Migration(2, "seed", None, "b" * 64),
+]
+
+
+
+def test_template_name_is_stable_and_keyed():
+    """Test if the template name depends only on schema, scale factor and seed"""
+    logging.info("==== test_template_name_is_stable_and_keyed =====")
+
+    base = template_name("airbnb", snapshot_key(MIGRATIONS, 1, 42))
+
+    assert base == template_name("airbnb", snapshot_key(MIGRATIONS, 1.0, 42))
+    assert base.startswith("airbnb_tpl_v2_")
+    assert base != template_name("airbnb", snapshot_key(MIGRATIONS, 10, 42))
+    assert base != template_name("airbnb", snapshot_key(MIGRATIONS, 1, 7))
+
+    edited = [MIGRATIONS[0], MIGRATIONS[1]._replace(checksum="c" * 64)]
+    assert base != template_name("airbnb", snapshot_key(edited, 1, 42))
+
+
+def test_template_name_fits_identifier_limit():
+    """Test if long database names are shortened to a valid identifier"""
+    logging.info("==== test_template_name_fits_identifier_limit =====")
+
+    name = template_name("x" * 80, snapshot_key(MIGRATIONS, 1, 0))
+
+    assert len(name) <= MAX_IDENTIFIER_LENGTH
+    assert "_tpl_v2_" in name
@@ -0,0 +1,35 @@
+# Stdlib imports
+import logging
+
+# Third-party imports
+import pytest
+
+# Internal imports
+from src.db.world_model import WorldModel
+
+
+
+def test_world_model_records_and_filters():
+    """Test if recorded entities can be sampled back by column value"""
+    logging.info("==== test_world_model_records_and_filters =====")
+
+    world = WorldModel()
+    assert not world.has_rows("accounts")
+
+    world["accounts"].extend(id=range(1, 5), role=["guest", "host", "guest", "admin"])
+
+    assert world.has_rows("accounts")
+    assert list(world["accounts"].column("id")) == [1, 2, 3, 4]
+    assert world["accounts"].ids_where("role", "guest") == [1, 3]
+
+    world.reset()
+    assert not world.has_rows("accounts")
+
+
+def test_world_model_rejects_partial_columns():
+    """Test if extend() refuses rows with missing columns"""
+    logging.info("==== test_world_model_rejects_partial_columns =====")
+
+    world = WorldModel()
+    with pytest.raises(ValueError):
+        world["accommodations"].extend(id=[1], price_cents=[5000])